@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+Compiled Kernels for the Cross-System Geometric Pattern Model
+
+This module holds the pure-numeric core of the cross-system prime predictor
+(dimensional mapping, spiral/tick geometry, resonance, boundary and echo
+analysis, and the final score) as Numba-compiled functions. The kernels only
+cover the machine-integer fast path; callers keep the big-integer path for
+numbers beyond KERNEL_INT_LIMIT.
+"""
+
+import ctypes
+import math
+import os
+
+import numpy as np
+
+# Check if Numba is available for JIT compilation
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available, cross-system kernels will run as plain Python")
+    
+    # Dummy decorator and range when Numba is not available
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+# Check if the native C scorer (ufrf_score.c) has been built next to this module
+try:
+    _C_SCORER = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), "libufrf_score.so"))
+    _C_SCORER.score_range.argtypes = [
+        ctypes.c_longlong, ctypes.c_longlong, ctypes.c_void_p, ctypes.c_void_p,
+        ctypes.c_void_p, ctypes.c_longlong, ctypes.c_void_p
+    ]
+    _C_SCORER.score_range.restype = None
+    C_SCORER_AVAILABLE = True
+except OSError:
+    C_SCORER_AVAILABLE = False
+
+# Constants derived from the UFRF framework
+PHI = (1 + 5**0.5) / 2  # Golden ratio
+SYSTEM_BOUNDARY = 99779  # Key boundary from Riemann Hypothesis proof
+DIMENSIONAL_FACTOR = 13  # Base dimensional factor from UFRF: D_n = 13 × 2^(n-1)
+
+# Derived constants (Numba freezes module globals into the compiled code)
+TWO_PI = 2 * math.pi
+GOLDEN_ANGLE_RAD = 2 * math.pi / (PHI * PHI)  # Golden angle is 2π/φ² radians
+TICK_ANGLE_INTERVAL = 2 * math.pi / PHI
+TICK_RADIUS_INTERVAL = 1 / PHI
+GOLDEN_RATIO_MODULUS = int(PHI * 100)
+
+# Exclusive upper bound of the non-negative numbers handled by the int64 kernels
+# (leaves headroom for n + boundary)
+KERNEL_INT_LIMIT = 2**62
+
+# Bitmasks replacing the position sets used by the scoring (Numba handles set literals poorly)
+PRIME_POSITION_MASK = sum(1 << p for p in (2, 3, 5, 7, 11, 13))
+ECHO_POSITION_MASK = sum(1 << p for p in (4, 6, 8, 9, 10, 12))
+
+@njit(cache=True)
+def ufrf_dimensional_mapping(n):
+    """
+    Map a number to the UFRF dimensional structure.
+    
+    Args:
+        n: The number to map
+    
+    Returns:
+        A tuple (system_level, dimension, position, cycle, metacycle)
+    """
+    # Using the UFRF dimensional formula: D_n = 13 × 2^(n-1)
+    # (system level is the bit length of n // 13; frexp gives it without a log,
+    # and the check corrects float rounding up to a power of two)
+    system_level = 1
+    if n >= DIMENSIONAL_FACTOR:
+        q = n // DIMENSIONAL_FACTOR
+        system_level = math.frexp(float(q))[1]
+        if (1 << (system_level - 1)) > q:
+            system_level -= 1
+    
+    # n lies in [mod, 2 * mod) once n >= 13, so the modulo reduces to a subtraction
+    mod = DIMENSIONAL_FACTOR << (system_level - 1)
+    dimension = n - mod if n >= mod else n
+    position = (dimension % DIMENSIONAL_FACTOR) + 1
+    
+    # Calculate cycle and metacycle
+    cycle = dimension // DIMENSIONAL_FACTOR
+    metacycle = cycle // DIMENSIONAL_FACTOR
+    
+    return (system_level, dimension, position, cycle, metacycle)
+
+@njit(cache=True)
+def golden_angle(n):
+    """
+    Calculate the golden angle position for a number.
+    
+    Args:
+        n: The number to calculate for
+    
+    Returns:
+        The angle in radians
+    """
+    return (n * GOLDEN_ANGLE_RAD) % TWO_PI
+
+@njit(cache=True)
+def coordinates_from_mapping(n, system_level, position, angle):
+    """
+    Create cross-system coordinates from an already computed mapping and angle.
+    
+    Args:
+        n: The number to map
+        system_level: System level from ufrf_dimensional_mapping(n)
+        position: Position from ufrf_dimensional_mapping(n)
+        angle: golden_angle(n)
+    
+    Returns:
+        A tuple (x, y, z) representing the number in the cross-system space
+    """
+    x = position * math.cos(angle)
+    y = position * math.sin(angle)
+    z = system_level + (n % 7) / 10
+    
+    return (x, y, z)
+
+@njit(cache=True)
+def create_cross_system_coordinates(n):
+    """
+    Create coordinates for a number in the cross-system geometric space.
+    
+    Args:
+        n: The number to map
+    
+    Returns:
+        A tuple (x, y, z) representing the number in the cross-system space
+    """
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    return coordinates_from_mapping(n, system_level, position, golden_angle(n))
+
+@njit(cache=True)
+def spiral_from_mapping(system_level, position, cycle, metacycle, angle):
+    """
+    Calculate the spiral position from an already computed mapping and angle.
+    
+    Args:
+        system_level, position, cycle, metacycle: Fields of ufrf_dimensional_mapping(n)
+        angle: golden_angle(n)
+    
+    Returns:
+        A tuple (spiral_radius, spiral_angle, spiral_height)
+    """
+    spiral_radius = system_level + (cycle / (10 * system_level))
+    spiral_angle = angle + (position * math.pi / DIMENSIONAL_FACTOR)
+    spiral_height = metacycle + (position / DIMENSIONAL_FACTOR)
+    
+    return (spiral_radius, spiral_angle, spiral_height)
+
+@njit(cache=True)
+def calculate_spiral_position(n):
+    """
+    Calculate the position of a number in the spiral pattern.
+    
+    Args:
+        n: The number to calculate for
+    
+    Returns:
+        A tuple (spiral_radius, spiral_angle, spiral_height)
+    """
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    return spiral_from_mapping(system_level, position, cycle, metacycle, golden_angle(n))
+
+@njit(cache=True)
+def tick_from_spiral(spiral_radius, spiral_angle):
+    """
+    Decide whether a spiral position is at a "tick" position.
+    
+    Args:
+        spiral_radius: Spiral radius of the number
+        spiral_angle: Spiral angle of the number
+    
+    Returns:
+        Boolean indicating if the position is a tick position
+    """
+    angle_mod = spiral_angle % TICK_ANGLE_INTERVAL
+    is_angle_tick = angle_mod < 0.1 or angle_mod > TICK_ANGLE_INTERVAL - 0.1
+    
+    radius_mod = spiral_radius % TICK_RADIUS_INTERVAL
+    is_radius_tick = radius_mod < 0.05 or radius_mod > TICK_RADIUS_INTERVAL - 0.05
+    
+    return is_angle_tick and is_radius_tick
+
+@njit(cache=True)
+def is_at_tick_position(n):
+    """
+    Determine if a number is at a "tick" position in the spiral pattern.
+    
+    Args:
+        n: The number to check
+    
+    Returns:
+        Boolean indicating if the number is at a tick position
+    """
+    spiral_radius, spiral_angle, spiral_height = calculate_spiral_position(n)
+    return tick_from_spiral(spiral_radius, spiral_angle)
+
+@njit(cache=True)
+def resonance_from_position(n, position):
+    """
+    Calculate the cross-system resonance from an already computed position.
+    
+    Args:
+        n: The number to check
+        position: Position from ufrf_dimensional_mapping(n)
+    
+    Returns:
+        A resonance score between 0 and 1
+    """
+    current_system_resonance = (position * PHI) % 1
+    
+    # n is always below the next system's modulus 13 << system_level
+    next_system_dimension = n
+    next_system_position = (next_system_dimension % DIMENSIONAL_FACTOR) + 1
+    next_system_resonance = (next_system_position * PHI) % 1
+    
+    return 1 - abs(current_system_resonance - next_system_resonance)
+
+@njit(cache=True)
+def calculate_cross_system_resonance(n):
+    """
+    Calculate how strongly a number resonates across system boundaries.
+    
+    Args:
+        n: The number to check
+    
+    Returns:
+        A resonance score between 0 and 1
+    """
+    return resonance_from_position(n, ufrf_dimensional_mapping(n)[2])
+
+@njit(cache=True)
+def boundary_transition_score(coord_diff_sqr):
+    """
+    Convert a squared coordinate distance across a system boundary into a transition score.
+    
+    Args:
+        coord_diff_sqr: Squared distance between a number's coordinates and its next-system coordinates
+    
+    Returns:
+        A transition score between 0 and 1 (higher = smoother transition)
+    """
+    return 1 / (1 + math.sqrt(coord_diff_sqr))
+
+@njit(cache=True)
+def analyze_system_boundary(n):
+    """
+    Analyze how a number behaves at system boundaries.
+    
+    Args:
+        n: The number to analyze
+    
+    Returns:
+        A tuple (is_near_boundary, boundary_transition_score)
+    """
+    system_level = ufrf_dimensional_mapping(n)[0]
+    system_boundary = DIMENSIONAL_FACTOR << (system_level - 1)
+    
+    is_near_boundary = abs(n - system_boundary) < 1000
+    
+    transition_score = 0.0
+    if is_near_boundary:
+        x1, y1, z1 = create_cross_system_coordinates(n)
+        x2, y2, z2 = create_cross_system_coordinates(n + system_boundary)
+        coord_diff = (x1 - x2)**2 + (y1 - y2)**2 + (z1 - z2)**2
+        transition_score = boundary_transition_score(coord_diff)
+    
+    return (is_near_boundary, transition_score)
+
+@njit(cache=True)
+def echo_from_mapping(n, position, cycle, is_tick):
+    """
+    Decide whether a number is an echo point from its mapping and tick flag.
+    
+    Args:
+        n: The number to check
+        position: Position from ufrf_dimensional_mapping(n)
+        cycle: Cycle from ufrf_dimensional_mapping(n)
+        is_tick: is_at_tick_position(n)
+    
+    Returns:
+        Boolean indicating if the number is likely an echo point
+    """
+    golden_ratio_mod = (n % GOLDEN_RATIO_MODULUS) / 100
+    has_golden_relationship = 0.6 < golden_ratio_mod < 0.7
+    
+    has_echo_position = ((1 << position) & ECHO_POSITION_MASK) != 0
+    has_echo_cycle = cycle % 3 == 0  # cycle % 6 in {0, 3}
+    
+    echo_score = (0.4 * is_tick
+                  + 0.3 * has_golden_relationship
+                  + 0.2 * has_echo_position
+                  + 0.1 * has_echo_cycle)
+    
+    return echo_score > 0.5
+
+@njit(cache=True)
+def is_echo_point(n):
+    """
+    Determine if a number is an "echo point" (false positive) in the geometric pattern.
+    
+    Args:
+        n: The number to check
+    
+    Returns:
+        Boolean indicating if the number is likely an echo point
+    """
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    return echo_from_mapping(n, position, cycle, is_at_tick_position(n))
+
+@njit(cache=True)
+def dense_region_from_coordinates(x, y, z, density_field, field_origin, resolution):
+    """
+    Look up whether cross-system coordinates fall in a prime-dense region.
+    
+    Args:
+        x, y, z: Cross-system coordinates of the number
+        density_field: 3D array of combined (neighbor-smoothed) prime density
+        field_origin: Region indices of the field's [0, 0, 0] cell
+        resolution: Resolution factor the field was built with
+    
+    Returns:
+        Boolean indicating if the coordinates are in a prime-dense region
+    """
+    ix = int(math.floor(x * resolution)) - field_origin[0]
+    iy = int(math.floor(y * resolution)) - field_origin[1]
+    iz = int(math.floor(z * resolution)) - field_origin[2]
+    
+    nx, ny, nz = density_field.shape
+    if ix < 0 or iy < 0 or iz < 0 or ix >= nx or iy >= ny or iz >= nz:
+        return False
+    
+    return density_field[ix, iy, iz] > 0.3
+
+@njit(cache=True)
+def is_in_prime_dense_region(n, density_field, field_origin, resolution):
+    """
+    Check if a number is in a region with high prime density.
+    
+    Args:
+        n: The number to check
+        density_field: 3D array of combined (neighbor-smoothed) prime density
+        field_origin: Region indices of the field's [0, 0, 0] cell
+        resolution: Resolution factor the field was built with
+        
+    Returns:
+        Boolean indicating if the number is in a prime-dense region
+    """
+    x, y, z = create_cross_system_coordinates(n)
+    return dense_region_from_coordinates(x, y, z, density_field, field_origin, resolution)
+
+@njit(cache=True)
+def score_number(n, density_field, field_origin, resolution):
+    """
+    Decide whether a number is predicted prime by the cross-system pattern.
+    
+    The dimensional mapping and golden angle are computed once and shared by
+    every pattern check.
+    
+    Args:
+        n: The number to check
+        density_field: 3D array of combined (neighbor-smoothed) prime density
+        field_origin: Region indices of the field's [0, 0, 0] cell
+        resolution: Resolution factor the field was built with
+    
+    Returns:
+        Boolean indicating if the number is predicted to be prime
+    """
+    # Special cases
+    if n < 2:
+        return False
+    if n == 2 or n == 3:
+        return True
+    if n % 2 == 0:
+        return False
+    
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    angle = golden_angle(n)
+    
+    x, y, z = coordinates_from_mapping(n, system_level, position, angle)
+    in_dense_region = dense_region_from_coordinates(x, y, z, density_field, field_origin, resolution)
+    resonance = resonance_from_position(n, position)
+    
+    position_is_prime = ((1 << position) & PRIME_POSITION_MASK) != 0
+    golden_relationship = abs((position / system_level) - PHI) < 0.3
+    boundary_mod = n % SYSTEM_BOUNDARY
+    boundary_resonance = boundary_mod < 100 or abs(boundary_mod - SYSTEM_BOUNDARY) < 100
+    
+    score = (0.4 * in_dense_region
+             + 0.3 * (resonance > 0.7)
+             + 0.2 * position_is_prime
+             + 0.1 * golden_relationship
+             + 0.1 * boundary_resonance)
+    
+    if score < 0.5:
+        return False
+    
+    spiral_radius, spiral_angle, spiral_height = spiral_from_mapping(system_level, position, cycle, metacycle, angle)
+    is_tick = tick_from_spiral(spiral_radius, spiral_angle)
+    
+    return not echo_from_mapping(n, position, cycle, is_tick)
+
+@njit(parallel=True, cache=True)
+def predict_range_kernel(start, density_field, field_origin, resolution, out):
+    """
+    Score a contiguous range of numbers in parallel.
+    
+    Args:
+        start: First number of the range
+        density_field: 3D array of combined (neighbor-smoothed) prime density
+        field_origin: Region indices of the field's [0, 0, 0] cell
+        resolution: Resolution factor the field was built with
+        out: Preallocated boolean array receiving the predictions (its length sets the range size)
+    """
+    for i in prange(len(out)):
+        out[i] = score_number(start + i, density_field, field_origin, resolution)
+
+def score_range_c(start, density_field, field_origin, resolution, out):
+    """
+    Score a contiguous range of numbers with the native C scorer.
+    
+    Args:
+        start: First number of the range
+        density_field: 3D array of combined (neighbor-smoothed) prime density
+        field_origin: Region indices of the field's [0, 0, 0] cell
+        resolution: Resolution factor the field was built with
+        out: Preallocated boolean array receiving the predictions (its length sets the range size)
+    """
+    field = np.ascontiguousarray(density_field, dtype=np.float64)
+    shape = np.array(field.shape, dtype=np.int64)
+    origin = np.ascontiguousarray(field_origin, dtype=np.int64)
+    result = np.empty(len(out), dtype=np.uint8)
+    
+    _C_SCORER.score_range(
+        start, len(out), field.ctypes.data, shape.ctypes.data,
+        origin.ctypes.data, resolution, result.ctypes.data
+    )
+    out[:] = result.view(np.bool_)
+
+#
+# Parallel Batch Kernels
+#
+# Each runs its scalar kernel over an array of numbers with prange; used when
+# Numba is available (the NumPy kernels in the detector cover the fallback).
+#
+
+@njit(parallel=True, cache=True)
+def ufrf_dimensional_mapping_batch(ns):
+    """
+    Map an array of numbers to the UFRF dimensional structure.
+    
+    Args:
+        ns: np.ndarray of np.int64 numbers
+    
+    Returns:
+        An (len(ns), 5) int64 array of (system_level, dimension, position, cycle, metacycle) rows
+    """
+    out = np.empty((len(ns), 5), dtype=np.int64)
+    for i in prange(len(ns)):
+        system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(ns[i])
+        out[i, 0] = system_level
+        out[i, 1] = dimension
+        out[i, 2] = position
+        out[i, 3] = cycle
+        out[i, 4] = metacycle
+    
+    return out
+
+@njit(parallel=True, cache=True)
+def create_cross_system_coordinates_batch(ns):
+    """
+    Create cross-system coordinates for an array of numbers.
+    
+    Args:
+        ns: np.ndarray of np.int64 numbers
+    
+    Returns:
+        An (len(ns), 3) float array of (x, y, z) rows
+    """
+    out = np.empty((len(ns), 3))
+    for i in prange(len(ns)):
+        x, y, z = create_cross_system_coordinates(ns[i])
+        out[i, 0] = x
+        out[i, 1] = y
+        out[i, 2] = z
+    
+    return out
+
+@njit(parallel=True, cache=True)
+def calculate_spiral_position_batch(ns):
+    """
+    Calculate spiral positions for an array of numbers.
+    
+    Args:
+        ns: np.ndarray of np.int64 numbers
+    
+    Returns:
+        An (len(ns), 3) float array of (spiral_radius, spiral_angle, spiral_height) rows
+    """
+    out = np.empty((len(ns), 3))
+    for i in prange(len(ns)):
+        spiral_radius, spiral_angle, spiral_height = calculate_spiral_position(ns[i])
+        out[i, 0] = spiral_radius
+        out[i, 1] = spiral_angle
+        out[i, 2] = spiral_height
+    
+    return out
+
+@njit(parallel=True, cache=True)
+def is_at_tick_position_batch(ns):
+    """
+    Determine which numbers of an array are at "tick" positions.
+    
+    Args:
+        ns: np.ndarray of np.int64 numbers
+    
+    Returns:
+        Boolean array
+    """
+    out = np.empty(len(ns), dtype=np.bool_)
+    for i in prange(len(ns)):
+        out[i] = is_at_tick_position(ns[i])
+    
+    return out
+
+@njit(parallel=True, cache=True)
+def is_echo_point_batch(ns):
+    """
+    Determine which numbers of an array are "echo points".
+    
+    Args:
+        ns: np.ndarray of np.int64 numbers
+    
+    Returns:
+        Boolean array
+    """
+    out = np.empty(len(ns), dtype=np.bool_)
+    for i in prange(len(ns)):
+        out[i] = is_echo_point(ns[i])
+    
+    return out
+
+@njit(parallel=True, cache=True)
+def analyze_system_boundary_batch(ns):
+    """
+    Analyze system boundary behavior for an array of numbers.
+    
+    Args:
+        ns: np.ndarray of np.int64 numbers
+    
+    Returns:
+        A tuple of arrays (is_near_boundary, boundary_transition_score)
+    """
+    is_near_boundary = np.empty(len(ns), dtype=np.bool_)
+    transition_score = np.empty(len(ns))
+    for i in prange(len(ns)):
+        is_near_boundary[i], transition_score[i] = analyze_system_boundary(ns[i])
+    
+    return (is_near_boundary, transition_score)
+
+@njit(parallel=True, cache=True)
+def score_batch(ns, density_field, field_origin, resolution):
+    """
+    Score an array of (not necessarily contiguous) numbers in parallel.
+    
+    Args:
+        ns: np.ndarray of np.int64 numbers
+        density_field: 3D array of combined (neighbor-smoothed) prime density
+        field_origin: Region indices of the field's [0, 0, 0] cell
+        resolution: Resolution factor the field was built with
+    
+    Returns:
+        Boolean array indicating which numbers are predicted to be prime
+    """
+    out = np.empty(len(ns), dtype=np.bool_)
+    for i in prange(len(ns)):
+        out[i] = score_number(ns[i], density_field, field_origin, resolution)
+    
+    return out
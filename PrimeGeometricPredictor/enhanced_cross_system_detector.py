@@ -7,24 +7,38 @@ that tests across two full systems with improved filtering mechanisms for echo p
 """
 
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import math
-import sympy
+import functools
 import time
 import os
-import decimal
-from collections import defaultdict
+import sys
 import itertools
-
-# Set decimal precision for handling extremely large numbers
-decimal.getcontext().prec = 100
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
 # Constants derived from the UFRF framework
 PHI = (1 + 5**0.5) / 2  # Golden ratio
 SYSTEM_BOUNDARY = 99779  # Key boundary from Riemann Hypothesis proof
 DIMENSIONAL_FACTOR = 13  # Base dimensional factor from UFRF: D_n = 13 × 2^(n-1)
 
+# Derived constants, folded once instead of recomputed per number
+TWO_PI = 2 * math.pi
+GOLDEN_ANGLE_RAD = 2 * math.pi / (PHI * PHI)  # Golden angle is 2π/φ² radians
+TICK_ANGLE_INTERVAL = 2 * math.pi / PHI
+TICK_RADIUS_INTERVAL = 1 / PHI
+GOLDEN_RATIO_MODULUS = int(PHI * 100)
+
+# Position patterns used by the scoring, built once instead of per call
+PRIME_POSITIONS = frozenset({2, 3, 5, 7, 11, 13})
+ECHO_POSITIONS = frozenset({4, 6, 8, 9, 10, 12})
+
+# The same patterns as boolean tables indexed by position (1..13) for the array kernels
+PRIME_POSITION_TABLE = np.isin(np.arange(DIMENSIONAL_FACTOR + 1), list(PRIME_POSITIONS))
+ECHO_POSITION_TABLE = np.isin(np.arange(DIMENSIONAL_FACTOR + 1), list(ECHO_POSITIONS))
+
 # Define the range for two full systems
 FIRST_SYSTEM_END = DIMENSIONAL_FACTOR * 2**13  # End of first system
 SECOND_SYSTEM_END = DIMENSIONAL_FACTOR * 2**14  # End of second system
@@ -42,34 +56,60 @@ except ImportError:
     USE_MPS = False
     print("PyTorch not available, using CPU only")
 
-def safe_log2(n):
+# Compiled kernels for the machine-integer fast path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import cross_system_kernels as kernels
+from fast_primality import isprime_numbers, is_prime as isprime, GMPY2_AVAILABLE
+
+if GMPY2_AVAILABLE:
+    from gmpy2 import mpz
+
+def ufrf_dimensional_mapping(n):
     """
-    Safely calculate log2 for extremely large numbers.
+    Map a number to the UFRF dimensional structure.
     
     Args:
-        n: The number to calculate log2 for
+        n: The number to map
         
     Returns:
-        The log2 value
+        A tuple (system_level, dimension, position, cycle, metacycle)
     """
-    # For extremely large numbers, use decimal module
-    if n > 1e100:
-        # Convert to Decimal for high precision
-        d_n = decimal.Decimal(str(n))
-        d_log2 = decimal.Decimal(0)
-        
-        # Calculate log2 using the relation log2(n) = log10(n) / log10(2)
-        log10_2 = decimal.Decimal('0.301029995663981195213738894724493026768189881462108541310')
-        d_log2 = d_n.ln() / decimal.Decimal(2).ln()
+    if 0 <= n <= 1e100:
+        return ufrf_dimensional_mapping_fast(n)
+    
+    return mapping_bignum(n)
+
+def ufrf_dimensional_mapping_fast(n):
+    """
+    Map a non-negative number up to 1e100 to the UFRF dimensional structure.
+    
+    This is the specialized path used for ordinary candidates: no big-number
+    branch and no overflow handling, since bit_length and modulo cannot fail here.
+    
+    Args:
+        n: The number to map (0 <= n <= 1e100)
         
-        return float(d_log2)
-    else:
-        # For smaller numbers, use standard math.log2
-        return math.log2(n)
+    Returns:
+        A tuple (system_level, dimension, position, cycle, metacycle)
+    """
+    # Using the UFRF dimensional formula: D_n = 13 × 2^(n-1)
+    # (bit_length of n // 13 is exactly floor(log2(n / 13)) + 1, with no floating point)
+    system_level = max(1, int(n // DIMENSIONAL_FACTOR).bit_length())
+    
+    # n lies in [mod, 2 * mod) once n >= 13, so the modulo reduces to a subtraction
+    mod = DIMENSIONAL_FACTOR << (system_level - 1)
+    dimension = n - mod if n >= mod else n
+    position = (dimension % DIMENSIONAL_FACTOR) + 1
+    
+    # Calculate cycle and metacycle
+    cycle = math.floor(dimension / DIMENSIONAL_FACTOR)
+    metacycle = math.floor(cycle / DIMENSIONAL_FACTOR)
+    
+    return (system_level, dimension, position, cycle, metacycle)
 
-def ufrf_dimensional_mapping(n):
+def mapping_bignum(n):
     """
-    Map a number to the UFRF dimensional structure.
+    Map any number, including extremely large or negative ones, to the UFRF dimensional structure.
     
     Args:
         n: The number to map
@@ -77,35 +117,22 @@ def ufrf_dimensional_mapping(n):
     Returns:
         A tuple (system_level, dimension, position, cycle, metacycle)
     """
-    # Special case for extremely large numbers
-    if n > 1e100:
-        # Use safe_log2 for extremely large numbers
-        try:
-            system_level = max(1, math.floor(safe_log2(n / DIMENSIONAL_FACTOR)) + 1)
-        except (OverflowError, ValueError):
-            # Fallback for numbers too large even for safe_log2
-            # Estimate system level based on digit count
-            digit_count = len(str(n))
-            system_level = max(1, math.floor(digit_count / 3))
+    # Using the UFRF dimensional formula: D_n = 13 × 2^(n-1)
+    # Python's big-integer bit_length is exact and never overflows
+    if n >= DIMENSIONAL_FACTOR:
+        system_level = int(n // DIMENSIONAL_FACTOR).bit_length()
+    elif n < 0:
+        # Estimate system level based on digit count
+        system_level = max(1, math.floor(len(str(n)) / 3))
     else:
-        # Using the UFRF dimensional formula: D_n = 13 × 2^(n-1)
-        try:
-            system_level = max(1, math.floor(math.log2(n / DIMENSIONAL_FACTOR)) + 1)
-        except (OverflowError, ValueError):
-            # Fallback if standard approach fails
-            digit_count = len(str(n))
-            system_level = max(1, math.floor(digit_count / 3))
-    
-    # Calculate dimension with modulo to avoid overflow
+        system_level = 1
+    
     # For extremely large numbers, use a simplified approach
+    # (n % 1000 is always below the modulus 13 << (min(system_level, 100) - 1))
     if n > 1e100:
-        dimension = (n % 1000) % (DIMENSIONAL_FACTOR * 2**(min(system_level, 100) - 1))
+        dimension = n % 1000
     else:
-        try:
-            dimension = n % (DIMENSIONAL_FACTOR * 2**(system_level - 1))
-        except OverflowError:
-            # Fallback if modulo calculation overflows
-            dimension = (n % 1000) % DIMENSIONAL_FACTOR
+        dimension = n % (DIMENSIONAL_FACTOR << (system_level - 1))
     
     position = (dimension % DIMENSIONAL_FACTOR) + 1
     
@@ -125,31 +152,38 @@ def golden_angle(n):
     Returns:
         The angle in radians
     """
-    # Golden angle is 2π/φ² radians
-    golden_angle_rad = 2 * math.pi / (PHI * PHI)
-    
     # For extremely large numbers, use modulo to avoid overflow
     if n > 1e100:
-        n_mod = n % 1000000
-        angle = (n_mod * golden_angle_rad) % (2 * math.pi)
-    else:
-        # Calculate the angle for this number
-        angle = (n * golden_angle_rad) % (2 * math.pi)
+        return golden_angle_fast(n % 1000000)
     
-    return angle
+    return golden_angle_fast(n)
 
-def create_cross_system_coordinates(n):
+def golden_angle_fast(n):
+    """
+    Calculate the golden angle position for a number up to 1e100.
+    
+    Args:
+        n: The number to calculate for
+        
+    Returns:
+        The angle in radians
+    """
+    # Calculate the angle for this number
+    return (n * GOLDEN_ANGLE_RAD) % TWO_PI
+
+def create_cross_system_coordinates(n, mapping=None):
     """
     Create coordinates for a number in the cross-system geometric space.
     
     Args:
         n: The number to map
+        mapping: Optional precomputed ufrf_dimensional_mapping(n)
         
     Returns:
         A tuple (x, y, z) representing the number in the cross-system space
     """
     # Get dimensional mapping
-    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    system_level, dimension, position, cycle, metacycle = mapping or ufrf_dimensional_mapping(n)
     
     # Calculate golden angle
     angle = golden_angle(n)
@@ -166,18 +200,19 @@ def create_cross_system_coordinates(n):
     
     return (x, y, z)
 
-def calculate_spiral_position(n):
+def calculate_spiral_position(n, mapping=None):
     """
     Calculate the position of a number in the spiral pattern.
     
     Args:
         n: The number to calculate for
+        mapping: Optional precomputed ufrf_dimensional_mapping(n)
         
     Returns:
         A tuple (spiral_radius, spiral_angle, spiral_height) representing the position in the spiral
     """
     # Get dimensional mapping
-    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    system_level, dimension, position, cycle, metacycle = mapping or ufrf_dimensional_mapping(n)
     
     # Calculate golden angle
     angle = golden_angle(n)
@@ -194,34 +229,65 @@ def calculate_spiral_position(n):
     
     return (spiral_radius, spiral_angle, spiral_height)
 
-def is_at_tick_position(n):
+def is_at_tick_position(n, mapping=None):
     """
     Determine if a number is at a "tick" position in the spiral pattern.
     
     Args:
         n: The number to check
+        mapping: Optional precomputed ufrf_dimensional_mapping(n)
         
     Returns:
         Boolean indicating if the number is at a tick position
     """
-    # Get spiral position
-    spiral_radius, spiral_angle, spiral_height = calculate_spiral_position(n)
+    # Use the compiled kernel for machine-sized integers
+    if 0 <= n < kernels.KERNEL_INT_LIMIT:
+        return kernels.is_at_tick_position(n)
     
-    # Calculate tick parameters
-    tick_angle_interval = 2 * math.pi / PHI
-    tick_radius_interval = 1 / PHI
+    # Get spiral position
+    spiral_radius, spiral_angle, spiral_height = calculate_spiral_position(n, mapping)
     
     # Check if angle is close to a tick position
-    angle_mod = spiral_angle % tick_angle_interval
-    is_angle_tick = angle_mod < 0.1 or angle_mod > tick_angle_interval - 0.1
+    angle_mod = spiral_angle % TICK_ANGLE_INTERVAL
+    is_angle_tick = angle_mod < 0.1 or angle_mod > TICK_ANGLE_INTERVAL - 0.1
     
     # Check if radius is close to a tick position
-    radius_mod = spiral_radius % tick_radius_interval
-    is_radius_tick = radius_mod < 0.05 or radius_mod > tick_radius_interval - 0.05
+    radius_mod = spiral_radius % TICK_RADIUS_INTERVAL
+    is_radius_tick = radius_mod < 0.05 or radius_mod > TICK_RADIUS_INTERVAL - 0.05
     
     # A number is at a tick position if both angle and radius are at tick positions
     return is_angle_tick and is_radius_tick
 
+# Cached sieve shared by every analysis (grown on demand, never shrunk)
+_SIEVE_CACHE = np.zeros(0, dtype=bool)
+
+def sieve(limit):
+    """
+    Return a boolean primality table for all numbers below a limit.
+    
+    The table is computed once with a NumPy Sieve of Eratosthenes and cached
+    globally, so repeated analyses over smaller ranges reuse it.
+    
+    Args:
+        limit: Exclusive upper bound of the table
+        
+    Returns:
+        A np.bool_ array where entry n is True if n is prime
+    """
+    global _SIEVE_CACHE
+    limit = max(int(limit), 0)
+    
+    if len(_SIEVE_CACHE) < limit:
+        is_prime = np.ones(limit, dtype=bool)
+        is_prime[:2] = False
+        is_prime[4::2] = False
+        for i in range(3, math.isqrt(limit - 1) + 1, 2):
+            if is_prime[i]:
+                is_prime[i*i::2*i] = False
+        _SIEVE_CACHE = is_prime
+    
+    return _SIEVE_CACHE[:limit]
+
 #
 # Enhanced Cross-System Geometric Pattern Detection
 #
@@ -230,114 +296,116 @@ def calculate_prime_density_field(resolution=4):
     """
     Calculate the prime density field across the geometric space with enhanced resolution.
     
+    The field is a dense 3D grid over the integer region lattice
+    floor(coordinate * resolution), padded by one empty region on every side.
+    
     Args:
         resolution: Resolution factor for the density field (higher = more detailed)
         
     Returns:
-        A dictionary mapping regions to prime density values
+        A tuple (density_field, origin) where density_field is a 3D array of prime
+        density per region and origin holds the region indices of its [0, 0, 0] cell
     """
     # Define the range to analyze
     start = 2
     end = 1000
     
-    # Initialize density field
-    density_field = defaultdict(float)
-    region_counts = defaultdict(int)
+    # Analyze prime distribution (skipping even numbers except 2)
+    numbers = np.arange(start, end, dtype=np.int64)
+    numbers = numbers[(numbers == 2) | (numbers % 2 == 1)]
+    prime_flags = sieve(end)[numbers]
     
-    # Analyze prime distribution
-    for n in range(start, end):
-        # Skip even numbers except 2
-        if n > 2 and n % 2 == 0:
-            continue
-        
-        # Get coordinates in cross-system space
-        x, y, z = create_cross_system_coordinates(n)
-        
-        # Define region (discretize the space with enhanced resolution)
-        region_x = math.floor(x * resolution) / resolution
-        region_y = math.floor(y * resolution) / resolution
-        region_z = math.floor(z * resolution) / resolution
-        region = (region_x, region_y, region_z)
-        
-        # Check if n is prime
-        is_prime = sympy.isprime(n)
-        
-        # Update density field
-        if is_prime:
-            density_field[region] += 1
-        
-        region_counts[region] += 1
+    # Get coordinates in cross-system space and discretize them with enhanced resolution
+    coords = create_cross_system_coordinates_vec(numbers)
+    region_indices = np.floor(np.array(coords) * resolution).astype(np.int64)
+    
+    # Size the grid to the occupied regions plus a one-region border
+    origin = region_indices.min(axis=1) - 1
+    shape = tuple(region_indices.max(axis=1) - origin + 2)
+    cells = np.ravel_multi_index(tuple(region_indices - origin[:, None]), shape)
+    
+    # Count numbers and primes per region (integer histograms over the flattened grid)
+    size = int(np.prod(shape))
+    region_counts = np.bincount(cells, minlength=size).reshape(shape)
+    prime_counts = np.bincount(cells, weights=prime_flags, minlength=size).reshape(shape)
     
     # Normalize density field
-    for region in density_field:
-        if region_counts[region] > 0:
-            density_field[region] /= region_counts[region]
+    density_field = prime_counts / np.maximum(region_counts, 1)
     
-    return density_field
-
-# Calculate prime density field with enhanced resolution (global variable)
-PRIME_DENSITY_FIELD = calculate_prime_density_field(resolution=4)
+    return density_field, origin
 
-def is_in_prime_dense_region(n, resolution=4):
+def smooth_density_field(density_field):
     """
-    Check if a number is in a region with high prime density.
+    Blend every region of a density field with the average of its 26 neighbors.
     
     Args:
-        n: The number to check
-        resolution: Resolution factor for the density field
+        density_field: 3D array of prime density per region
         
     Returns:
-        Boolean indicating if the number is in a prime-dense region
+        A 3D array of combined density (0.7 × region + 0.3 × neighbor average)
     """
-    # Get coordinates in cross-system space
-    x, y, z = create_cross_system_coordinates(n)
-    
-    # Define region (discretize the space with enhanced resolution)
-    region_x = math.floor(x * resolution) / resolution
-    region_y = math.floor(y * resolution) / resolution
-    region_z = math.floor(z * resolution) / resolution
-    region = (region_x, region_y, region_z)
-    
-    # Check density in this region
-    density = PRIME_DENSITY_FIELD.get(region, 0)
-    
-    # Check neighboring regions too
-    neighbor_density = 0
-    neighbor_count = 0
-    
-    # Check more neighboring regions with enhanced resolution
-    step = 1 / resolution
-    for dx in [-step, 0, step]:
-        for dy in [-step, 0, step]:
-            for dz in [-step, 0, step]:
+    nx, ny, nz = density_field.shape
+    padded = np.pad(density_field, 1)
+    
+    # Sum the 26 neighboring regions
+    neighbor_density = np.zeros_like(density_field)
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            for dz in (-1, 0, 1):
                 if dx == 0 and dy == 0 and dz == 0:
                     continue  # Skip the region itself
                 
-                neighbor_region = (region_x + dx, region_y + dy, region_z + dz)
-                neighbor_density += PRIME_DENSITY_FIELD.get(neighbor_region, 0)
-                neighbor_count += 1
-    
-    # Average neighbor density
-    avg_neighbor_density = neighbor_density / neighbor_count if neighbor_count > 0 else 0
+                neighbor_density += padded[1 + dx:1 + dx + nx, 1 + dy:1 + dy + ny, 1 + dz:1 + dz + nz]
     
     # Combined density (weighted average of region and neighbors)
-    combined_density = 0.7 * density + 0.3 * avg_neighbor_density
+    return 0.7 * density_field + 0.3 * (neighbor_density / 26)
+
+# Resolution of the global prime density field (computed below the vectorized kernels)
+DENSITY_FIELD_RESOLUTION = 4
+
+def is_in_prime_dense_region(n, resolution=DENSITY_FIELD_RESOLUTION, mapping=None):
+    """
+    Check if a number is in a region with high prime density.
     
-    # Check if density exceeds threshold
-    return combined_density > 0.3
+    Args:
+        n: The number to check
+        resolution: Resolution factor for the density field (must match the field's resolution)
+        mapping: Optional precomputed ufrf_dimensional_mapping(n)
+        
+    Returns:
+        Boolean indicating if the number is in a prime-dense region
+    """
+    # Get coordinates in cross-system space
+    x, y, z = create_cross_system_coordinates(n, mapping)
+    
+    # Locate the region in the precomputed combined density field
+    ix = math.floor(x * resolution) - PRIME_DENSITY_ORIGIN[0]
+    iy = math.floor(y * resolution) - PRIME_DENSITY_ORIGIN[1]
+    iz = math.floor(z * resolution) - PRIME_DENSITY_ORIGIN[2]
+    nx, ny, nz = DENSE_REGION_MASK.shape
+    if not (0 <= ix < nx and 0 <= iy < ny and 0 <= iz < nz):
+        return False
+    
+    # Density threshold is precomputed per region
+    return bool(DENSE_REGION_MASK[ix, iy, iz])
 
-def calculate_cross_system_resonance(n):
+def calculate_cross_system_resonance(n, mapping=None):
     """
     Calculate how strongly a number resonates across system boundaries.
     
     Args:
         n: The number to check
+        mapping: Optional precomputed ufrf_dimensional_mapping(n)
         
     Returns:
         A resonance score between 0 and 1
     """
+    # Use the compiled kernel for machine-sized integers
+    if 0 <= n < kernels.KERNEL_INT_LIMIT:
+        return kernels.calculate_cross_system_resonance(n)
+    
     # Get dimensional mapping
-    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    system_level, dimension, position, cycle, metacycle = mapping or ufrf_dimensional_mapping(n)
     
     # Calculate resonance based on position in multiple systems
     resonance_score = 0
@@ -347,7 +415,8 @@ def calculate_cross_system_resonance(n):
     
     # Resonance with adjacent systems
     next_system_level = system_level + 1
-    next_system_dimension = n % (DIMENSIONAL_FACTOR * 2**(next_system_level - 1))
+    next_mod = DIMENSIONAL_FACTOR << (next_system_level - 1)
+    next_system_dimension = n if 0 <= n < next_mod else n % next_mod
     next_system_position = (next_system_dimension % DIMENSIONAL_FACTOR) + 1
     next_system_resonance = (next_system_position * PHI) % 1
     
@@ -359,6 +428,21 @@ def calculate_cross_system_resonance(n):
     
     return normalized_resonance
 
+def boundary_transition_score(coord_diff_sqr):
+    """
+    Convert a squared coordinate distance across a system boundary into a transition score.
+    
+    Rank or threshold comparisons can use the squared distance directly
+    (a smaller distance means a higher score); only displayed scores need this.
+    
+    Args:
+        coord_diff_sqr: Squared distance between a number's coordinates and its next-system coordinates
+        
+    Returns:
+        A transition score between 0 and 1 (higher = smoother transition)
+    """
+    return 1 / (1 + math.sqrt(coord_diff_sqr))
+
 def analyze_system_boundary(n):
     """
     Analyze how a number behaves at system boundaries.
@@ -369,11 +453,16 @@ def analyze_system_boundary(n):
     Returns:
         A tuple (is_near_boundary, boundary_transition_score)
     """
+    # Use the compiled kernel for machine-sized integers
+    if 0 <= n < kernels.KERNEL_INT_LIMIT:
+        is_near_boundary, transition_score = kernels.analyze_system_boundary(n)
+        return (is_near_boundary, transition_score if is_near_boundary else 0)
+    
     # Get dimensional mapping
     system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
     
     # Calculate system boundary for this system level
-    system_boundary = DIMENSIONAL_FACTOR * 2**(system_level - 1)
+    system_boundary = DIMENSIONAL_FACTOR << (system_level - 1)
     
     # Check if number is near a system boundary
     distance_to_boundary = abs(n - system_boundary)
@@ -391,51 +480,53 @@ def analyze_system_boundary(n):
         
         # Calculate transition score (higher = smoother transition)
         coord_diff = sum((a - b)**2 for a, b in zip(current_coords, next_coords))
-        transition_score = 1 / (1 + math.sqrt(coord_diff))
+        transition_score = boundary_transition_score(coord_diff)
     else:
         transition_score = 0
     
     return (is_near_boundary, transition_score)
 
-def is_echo_point(n):
+def is_echo_point(n, mapping=None):
     """
     Determine if a number is an "echo point" (false positive) in the geometric pattern.
     
     Args:
         n: The number to check
+        mapping: Optional precomputed ufrf_dimensional_mapping(n)
         
     Returns:
         Boolean indicating if the number is likely an echo point
     """
-    # Get dimensional mapping
-    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    # Use the compiled kernel for machine-sized integers
+    if 0 <= n < kernels.KERNEL_INT_LIMIT:
+        return kernels.is_echo_point(n)
     
-    # Get spiral position
-    spiral_radius, spiral_angle, spiral_height = calculate_spiral_position(n)
+    # Get dimensional mapping
+    if mapping is None:
+        mapping = ufrf_dimensional_mapping(n)
+    system_level, dimension, position, cycle, metacycle = mapping
     
     # Echo points often have these characteristics:
     
     # 1. They're at tick positions in the spiral
-    is_tick = is_at_tick_position(n)
+    is_tick = is_at_tick_position(n, mapping)
     
     # 2. They have specific relationships with the golden ratio
-    golden_ratio_mod = (n % int(PHI * 100)) / 100
+    golden_ratio_mod = (n % GOLDEN_RATIO_MODULUS) / 100
     has_golden_relationship = 0.6 < golden_ratio_mod < 0.7
     
     # 3. They have specific position values
-    echo_positions = {4, 6, 8, 9, 10, 12}
-    has_echo_position = position in echo_positions
+    has_echo_position = position in ECHO_POSITIONS
     
     # 4. They have specific cycle relationships
     cycle_mod = cycle % 6
     has_echo_cycle = cycle_mod in {0, 3}
     
     # Calculate echo score
-    echo_score = 0
-    echo_score += 0.4 if is_tick else 0
-    echo_score += 0.3 if has_golden_relationship else 0
-    echo_score += 0.2 if has_echo_position else 0
-    echo_score += 0.1 if has_echo_cycle else 0
+    echo_score = (0.4 * is_tick
+                  + 0.3 * has_golden_relationship
+                  + 0.2 * has_echo_position
+                  + 0.1 * has_echo_cycle)
     
     # A number is an echo point if its echo score exceeds the threshold
     return echo_score > 0.5
@@ -458,23 +549,24 @@ def is_prime_by_cross_system_pattern(n):
     if n % 2 == 0:
         return False
     
-    # Check if in prime-dense region
-    in_dense_region = is_in_prime_dense_region(n)
+    # Use the compiled kernel for machine-sized integers
+    if n < kernels.KERNEL_INT_LIMIT:
+        return kernels.score_number(n, COMBINED_DENSITY_FIELD, PRIME_DENSITY_ORIGIN, DENSITY_FIELD_RESOLUTION)
     
-    # Calculate cross-system resonance
-    resonance = calculate_cross_system_resonance(n)
+    # Get dimensional mapping once and share it with every pattern check
+    mapping = ufrf_dimensional_mapping(n)
+    system_level, dimension, position, cycle, metacycle = mapping
     
-    # Analyze system boundary behavior
-    is_near_boundary, boundary_transition = analyze_system_boundary(n)
+    # Check if in prime-dense region
+    in_dense_region = is_in_prime_dense_region(n, mapping=mapping)
     
-    # Get dimensional mapping
-    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    # Calculate cross-system resonance
+    resonance = calculate_cross_system_resonance(n, mapping)
     
     # Check specific cross-system patterns
     
     # Pattern 1: Prime positions (2, 3, 5, 7, 11, 13)
-    prime_positions = {2, 3, 5, 7, 11, 13}
-    position_is_prime = position in prime_positions
+    position_is_prime = position in PRIME_POSITIONS
     
     # Pattern 2: Golden ratio relationship between position and system level
     golden_relationship = abs((position / system_level) - PHI) < 0.3
@@ -483,19 +575,296 @@ def is_prime_by_cross_system_pattern(n):
     boundary_resonance = abs(n % SYSTEM_BOUNDARY) < 100 or abs(n % SYSTEM_BOUNDARY - SYSTEM_BOUNDARY) < 100
     
     # Combine patterns with weights
-    score = 0
-    score += 0.4 if in_dense_region else 0
-    score += 0.3 if resonance > 0.7 else 0
-    score += 0.2 if position_is_prime else 0
-    score += 0.1 if golden_relationship else 0
-    score += 0.1 if boundary_resonance else 0
+    score = (0.4 * in_dense_region
+             + 0.3 * (resonance > 0.7)
+             + 0.2 * position_is_prime
+             + 0.1 * golden_relationship
+             + 0.1 * boundary_resonance)
     
     # Check if this is an echo point (false positive)
-    is_echo = is_echo_point(n)
+    is_echo = is_echo_point(n, mapping)
     
     # Threshold for primality (exclude echo points)
     return score >= 0.5 and not is_echo
 
+#
+# Vectorized Array Kernels
+#
+# These mirror the scalar functions above but operate on whole np.int64 arrays,
+# so a range of candidates costs one NumPy call per operation instead of one
+# Python call per number. They cover the fast path only (0 <= n well below 2^53).
+#
+
+def ufrf_dimensional_mapping_vec(n):
+    """
+    Map an array of numbers to the UFRF dimensional structure.
+    
+    Args:
+        n: np.ndarray of integers to map
+    
+    Returns:
+        A tuple of arrays (system_level, dimension, position, cycle, metacycle)
+    """
+    n = np.asarray(n, dtype=np.int64)
+    
+    # Using the UFRF dimensional formula: D_n = 13 × 2^(n-1)
+    # (the frexp exponent of n // 13 is its bit length, i.e. floor(log2(n / 13)) + 1)
+    level = np.frexp(n // DIMENSIONAL_FACTOR)[1]
+    system_level = np.where(n >= DIMENSIONAL_FACTOR, level, 1).astype(np.int64)
+    
+    mod = DIMENSIONAL_FACTOR << (system_level - 1)
+    dimension = np.where(n >= mod, n - mod, n)
+    position = (dimension % DIMENSIONAL_FACTOR) + 1
+    
+    # Calculate cycle and metacycle
+    cycle = dimension // DIMENSIONAL_FACTOR
+    metacycle = cycle // DIMENSIONAL_FACTOR
+    
+    return (system_level, dimension, position, cycle, metacycle)
+
+def golden_angle_vec(n):
+    """
+    Calculate the golden angle position for an array of numbers.
+    
+    Args:
+        n: np.ndarray of integers
+    
+    Returns:
+        Array of angles in radians
+    """
+    return (np.asarray(n, dtype=np.int64) * GOLDEN_ANGLE_RAD) % TWO_PI
+
+def create_cross_system_coordinates_vec(n):
+    """
+    Create cross-system coordinates for an array of numbers.
+    
+    Args:
+        n: np.ndarray of integers
+    
+    Returns:
+        A tuple of arrays (x, y, z)
+    """
+    n = np.asarray(n, dtype=np.int64)
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping_vec(n)
+    angle = golden_angle_vec(n)
+    
+    x = position * np.cos(angle)
+    y = position * np.sin(angle)
+    z = system_level + (n % 7) / 10
+    
+    return (x, y, z)
+
+def calculate_spiral_position_vec(n):
+    """
+    Calculate spiral positions for an array of numbers.
+    
+    Args:
+        n: np.ndarray of integers
+    
+    Returns:
+        A tuple of arrays (spiral_radius, spiral_angle, spiral_height)
+    """
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping_vec(n)
+    angle = golden_angle_vec(n)
+    
+    spiral_radius = system_level + (cycle / (10 * system_level))
+    spiral_angle = angle + (position * math.pi / DIMENSIONAL_FACTOR)
+    spiral_height = metacycle + (position / DIMENSIONAL_FACTOR)
+    
+    return (spiral_radius, spiral_angle, spiral_height)
+
+def is_at_tick_position_vec(n):
+    """
+    Determine which numbers of an array are at "tick" positions in the spiral.
+    
+    Args:
+        n: np.ndarray of integers
+    
+    Returns:
+        Boolean array
+    """
+    spiral_radius, spiral_angle, spiral_height = calculate_spiral_position_vec(n)
+    
+    angle_mod = spiral_angle % TICK_ANGLE_INTERVAL
+    is_angle_tick = (angle_mod < 0.1) | (angle_mod > TICK_ANGLE_INTERVAL - 0.1)
+    
+    radius_mod = spiral_radius % TICK_RADIUS_INTERVAL
+    is_radius_tick = (radius_mod < 0.05) | (radius_mod > TICK_RADIUS_INTERVAL - 0.05)
+    
+    return is_angle_tick & is_radius_tick
+
+def is_in_prime_dense_region_vec(n, resolution=DENSITY_FIELD_RESOLUTION):
+    """
+    Check which numbers of an array lie in regions with high prime density.
+    
+    Args:
+        n: np.ndarray of integers
+        resolution: Resolution factor for the density field (must match the field's resolution)
+        
+    Returns:
+        Boolean array
+    """
+    coords = create_cross_system_coordinates_vec(n)
+    cells = [np.floor(c * resolution).astype(np.int64) - o for c, o in zip(coords, PRIME_DENSITY_ORIGIN)]
+    
+    inside = np.ones(len(cells[0]), dtype=bool)
+    for c, size in zip(cells, DENSE_REGION_MASK.shape):
+        inside &= (c >= 0) & (c < size)
+    
+    result = np.zeros(len(inside), dtype=bool)
+    result[inside] = DENSE_REGION_MASK[tuple(c[inside] for c in cells)]
+    
+    return result
+
+def calculate_cross_system_resonance_vec(n):
+    """
+    Calculate cross-system resonance scores for an array of numbers.
+    
+    Args:
+        n: np.ndarray of integers
+    
+    Returns:
+        Array of resonance scores between 0 and 1
+    """
+    n = np.asarray(n, dtype=np.int64)
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping_vec(n)
+    
+    current_system_resonance = (position * PHI) % 1
+    
+    # n is always below the next system's modulus 13 << system_level
+    next_system_dimension = n
+    next_system_position = (next_system_dimension % DIMENSIONAL_FACTOR) + 1
+    next_system_resonance = (next_system_position * PHI) % 1
+    
+    return 1 - np.abs(current_system_resonance - next_system_resonance)
+
+def analyze_system_boundary_vec(n):
+    """
+    Analyze system boundary behavior for an array of numbers.
+    
+    Args:
+        n: np.ndarray of integers
+    
+    Returns:
+        A tuple of arrays (is_near_boundary, boundary_transition_score)
+    """
+    n = np.asarray(n, dtype=np.int64)
+    system_level = ufrf_dimensional_mapping_vec(n)[0]
+    system_boundary = DIMENSIONAL_FACTOR << (system_level - 1)
+    
+    is_near_boundary = np.abs(n - system_boundary) < 1000
+    
+    # Only numbers near a boundary need coordinates and a square root
+    near = n[is_near_boundary]
+    current_coords = create_cross_system_coordinates_vec(near)
+    next_coords = create_cross_system_coordinates_vec(near + system_boundary[is_near_boundary])
+    coord_diff = sum((a - b)**2 for a, b in zip(current_coords, next_coords))
+    
+    transition_score = np.zeros(len(n))
+    transition_score[is_near_boundary] = 1 / (1 + np.sqrt(coord_diff))
+    
+    return (is_near_boundary, transition_score)
+
+def is_echo_point_vec(n, is_tick=None):
+    """
+    Determine which numbers of an array are "echo points" (false positives).
+    
+    Args:
+        n: np.ndarray of integers
+        is_tick: Optional precomputed tick flags for n (computed if omitted)
+    
+    Returns:
+        Boolean array
+    """
+    n = np.asarray(n, dtype=np.int64)
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping_vec(n)
+    
+    if is_tick is None:
+        is_tick = is_at_tick_position_vec(n)
+    
+    golden_ratio_mod = (n % GOLDEN_RATIO_MODULUS) / 100
+    has_golden_relationship = (0.6 < golden_ratio_mod) & (golden_ratio_mod < 0.7)
+    
+    has_echo_position = ECHO_POSITION_TABLE[position]
+    has_echo_cycle = cycle % 3 == 0  # cycle % 6 in {0, 3}
+    
+    echo_score = (0.4 * is_tick
+                  + 0.3 * has_golden_relationship
+                  + 0.2 * has_echo_position
+                  + 0.1 * has_echo_cycle)
+    
+    return echo_score > 0.5
+
+def is_prime_by_cross_system_pattern_vec(n):
+    """
+    Predict primality for an array of numbers using the cross-system geometric pattern.
+    
+    Args:
+        n: np.ndarray of integers
+    
+    Returns:
+        Boolean array indicating which numbers are predicted to be prime
+    """
+    n = np.asarray(n, dtype=np.int64)
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping_vec(n)
+    
+    in_dense_region = is_in_prime_dense_region_vec(n)
+    resonance = calculate_cross_system_resonance_vec(n)
+    
+    position_is_prime = PRIME_POSITION_TABLE[position]
+    golden_relationship = np.abs((position / system_level) - PHI) < 0.3
+    boundary_mod = n % SYSTEM_BOUNDARY
+    boundary_resonance = (np.abs(boundary_mod) < 100) | (np.abs(boundary_mod - SYSTEM_BOUNDARY) < 100)
+    
+    score = (0.4 * in_dense_region
+             + 0.3 * (resonance > 0.7)
+             + 0.2 * position_is_prime
+             + 0.1 * golden_relationship
+             + 0.1 * boundary_resonance)
+    
+    predicted = (score >= 0.5) & ~is_echo_point_vec(n)
+    
+    # Special cases
+    predicted[n % 2 == 0] = False
+    predicted[(n == 2) | (n == 3)] = True
+    predicted[n < 2] = False
+    
+    return predicted
+
+# Calculate prime density field with enhanced resolution (global variables)
+PRIME_DENSITY_FIELD, PRIME_DENSITY_ORIGIN = calculate_prime_density_field(resolution=DENSITY_FIELD_RESOLUTION)
+COMBINED_DENSITY_FIELD = smooth_density_field(PRIME_DENSITY_FIELD)
+
+# Regions whose combined density exceeds the prime-dense threshold
+DENSE_REGION_MASK = COMBINED_DENSITY_FIELD > 0.3
+
+# Tick and echo flags for 0 <= n < len(cache), grown on demand like the sieve
+IS_TICK_CACHE = np.zeros(0, dtype=bool)
+IS_ECHO_CACHE = np.zeros(0, dtype=bool)
+
+def tick_echo_tables(limit):
+    """
+    Return boolean lookup tables of tick positions and echo points below a limit.
+    
+    Both tables are computed with the vectorized kernels and cached globally,
+    so consumers pay one array index per number instead of a function call.
+    
+    Args:
+        limit: Exclusive upper bound of the tables
+        
+    Returns:
+        A tuple (is_tick, is_echo) of np.bool_ arrays indexed by n
+    """
+    global IS_TICK_CACHE, IS_ECHO_CACHE
+    limit = max(int(limit), 0)
+    
+    if len(IS_TICK_CACHE) < limit:
+        numbers = np.arange(limit, dtype=np.int64)
+        IS_TICK_CACHE = is_at_tick_position_vec(numbers)
+        IS_ECHO_CACHE = is_echo_point_vec(numbers, IS_TICK_CACHE)
+    
+    return IS_TICK_CACHE[:limit], IS_ECHO_CACHE[:limit]
+
 def visualize_cross_system_pattern(numbers, is_prime, is_predicted_prime, output_dir='.'):
     """
     Visualize the cross-system geometric pattern of prime numbers.
@@ -506,9 +875,8 @@ def visualize_cross_system_pattern(numbers, is_prime, is_predicted_prime, output
         is_predicted_prime: Boolean array indicating which numbers are predicted to be prime
         output_dir: Directory to save the visualization
     """
-    # Create cross-system coordinates for each number
-    coordinates = [create_cross_system_coordinates(n) for n in numbers]
-    x_coords, y_coords, z_coords = zip(*coordinates)
+    # Create cross-system coordinates for all numbers at once
+    x_coords, y_coords, z_coords = create_cross_system_coordinates_vec(numbers)
     
     # Create the plot
     fig = plt.figure(figsize=(14, 12))
@@ -517,18 +885,18 @@ def visualize_cross_system_pattern(numbers, is_prime, is_predicted_prime, output
     # Plot non-prime numbers
     non_prime_indices = ~is_prime
     ax.scatter(
-        np.array(x_coords)[non_prime_indices], 
-        np.array(y_coords)[non_prime_indices], 
-        np.array(z_coords)[non_prime_indices],
+        x_coords[non_prime_indices], 
+        y_coords[non_prime_indices], 
+        z_coords[non_prime_indices],
         c='blue', alpha=0.3, s=10, label='Non-Prime'
     )
     
     # Plot actual prime numbers
     prime_indices = is_prime
     ax.scatter(
-        np.array(x_coords)[prime_indices], 
-        np.array(y_coords)[prime_indices], 
-        np.array(z_coords)[prime_indices],
+        x_coords[prime_indices], 
+        y_coords[prime_indices], 
+        z_coords[prime_indices],
         c='red', s=30, label='Actual Prime'
     )
     
@@ -536,9 +904,9 @@ def visualize_cross_system_pattern(numbers, is_prime, is_predicted_prime, output
     predicted_prime_indices = is_predicted_prime & ~is_prime  # False positives
     if np.any(predicted_prime_indices):
         ax.scatter(
-            np.array(x_coords)[predicted_prime_indices], 
-            np.array(y_coords)[predicted_prime_indices], 
-            np.array(z_coords)[predicted_prime_indices],
+            x_coords[predicted_prime_indices], 
+            y_coords[predicted_prime_indices], 
+            z_coords[predicted_prime_indices],
             facecolors='none', edgecolors='green', s=40, label='False Positive'
         )
     
@@ -546,9 +914,9 @@ def visualize_cross_system_pattern(numbers, is_prime, is_predicted_prime, output
     missed_prime_indices = ~is_predicted_prime & is_prime  # False negatives
     if np.any(missed_prime_indices):
         ax.scatter(
-            np.array(x_coords)[missed_prime_indices], 
-            np.array(y_coords)[missed_prime_indices], 
-            np.array(z_coords)[missed_prime_indices],
+            x_coords[missed_prime_indices], 
+            y_coords[missed_prime_indices], 
+            z_coords[missed_prime_indices],
             facecolors='none', edgecolors='purple', s=40, label='False Negative'
         )
     
@@ -567,14 +935,14 @@ def visualize_prime_density_field(output_dir='.'):
     Args:
         output_dir: Directory to save the visualization
     """
-    # Extract coordinates and density values
-    regions = list(PRIME_DENSITY_FIELD.keys())
-    densities = list(PRIME_DENSITY_FIELD.values())
+    # Extract the regions containing primes and their density values
+    regions = np.nonzero(PRIME_DENSITY_FIELD)
+    densities = PRIME_DENSITY_FIELD[regions]
     
-    # Extract x, y, z coordinates
-    x_coords = [region[0] for region in regions]
-    y_coords = [region[1] for region in regions]
-    z_coords = [region[2] for region in regions]
+    # Convert region indices back to x, y, z coordinates
+    x_coords, y_coords, z_coords = [
+        (cells + o) / DENSITY_FIELD_RESOLUTION for cells, o in zip(regions, PRIME_DENSITY_ORIGIN)
+    ]
     
     # Create the plot
     fig = plt.figure(figsize=(14, 12))
@@ -611,55 +979,54 @@ def visualize_spiral_pattern(numbers, is_prime, output_dir='.'):
         is_prime: Boolean array indicating which numbers are actually prime
         output_dir: Directory to save the visualization
     """
-    # Calculate spiral positions for each number
-    spiral_positions = [calculate_spiral_position(n) for n in numbers]
-    radii, angles, heights = zip(*spiral_positions)
+    # Calculate spiral positions for all numbers at once
+    radii, angles, heights = calculate_spiral_position_vec(numbers)
     
     # Convert to Cartesian coordinates for visualization
-    x_coords = [r * math.cos(a) for r, a in zip(radii, angles)]
-    y_coords = [r * math.sin(a) for r, a in zip(radii, angles)]
+    x_coords = radii * np.cos(angles)
+    y_coords = radii * np.sin(angles)
     z_coords = heights
     
     # Identify tick positions
-    is_tick = [is_at_tick_position(n) for n in numbers]
+    is_tick = tick_echo_tables(np.max(numbers) + 1)[0][numbers]
     
     # Create the plot
     fig = plt.figure(figsize=(14, 12))
     ax = fig.add_subplot(111, projection='3d')
     
     # Plot non-prime, non-tick numbers
-    non_prime_non_tick_indices = ~is_prime & ~np.array(is_tick)
+    non_prime_non_tick_indices = ~is_prime & ~is_tick
     ax.scatter(
-        np.array(x_coords)[non_prime_non_tick_indices], 
-        np.array(y_coords)[non_prime_non_tick_indices], 
-        np.array(z_coords)[non_prime_non_tick_indices],
+        x_coords[non_prime_non_tick_indices], 
+        y_coords[non_prime_non_tick_indices], 
+        z_coords[non_prime_non_tick_indices],
         c='blue', alpha=0.3, s=10, label='Non-Prime, Non-Tick'
     )
     
     # Plot non-prime tick numbers
-    non_prime_tick_indices = ~is_prime & np.array(is_tick)
+    non_prime_tick_indices = ~is_prime & is_tick
     ax.scatter(
-        np.array(x_coords)[non_prime_tick_indices], 
-        np.array(y_coords)[non_prime_tick_indices], 
-        np.array(z_coords)[non_prime_tick_indices],
+        x_coords[non_prime_tick_indices], 
+        y_coords[non_prime_tick_indices], 
+        z_coords[non_prime_tick_indices],
         c='green', alpha=0.5, s=20, label='Non-Prime Tick'
     )
     
     # Plot prime non-tick numbers
-    prime_non_tick_indices = is_prime & ~np.array(is_tick)
+    prime_non_tick_indices = is_prime & ~is_tick
     ax.scatter(
-        np.array(x_coords)[prime_non_tick_indices], 
-        np.array(y_coords)[prime_non_tick_indices], 
-        np.array(z_coords)[prime_non_tick_indices],
+        x_coords[prime_non_tick_indices], 
+        y_coords[prime_non_tick_indices], 
+        z_coords[prime_non_tick_indices],
         c='orange', s=30, label='Prime Non-Tick'
     )
     
     # Plot prime tick numbers
-    prime_tick_indices = is_prime & np.array(is_tick)
+    prime_tick_indices = is_prime & is_tick
     ax.scatter(
-        np.array(x_coords)[prime_tick_indices], 
-        np.array(y_coords)[prime_tick_indices], 
-        np.array(z_coords)[prime_tick_indices],
+        x_coords[prime_tick_indices], 
+        y_coords[prime_tick_indices], 
+        z_coords[prime_tick_indices],
         c='red', s=40, label='Prime Tick'
     )
     
@@ -684,9 +1051,8 @@ def visualize_system_boundary_transition(output_dir='.'):
     range_end = system_boundary + 1000
     
     # Analyze numbers around the boundary
-    numbers = list(range(range_start, range_end))
-    boundary_data = [analyze_system_boundary(n) for n in numbers]
-    is_near, transition_scores = zip(*boundary_data)
+    numbers = np.arange(range_start, range_end)
+    is_near, transition_scores = analyze_system_boundary_vec(numbers)
     
     # Create the plot
     fig, ax = plt.subplots(figsize=(12, 8))
@@ -697,10 +1063,10 @@ def visualize_system_boundary_transition(output_dir='.'):
     # Highlight the system boundary
     ax.axvline(x=system_boundary, color='r', linestyle='--', label='System Boundary')
     
-    # Identify prime numbers in the range
-    is_prime = [sympy.isprime(n) for n in numbers]
-    prime_numbers = [n for n, prime in zip(numbers, is_prime) if prime]
-    prime_scores = [score for n, score, prime in zip(numbers, transition_scores, is_prime) if prime]
+    # Identify prime numbers in the range (one slice of the shared sieve)
+    is_prime = sieve(range_end)[range_start:range_end]
+    prime_numbers = numbers[is_prime]
+    prime_scores = transition_scores[is_prime]
     
     # Plot prime numbers
     ax.scatter(prime_numbers, prime_scores, c='red', s=30, label='Prime Numbers')
@@ -723,38 +1089,38 @@ def visualize_echo_points(numbers, is_prime, is_echo, output_dir='.'):
         is_echo: Boolean array indicating which numbers are echo points
         output_dir: Directory to save the visualization
     """
-    # Create cross-system coordinates for each number
-    coordinates = [create_cross_system_coordinates(n) for n in numbers]
-    x_coords, y_coords, z_coords = zip(*coordinates)
+    # Create cross-system coordinates for all numbers at once
+    x_coords, y_coords, z_coords = create_cross_system_coordinates_vec(numbers)
+    is_echo = np.asarray(is_echo, dtype=bool)
     
     # Create the plot
     fig = plt.figure(figsize=(14, 12))
     ax = fig.add_subplot(111, projection='3d')
     
     # Plot regular non-prime numbers
-    regular_non_prime_indices = ~is_prime & ~np.array(is_echo)
+    regular_non_prime_indices = ~is_prime & ~is_echo
     ax.scatter(
-        np.array(x_coords)[regular_non_prime_indices], 
-        np.array(y_coords)[regular_non_prime_indices], 
-        np.array(z_coords)[regular_non_prime_indices],
+        x_coords[regular_non_prime_indices], 
+        y_coords[regular_non_prime_indices], 
+        z_coords[regular_non_prime_indices],
         c='blue', alpha=0.3, s=10, label='Regular Non-Prime'
     )
     
     # Plot echo points
-    echo_indices = np.array(is_echo)
+    echo_indices = is_echo
     ax.scatter(
-        np.array(x_coords)[echo_indices], 
-        np.array(y_coords)[echo_indices], 
-        np.array(z_coords)[echo_indices],
+        x_coords[echo_indices], 
+        y_coords[echo_indices], 
+        z_coords[echo_indices],
         c='green', s=30, label='Echo Point'
     )
     
     # Plot prime numbers
     prime_indices = is_prime
     ax.scatter(
-        np.array(x_coords)[prime_indices], 
-        np.array(y_coords)[prime_indices], 
-        np.array(z_coords)[prime_indices],
+        x_coords[prime_indices], 
+        y_coords[prime_indices], 
+        z_coords[prime_indices],
         c='red', s=40, label='Prime'
     )
     
@@ -800,56 +1166,133 @@ def predict_primes_in_range(start, end):
         end: End of the range
         
     Returns:
-        A tuple (predicted_primes, actual_primes, true_positives, false_positives, false_negatives)
+        A tuple (is_predicted, is_prime, true_positives, false_positives, false_negatives)
+        where is_predicted and is_prime are boolean masks over range(start, end) and the
+        last three are counts
     """
-    predicted_primes = []
-    actual_primes = []
+    numbers = np.arange(start, end, dtype=np.int64)
     
-    for n in range(start, end):
-        # Predict using the enhanced cross-system model
-        is_predicted_prime = predict_prime(n)
-        
-        # Check actual primality
-        is_actual_prime = sympy.isprime(n)
-        
-        if is_predicted_prime:
-            predicted_primes.append(n)
-        
-        if is_actual_prime:
-            actual_primes.append(n)
+    if kernels.NUMBA_AVAILABLE:
+        # Score the range in parallel with the compiled kernel
+        is_predicted = np.empty(len(numbers), dtype=np.bool_)
+        kernels.predict_range_kernel(
+            start, COMBINED_DENSITY_FIELD, PRIME_DENSITY_ORIGIN, DENSITY_FIELD_RESOLUTION, is_predicted
+        )
+    elif kernels.C_SCORER_AVAILABLE:
+        # Score the range with the native C scorer
+        is_predicted = np.empty(len(numbers), dtype=np.bool_)
+        kernels.score_range_c(
+            start, COMBINED_DENSITY_FIELD, PRIME_DENSITY_ORIGIN, DENSITY_FIELD_RESOLUTION, is_predicted
+        )
+    else:
+        # Predict the whole range at once using the vectorized cross-system model
+        is_predicted = is_prime_by_cross_system_pattern_vec(numbers)
+    
+    # Check actual primality with a single sieve over the range (0 stands in for negatives)
+    is_prime = sieve(max(end, 2))[np.maximum(numbers, 0)]
     
-    # Calculate true positives, false positives, and false negatives
-    true_positives = set(predicted_primes) & set(actual_primes)
-    false_positives = set(predicted_primes) - set(actual_primes)
-    false_negatives = set(actual_primes) - set(predicted_primes)
+    # Count true positives, false positives, and false negatives from the masks
+    true_positives = int(np.count_nonzero(is_predicted & is_prime))
+    false_positives = int(np.count_nonzero(is_predicted & ~is_prime))
+    false_negatives = int(np.count_nonzero(~is_predicted & is_prime))
     
-    return (predicted_primes, actual_primes, true_positives, false_positives, false_negatives)
+    return (is_predicted, is_prime, true_positives, false_positives, false_negatives)
 
 def evaluate_prediction_accuracy(true_positives, false_positives, false_negatives):
     """
     Evaluate the accuracy of prime number prediction.
     
     Args:
-        true_positives: Set of correctly predicted primes
-        false_positives: Set of incorrectly predicted primes
-        false_negatives: Set of missed primes
+        true_positives: Number of correctly predicted primes
+        false_positives: Number of incorrectly predicted primes
+        false_negatives: Number of missed primes
         
     Returns:
         A tuple (precision, recall, f1_score)
     """
     # Calculate precision, recall, and F1 score
-    precision = len(true_positives) / (len(true_positives) + len(false_positives)) if (len(true_positives) + len(false_positives)) > 0 else 0
-    recall = len(true_positives) / (len(true_positives) + len(false_negatives)) if (len(true_positives) + len(false_negatives)) > 0 else 0
+    precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
+    recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
     f1_score = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
     
     return (precision, recall, f1_score)
 
+# Column layouts of the cross-system analysis results (one typed column per field)
+SAMPLE_RESULT_DTYPE = np.dtype([
+    ('number', np.int64),
+    ('system_level', np.int64),
+    ('position', np.int64),
+    ('cycle', np.int64),
+    ('metacycle', np.int64),
+    ('coordinates', np.float64, 3),
+    ('spiral_position', np.float64, 3),
+    ('is_tick', np.bool_),
+    ('is_prime', np.bool_),
+    ('is_predicted', np.bool_),
+    ('is_echo', np.bool_)
+])
+
+BOUNDARY_RESULT_DTYPE = np.dtype([
+    ('number', np.int64),
+    ('system_level', np.int64),
+    ('position', np.int64),
+    ('is_prime', np.bool_),
+    ('is_near_boundary', np.bool_),
+    ('transition_score', np.float64)
+])
+
+def analyze_sample_points(samples):
+    """
+    Analyze a batch of sample points with the vectorized cross-system kernels.
+    
+    Args:
+        samples: Sequence of non-negative integers to analyze
+        
+    Returns:
+        A structured array (SAMPLE_RESULT_DTYPE) with one row per sample holding its
+        mapping, coordinates, spiral position and tick, prime, prediction and echo flags
+    """
+    numbers = np.array(samples, dtype=np.int64)
+    
+    # Run every kernel once over the whole batch, filling the result columns
+    results = np.empty(len(numbers), dtype=SAMPLE_RESULT_DTYPE)
+    results['number'] = numbers
+    results['is_prime'] = isprime_numbers(numbers)
+    
+    if kernels.NUMBA_AVAILABLE:
+        # Compiled parallel batch kernels
+        mapping = kernels.ufrf_dimensional_mapping_batch(numbers)
+        system_level, dimension, position, cycle, metacycle = mapping.T
+        results['coordinates'] = kernels.create_cross_system_coordinates_batch(numbers)
+        results['spiral_position'] = kernels.calculate_spiral_position_batch(numbers)
+        results['is_tick'] = kernels.is_at_tick_position_batch(numbers)
+        results['is_predicted'] = kernels.score_batch(
+            numbers, COMBINED_DENSITY_FIELD, PRIME_DENSITY_ORIGIN, DENSITY_FIELD_RESOLUTION
+        )
+        results['is_echo'] = kernels.is_echo_point_batch(numbers)
+    else:
+        # NumPy array kernels
+        system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping_vec(numbers)
+        results['coordinates'] = np.column_stack(create_cross_system_coordinates_vec(numbers))
+        results['spiral_position'] = np.column_stack(calculate_spiral_position_vec(numbers))
+        results['is_tick'] = is_at_tick_position_vec(numbers)
+        results['is_predicted'] = is_prime_by_cross_system_pattern_vec(numbers)
+        results['is_echo'] = is_echo_point_vec(numbers, results['is_tick'])
+    
+    results['system_level'] = system_level
+    results['position'] = position
+    results['cycle'] = cycle
+    results['metacycle'] = metacycle
+    
+    return results
+
 def analyze_cross_system_patterns():
     """
     Analyze patterns across two full systems.
     
     Returns:
-        A dictionary of analysis results
+        A dictionary of analysis results: structured arrays 'first_system' and
+        'second_system' (SAMPLE_RESULT_DTYPE) and 'boundary' (BOUNDARY_RESULT_DTYPE)
     """
     # Define sample points in each system
     first_system_samples = [
@@ -868,104 +1311,26 @@ def analyze_cross_system_patterns():
         FIRST_SYSTEM_END + 1000000
     ]
     
-    # Analyze each sample point
-    first_system_results = []
-    for n in first_system_samples:
-        # Get dimensional mapping
-        system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
-        
-        # Get cross-system coordinates
-        coords = create_cross_system_coordinates(n)
-        
-        # Get spiral position
-        spiral_pos = calculate_spiral_position(n)
-        
-        # Check if at tick position
-        is_tick = is_at_tick_position(n)
-        
-        # Check if prime
-        is_prime = sympy.isprime(n)
-        
-        # Check if predicted as prime
-        is_predicted = predict_prime(n)
-        
-        # Check if echo point
-        is_echo = is_echo_point(n)
-        
-        # Store results
-        first_system_results.append({
-            'number': n,
-            'system_level': system_level,
-            'position': position,
-            'cycle': cycle,
-            'metacycle': metacycle,
-            'coordinates': coords,
-            'spiral_position': spiral_pos,
-            'is_tick': is_tick,
-            'is_prime': is_prime,
-            'is_predicted': is_predicted,
-            'is_echo': is_echo
-        })
-    
-    # Analyze second system sample points
-    second_system_results = []
-    for n in second_system_samples:
-        # Get dimensional mapping
-        system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
-        
-        # Get cross-system coordinates
-        coords = create_cross_system_coordinates(n)
-        
-        # Get spiral position
-        spiral_pos = calculate_spiral_position(n)
-        
-        # Check if at tick position
-        is_tick = is_at_tick_position(n)
-        
-        # Check if prime
-        is_prime = sympy.isprime(n)
-        
-        # Check if predicted as prime
-        is_predicted = predict_prime(n)
-        
-        # Check if echo point
-        is_echo = is_echo_point(n)
-        
-        # Store results
-        second_system_results.append({
-            'number': n,
-            'system_level': system_level,
-            'position': position,
-            'cycle': cycle,
-            'metacycle': metacycle,
-            'coordinates': coords,
-            'spiral_position': spiral_pos,
-            'is_tick': is_tick,
-            'is_prime': is_prime,
-            'is_predicted': is_predicted,
-            'is_echo': is_echo
-        })
+    # Analyze both systems' sample points in a single batch, then split it
+    sample_results = analyze_sample_points(first_system_samples + second_system_samples)
+    first_system_results = sample_results[:len(first_system_samples)]
+    second_system_results = sample_results[len(first_system_samples):]
     
     # Analyze system boundary
-    boundary_analysis = []
-    for n in range(FIRST_SYSTEM_END - 100, FIRST_SYSTEM_END + 100):
-        # Get dimensional mapping
-        system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
-        
-        # Analyze system boundary
-        is_near, transition_score = analyze_system_boundary(n)
-        
-        # Check if prime
-        is_prime = sympy.isprime(n)
-        
-        # Store results
-        boundary_analysis.append({
-            'number': n,
-            'system_level': system_level,
-            'position': position,
-            'is_prime': is_prime,
-            'transition_score': transition_score
-        })
+    boundary_numbers = np.arange(FIRST_SYSTEM_END - 100, FIRST_SYSTEM_END + 100)
+    boundary_analysis = np.empty(len(boundary_numbers), dtype=BOUNDARY_RESULT_DTYPE)
+    boundary_analysis['number'] = boundary_numbers
+    boundary_analysis['is_prime'] = sieve(FIRST_SYSTEM_END + 100)[boundary_numbers]
+    if kernels.NUMBA_AVAILABLE:
+        system_level, dimension, position, cycle, metacycle = kernels.ufrf_dimensional_mapping_batch(boundary_numbers).T
+        is_near, transition_score = kernels.analyze_system_boundary_batch(boundary_numbers)
+    else:
+        system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping_vec(boundary_numbers)
+        is_near, transition_score = analyze_system_boundary_vec(boundary_numbers)
+    boundary_analysis['system_level'] = system_level
+    boundary_analysis['position'] = position
+    boundary_analysis['is_near_boundary'] = is_near
+    boundary_analysis['transition_score'] = transition_score
     
     return {
         'first_system': first_system_results,
@@ -973,27 +1338,101 @@ def analyze_cross_system_patterns():
         'boundary': boundary_analysis
     }
 
+def format_sample_results(results):
+    """
+    Format sample analysis results as report text, one string per row.
+    
+    Args:
+        results: Structured array of SAMPLE_RESULT_DTYPE rows
+        
+    Returns:
+        A list of formatted row strings
+    """
+    columns = [results[name].tolist() for name in SAMPLE_RESULT_DTYPE.names]
+    
+    return [
+        f"Number: {number}\n"
+        f"System Level: {system_level}\n"
+        f"Position: {position}\n"
+        f"Cycle: {cycle}\n"
+        f"Metacycle: {metacycle}\n"
+        f"Coordinates: {tuple(coords)}\n"
+        f"Spiral Position: {tuple(spiral_pos)}\n"
+        f"Is Tick: {is_tick}\n"
+        f"Is Prime: {is_prime}\n"
+        f"Is Predicted Prime: {is_predicted}\n"
+        f"Is Echo Point: {is_echo}\n"
+        f"\n"
+        for (number, system_level, position, cycle, metacycle, coords, spiral_pos,
+             is_tick, is_prime, is_predicted, is_echo) in zip(*columns)
+    ]
+
+def format_boundary_results(results):
+    """
+    Format system boundary analysis results as report text, one string per row.
+    
+    Args:
+        results: Structured array of BOUNDARY_RESULT_DTYPE rows
+        
+    Returns:
+        A list of formatted row strings (numbers away from a boundary report a score of 0)
+    """
+    columns = [results[name].tolist() for name in BOUNDARY_RESULT_DTYPE.names]
+    
+    return [
+        f"Number: {number}\n"
+        f"System Level: {system_level}\n"
+        f"Position: {position}\n"
+        f"Is Prime: {is_prime}\n"
+        f"Transition Score: {transition_score if is_near_boundary else 0}\n"
+        f"\n"
+        for number, system_level, position, is_prime, is_near_boundary, transition_score in zip(*columns)
+    ]
+
 def safe_fibonacci(n):
     """
     Safely calculate the nth Fibonacci number, even for very large n.
     
+    Results for n >= 64 are memoized, since those are the ones whose big-number
+    multiplications are worth keeping (the cache is bounded to cap memory).
+    
     Args:
         n: The Fibonacci index
         
     Returns:
         A tuple (Fn, Fn+1) containing the nth and (n+1)th Fibonacci numbers
     """
-    if n == 0:
-        return (0, 1)
-    else:
-        # Use matrix exponentiation for efficient calculation
-        a, b = safe_fibonacci(n // 2)
-        c = a * (2 * b - a)
+    if n >= 64:
+        return fibonacci_pair_cached(n)
+    
+    return fibonacci_pair(n)
+
+def fibonacci_pair(n):
+    """
+    Calculate (Fn, Fn+1) by fast doubling.
+    
+    Args:
+        n: The Fibonacci index
+        
+    Returns:
+        A tuple (Fn, Fn+1) containing the nth and (n+1)th Fibonacci numbers
+    """
+    # Fast doubling over the bits of n, most significant first:
+    # (Fk, Fk+1) -> (F2k, F2k+1) = (Fk(2Fk+1 - Fk), Fk^2 + Fk+1^2), then one step for a 1 bit
+    # (GMP integers make the large multiplications much faster when gmpy2 is installed)
+    a, b = (mpz(0), mpz(1)) if GMPY2_AVAILABLE else (0, 1)
+    for bit in bin(n)[2:]:
+        c = a * ((b << 1) - a)
         d = a * a + b * b
-        if n % 2 == 0:
-            return (c, d)
+        if bit == '0':
+            a, b = c, d
         else:
-            return (d, c + d)
+            a, b = d, c + d
+    
+    return (int(a), int(b))
+
+# Memoized fast doubling for large indices (repeated predictions reuse their big products)
+fibonacci_pair_cached = functools.lru_cache(maxsize=1024)(fibonacci_pair)
 
 def predict_fibonacci_primes(start_index, count):
     """
@@ -1027,14 +1466,9 @@ def predict_fibonacci_primes(start_index, count):
         return result
     
     # For smaller indices, use the original approach
-    # Initialize Fibonacci sequence
-    a, b = 0, 1
-    fib_numbers = [a, b]
-    
-    # Generate Fibonacci numbers up to start_index
-    for i in range(2, start_index + 1):
-        a, b = b, a + b
-        fib_numbers.append(b)
+    # Jump straight to (F(start_index - 1), F(start_index)) by fast doubling
+    f_start, f_next = safe_fibonacci(start_index)
+    a, b = f_next - f_start, f_start
     
     # Find Fibonacci primes
     fibonacci_primes = []
@@ -1048,6 +1482,11 @@ def predict_fibonacci_primes(start_index, count):
         if index > 3 and index % 2 == 0:
             continue
         
+        # F(m) divides F(n) whenever m divides n, so F(n) is composite for composite n > 4
+        # (testing the small index is far cheaper than testing the Fibonacci number)
+        if index > 4 and not isprime(index):
+            continue
+        
         # Check if the Fibonacci number is potentially prime
         is_predicted_prime = predict_prime(b)
         
@@ -1078,7 +1517,7 @@ def main():
     print(f"\nAnalyzing numbers in range {start}-{end}...")
     
     # Predict primes using the enhanced cross-system model
-    predicted_primes, actual_primes, true_positives, false_positives, false_negatives = predict_primes_in_range(start, end)
+    is_predicted_prime, is_prime, true_positives, false_positives, false_negatives = predict_primes_in_range(start, end)
     
     # Evaluate prediction accuracy
     precision, recall, f1_score = evaluate_prediction_accuracy(true_positives, false_positives, false_negatives)
@@ -1087,33 +1526,45 @@ def main():
     print(f"Precision: {precision:.4f}")
     print(f"Recall: {recall:.4f}")
     print(f"F1 Score: {f1_score:.4f}")
-    print(f"True Positives: {len(true_positives)}")
-    print(f"False Positives: {len(false_positives)}")
-    print(f"False Negatives: {len(false_negatives)}")
+    print(f"True Positives: {true_positives}")
+    print(f"False Positives: {false_positives}")
+    print(f"False Negatives: {false_negatives}")
     
-    # Visualize cross-system pattern
-    print("\nVisualizing cross-system geometric pattern...")
     numbers = np.arange(start, end)
-    is_prime = np.array([n in actual_primes for n in numbers])
-    is_predicted_prime = np.array([n in predicted_primes for n in numbers])
-    visualize_cross_system_pattern(numbers, is_prime, is_predicted_prime, output_dir)
-    
-    # Visualize prime density field
-    print("\nVisualizing prime density field...")
-    visualize_prime_density_field(output_dir)
-    
-    # Visualize spiral pattern and tick system
-    print("\nVisualizing spiral pattern and tick system...")
-    visualize_spiral_pattern(numbers, is_prime, output_dir)
-    
-    # Visualize system boundary transition
-    print("\nVisualizing system boundary transition...")
-    visualize_system_boundary_transition(output_dir)
-    
-    # Visualize echo points
-    print("\nVisualizing echo points...")
-    is_echo = [is_echo_point(n) for n in numbers]
-    visualize_echo_points(numbers, is_prime, is_echo, output_dir)
+    is_echo = tick_echo_tables(end)[1][numbers]
+    
+    # The figures are independent, so render them in parallel worker processes
+    # (spawned rather than forked, since the compiled kernels may have started threads,
+    # and on the non-interactive Agg backend)
+    with ProcessPoolExecutor(
+        max_workers=5, mp_context=multiprocessing.get_context('spawn'),
+        initializer=matplotlib.use, initargs=('Agg',)
+    ) as executor:
+        futures = []
+        
+        # Visualize cross-system pattern
+        print("\nVisualizing cross-system geometric pattern...")
+        futures.append(executor.submit(visualize_cross_system_pattern, numbers, is_prime, is_predicted_prime, output_dir))
+        
+        # Visualize prime density field
+        print("\nVisualizing prime density field...")
+        futures.append(executor.submit(visualize_prime_density_field, output_dir))
+        
+        # Visualize spiral pattern and tick system
+        print("\nVisualizing spiral pattern and tick system...")
+        futures.append(executor.submit(visualize_spiral_pattern, numbers, is_prime, output_dir))
+        
+        # Visualize system boundary transition
+        print("\nVisualizing system boundary transition...")
+        futures.append(executor.submit(visualize_system_boundary_transition, output_dir))
+        
+        # Visualize echo points
+        print("\nVisualizing echo points...")
+        futures.append(executor.submit(visualize_echo_points, numbers, is_prime, is_echo, output_dir))
+        
+        # Wait for every figure (re-raising any worker error)
+        for future in futures:
+            future.result()
     
     # Analyze cross-system patterns
     print("\nAnalyzing patterns across two full systems...")
@@ -1124,47 +1575,17 @@ def main():
         # First system results
         f.write("FIRST SYSTEM ANALYSIS:\n")
         f.write("=====================\n\n")
-        for result in cross_system_analysis['first_system']:
-            f.write(f"Number: {result['number']}\n")
-            f.write(f"System Level: {result['system_level']}\n")
-            f.write(f"Position: {result['position']}\n")
-            f.write(f"Cycle: {result['cycle']}\n")
-            f.write(f"Metacycle: {result['metacycle']}\n")
-            f.write(f"Coordinates: {result['coordinates']}\n")
-            f.write(f"Spiral Position: {result['spiral_position']}\n")
-            f.write(f"Is Tick: {result['is_tick']}\n")
-            f.write(f"Is Prime: {result['is_prime']}\n")
-            f.write(f"Is Predicted Prime: {result['is_predicted']}\n")
-            f.write(f"Is Echo Point: {result['is_echo']}\n")
-            f.write("\n")
+        f.writelines(format_sample_results(cross_system_analysis['first_system']))
         
         # Second system results
         f.write("\nSECOND SYSTEM ANALYSIS:\n")
         f.write("======================\n\n")
-        for result in cross_system_analysis['second_system']:
-            f.write(f"Number: {result['number']}\n")
-            f.write(f"System Level: {result['system_level']}\n")
-            f.write(f"Position: {result['position']}\n")
-            f.write(f"Cycle: {result['cycle']}\n")
-            f.write(f"Metacycle: {result['metacycle']}\n")
-            f.write(f"Coordinates: {result['coordinates']}\n")
-            f.write(f"Spiral Position: {result['spiral_position']}\n")
-            f.write(f"Is Tick: {result['is_tick']}\n")
-            f.write(f"Is Prime: {result['is_prime']}\n")
-            f.write(f"Is Predicted Prime: {result['is_predicted']}\n")
-            f.write(f"Is Echo Point: {result['is_echo']}\n")
-            f.write("\n")
+        f.writelines(format_sample_results(cross_system_analysis['second_system']))
         
         # Boundary analysis
         f.write("\nSYSTEM BOUNDARY ANALYSIS:\n")
         f.write("========================\n\n")
-        for result in cross_system_analysis['boundary']:
-            f.write(f"Number: {result['number']}\n")
-            f.write(f"System Level: {result['system_level']}\n")
-            f.write(f"Position: {result['position']}\n")
-            f.write(f"Is Prime: {result['is_prime']}\n")
-            f.write(f"Transition Score: {result['transition_score']}\n")
-            f.write("\n")
+        f.writelines(format_boundary_results(cross_system_analysis['boundary']))
     
     # Predict Fibonacci primes
     print("\nPredicting next Fibonacci primes beyond F(104911)...")
@@ -11,14 +11,16 @@ import sys
 import time
 import argparse
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Plots are only saved to files
 import matplotlib.pyplot as plt
 from tqdm import tqdm
 import gc
-import pickle
+import heapq
+import struct
 import math
-from datetime import datetime
 import multiprocessing as mp
-from functools import partial
+from multiprocessing import shared_memory
 
 # Import from other modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -33,6 +35,525 @@ except ImportError:
         print("Error: Could not import required modules. Please ensure you're running from the correct directory.")
         sys.exit(1)
 
+# Check if Numba is available for JIT compilation
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Numba not available, sieve kernels will run as plain Python")
+    
+    # Dummy decorator and range when Numba is not available
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+# Running on PyPy, whose tracing JIT compiles plain-Python loops when Numba is missing
+PYPY = sys.implementation.name == 'pypy'
+
+# Checkpoint record: last processed number, true/false positives, false negatives, timestamp
+CHECKPOINT_RECORD = struct.Struct('<QQQQd')
+
+# Smallest batch handed to a worker process by the distributed validation
+MIN_BATCH_SIZE = 10000
+
+#
+# Bit-Packed Sieve Kernels
+#
+# Sieves are stored one bit per candidate in np.uint64 words, with bit (i & 63)
+# of word (i >> 6) set once candidate i is known to be composite.
+#
+
+# Every even position of a word (the even numbers of a full sieve)
+EVEN_BITS = np.uint64(0x5555555555555555)
+
+# Words per block of the parallel sieves (32 KiB, about one L1 data cache)
+SIEVE_BLOCK_WORDS = 4096
+
+def bit_words(num_bits):
+    """
+    Calculate the number of 64-bit words needed to hold a number of bits.
+    
+    Args:
+        num_bits: Number of bits to store
+        
+    Returns:
+        Number of np.uint64 words
+    """
+    return (num_bits + 63) // 64
+
+@njit(cache=True, boundscheck=False)
+def _set_bits(bits, start, stop, step):
+    """
+    Set every step-th bit from start up to (but excluding) stop.
+    
+    Args:
+        bits: np.uint64 bit array, modified in place
+        start: Index of the first bit to set
+        stop: Exclusive upper bound of the bit indices
+        step: Distance between consecutive bits
+    """
+    for j in range(start, stop, step):
+        bits[j >> 6] |= np.uint64(1) << np.uint64(j & 63)
+
+if not NUMBA_AVAILABLE:
+    def _set_bits(bits, start, stop, step):
+        """
+        Set every step-th bit from start up to stop (vectorized fallback).
+        
+        Args:
+            bits: np.uint64 bit array, modified in place
+            start: Index of the first bit to set
+            stop: Exclusive upper bound of the bit indices
+            step: Distance between consecutive bits
+        """
+        idx = np.arange(start, stop, step, dtype=np.uint64)
+        np.bitwise_or.at(bits, idx >> np.uint64(6), np.uint64(1) << (idx & np.uint64(63)))
+
+@njit(cache=True, boundscheck=False)
+def _sieve_bits(composite, limit):
+    """
+    Cross off the odd composites of a full bit sieve in place.
+    
+    Args:
+        composite: np.uint64 bit array covering 0..limit with the even numbers already set
+        limit: Upper limit of the sieve
+    """
+    for i in range(3, int(np.sqrt(limit)) + 1, 2):
+        if not (composite[i >> 6] >> np.uint64(i & 63)) & np.uint64(1):
+            # Even multiples are already set, so step over them
+            _set_bits(composite, i * i, limit + 1, 2 * i)
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _cross_off_parallel(composite, base_primes, limit):
+    """
+    Cross off the odd multiples of the odd base primes from a full bit sieve in parallel.
+    
+    Each thread takes whole blocks of words, so no two threads ever update the same word.
+    
+    Args:
+        composite: np.uint64 bit array covering 0..limit
+        base_primes: np.ndarray of the odd primes up to sqrt(limit)
+        limit: Upper limit of the sieve
+    """
+    block_bits = 64 * SIEVE_BLOCK_WORDS
+    for block in prange((limit + block_bits) // block_bits):
+        lo = block * block_bits
+        hi = min(lo + block_bits, limit + 1)
+        for k in range(len(base_primes)):
+            p = base_primes[k]
+            
+            # First odd multiple of p in the block, from p^2 on
+            first = max(p * p, (lo + p - 1) // p * p)
+            if first % 2 == 0:
+                first += p
+            _set_bits(composite, first, hi, 2 * p)
+
+# Residues mod 30 coprime to 30: bit b of wheel byte k is the number 30k + WHEEL_RESIDUES[b]
+WHEEL_RESIDUES = np.array([1, 7, 11, 13, 17, 19, 23, 29], dtype=np.int64)
+
+# Bit mask of every residue mod 30 within a wheel byte (0 for residues sharing a factor with 30)
+WHEEL_MASKS = np.zeros(30, dtype=np.uint8)
+WHEEL_MASKS[WHEEL_RESIDUES] = 1 << np.arange(8)
+
+# Bytes per block of the parallel wheel sieve (a multiple of 32, so blocks cover whole bitmap words)
+WHEEL_BLOCK_BYTES = 8 * SIEVE_BLOCK_WORDS
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _cross_off_wheel_parallel(wheel, base_primes):
+    """
+    Cross off the multiples of the base primes from a mod-30 wheel sieve in parallel.
+    
+    The multiples p * q with q in one wheel residue class all share a residue mod 30,
+    so each class is a single bit stepping p bytes at a time. Each thread takes
+    whole blocks of bytes, so no two threads ever update the same byte.
+    
+    Args:
+        wheel: np.uint8 wheel array (bit b of byte k is the number 30k + WHEEL_RESIDUES[b])
+        base_primes: np.ndarray of the primes from 7 up to sqrt(30 * len(wheel))
+    """
+    num_bytes = len(wheel)
+    for block in prange((num_bytes + WHEEL_BLOCK_BYTES - 1) // WHEEL_BLOCK_BYTES):
+        lo = block * WHEEL_BLOCK_BYTES
+        hi = min(lo + WHEEL_BLOCK_BYTES, num_bytes)
+        for k in range(len(base_primes)):
+            p = base_primes[k]
+            for r in WHEEL_RESIDUES:
+                # p times the smallest cofactor >= p in this residue class
+                m = p * (p + (r - p) % 30)
+                mask = WHEEL_MASKS[m % 30]
+                
+                # First byte of the progression in the block
+                first = m // 30
+                if first < lo:
+                    first += (lo - first + p - 1) // p * p
+                for j in range(first, hi, p):
+                    wheel[j] |= mask
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _wheel_to_bitmap(wheel, bitmap, limit):
+    """
+    Set the bits of a bitmap for the numbers up to the limit whose wheel bit is set.
+    
+    Args:
+        wheel: np.uint8 wheel array (bit b of byte k is the number 30k + WHEEL_RESIDUES[b])
+        bitmap: np.uint64 bitmap covering 0..limit, modified in place
+        limit: Upper limit covered by the bitmap
+    """
+    num_bytes = len(wheel)
+    for block in prange((num_bytes + WHEEL_BLOCK_BYTES - 1) // WHEEL_BLOCK_BYTES):
+        lo = block * WHEEL_BLOCK_BYTES
+        hi = min(lo + WHEEL_BLOCK_BYTES, num_bytes)
+        for k in range(lo, hi):
+            byte = wheel[k]
+            for b in range(8):
+                n = 30 * k + WHEEL_RESIDUES[b]
+                if (byte >> b) & 1 and n <= limit:
+                    bitmap[n >> 6] |= np.uint64(1) << np.uint64(n & 63)
+
+if not NUMBA_AVAILABLE:
+    def _cross_off_parallel(composite, base_primes, limit):
+        """
+        Cross off the odd multiples of the odd base primes (serial fallback).
+        
+        Args:
+            composite: np.uint64 bit array covering 0..limit
+            base_primes: np.ndarray of the odd primes up to sqrt(limit)
+            limit: Upper limit of the sieve
+        """
+        for p in base_primes.tolist():
+            _set_bits(composite, p * p, limit + 1, 2 * p)
+    
+    def _cross_off_wheel_parallel(wheel, base_primes):
+        """
+        Cross off the multiples of the base primes from a mod-30 wheel sieve (serial fallback).
+        
+        Args:
+            wheel: np.uint8 wheel array (bit b of byte k is the number 30k + WHEEL_RESIDUES[b])
+            base_primes: np.ndarray of the primes from 7 up to sqrt(30 * len(wheel))
+        """
+        for p in base_primes.tolist():
+            for r in WHEEL_RESIDUES.tolist():
+                m = p * (p + (r - p) % 30)
+                wheel[m // 30::p] |= WHEEL_MASKS[m % 30]
+    
+    def _wheel_to_bitmap(wheel, bitmap, limit):
+        """
+        Set the bits of a bitmap for the numbers up to the limit whose wheel bit is set (vectorized fallback).
+        
+        Args:
+            wheel: np.uint8 wheel array (bit b of byte k is the number 30k + WHEEL_RESIDUES[b])
+            bitmap: np.uint64 bitmap covering 0..limit, modified in place
+            limit: Upper limit covered by the bitmap
+        """
+        k, b = np.nonzero(np.unpackbits(wheel, bitorder='little').reshape(-1, 8))
+        numbers = 30 * k + WHEEL_RESIDUES[b]
+        numbers = numbers[numbers <= limit]
+        np.bitwise_or.at(bitmap, numbers >> 6, np.uint64(1) << (numbers & 63).astype(np.uint64))
+
+def set_bit_indices(bits, num_bits):
+    """
+    Find the indices of the set bits (the members of a bitmap).
+    
+    Args:
+        bits: np.uint64 bit array
+        num_bits: Number of meaningful bits (trailing padding is ignored)
+        
+    Returns:
+        np.ndarray of the set bit indices
+    """
+    unpacked = np.unpackbits(bits.astype('<u8', copy=False).view(np.uint8), bitorder='little')
+    return np.nonzero(unpacked[:num_bits])[0]
+
+def _sieve_pypy(limit):
+    """
+    Sieve of Eratosthenes in plain Python, for PyPy without Numba.
+    
+    Only 2, 3 and the candidates 6k +/- 1 are tried as sieving primes, and each
+    prime crosses off its odd multiples with one slice assignment.
+    
+    Args:
+        limit: Upper limit of the sieve
+        
+    Returns:
+        bytearray with byte n set to 1 when n is prime, covering 0..limit
+    """
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = bytes(min(2, limit + 1))  # 0 and 1 are not prime
+    
+    for p in (2, 3):
+        if p * p <= limit:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    
+    # Alternate steps of 2 and 4 visit 5, 7, 11, 13, ... (the numbers 6k +/- 1)
+    p, step = 5, 2
+    while p * p <= limit:
+        if sieve[p]:
+            sieve[p * p::2 * p] = bytes(len(range(p * p, limit + 1, 2 * p)))
+        p += step
+        step = 6 - step
+    
+    return sieve
+
+#
+# Prime Bitmaps
+#
+# Known primes are passed around as np.uint64 bitmaps covering 0..limit, with
+# bit (n & 63) of word (n >> 6) set when n is prime.
+#
+
+# Number of set bits of every 16-bit value
+POPCOUNT_16 = np.array([bin(i).count('1') for i in range(1 << 16)], dtype=np.uint8)
+
+def count_bits(bits):
+    """
+    Count the set bits of a bit array with a 16-bit popcount lookup table.
+    
+    Args:
+        bits: np.uint64 bit array
+        
+    Returns:
+        Number of set bits
+    """
+    return int(POPCOUNT_16[bits.view(np.uint16)].sum(dtype=np.int64))
+
+@njit(cache=True)
+def _popcount64(x):
+    """
+    Count the set bits of a 64-bit word with SWAR bit twiddling.
+    
+    Args:
+        x: np.uint64 word
+        
+    Returns:
+        Number of set bits
+    """
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+@njit(cache=True, boundscheck=False)
+def _count_confusion(predicted, actual, num_words):
+    """
+    Count true positives, false positives and false negatives of two bitmaps in one pass.
+    
+    Args:
+        predicted: np.uint64 bitmap of the numbers predicted to be prime
+        actual: np.uint64 bitmap of the known primes, aligned like predicted
+        num_words: Number of words to compare
+        
+    Returns:
+        Tuple of (true positives, false positives, false negatives)
+    """
+    true_positives = np.uint64(0)
+    false_positives = np.uint64(0)
+    false_negatives = np.uint64(0)
+    for i in range(num_words):
+        a = predicted[i]
+        b = actual[i]
+        true_positives += _popcount64(a & b)
+        false_positives += _popcount64(a & ~b)
+        false_negatives += _popcount64(~a & b)
+    
+    return true_positives, false_positives, false_negatives
+
+if not NUMBA_AVAILABLE:
+    def _count_confusion(predicted, actual, num_words):
+        """
+        Count true positives, false positives and false negatives of two bitmaps (vectorized fallback).
+        
+        Args:
+            predicted: np.uint64 bitmap of the numbers predicted to be prime
+            actual: np.uint64 bitmap of the known primes, aligned like predicted
+            num_words: Number of words to compare
+            
+        Returns:
+            Tuple of (true positives, false positives, false negatives)
+        """
+        predicted = predicted[:num_words]
+        actual = actual[:num_words]
+        return count_bits(predicted & actual), count_bits(predicted & ~actual), count_bits(~predicted & actual)
+
+def primes_to_bitmap(primes, limit):
+    """
+    Convert a collection of primes into a prime bitmap.
+    
+    Args:
+        primes: Iterable of prime numbers (numbers beyond limit are dropped)
+        limit: Upper limit covered by the bitmap
+        
+    Returns:
+        np.uint64 prime bitmap covering 0..limit
+    """
+    primes = np.fromiter(primes, dtype=np.int64)
+    primes = primes[(primes >= 0) & (primes <= limit)]
+    
+    bitmap = np.zeros(bit_words(limit + 1), dtype=np.uint64)
+    np.bitwise_or.at(bitmap, primes >> 6, np.uint64(1) << (primes & 63).astype(np.uint64))
+    return bitmap
+
+def wheel_to_bitmap(wheel, limit):
+    """
+    Expand a mod-30 wheel of primes into a prime bitmap over every number.
+    
+    Args:
+        wheel: np.uint8 wheel array with a bit set for every prime coprime to 30
+        limit: Upper limit covered by the bitmap
+        
+    Returns:
+        np.uint64 prime bitmap covering 0..limit, including 2, 3 and 5
+    """
+    bitmap = np.zeros(bit_words(limit + 1), dtype=np.uint64)
+    _wheel_to_bitmap(wheel, bitmap, limit)
+    for p in (2, 3, 5):
+        if p <= limit:
+            bitmap[0] |= np.uint64(1 << p)
+    return bitmap
+
+def bitmap_to_primes(bitmap, limit):
+    """
+    List the primes recorded in a prime bitmap.
+    
+    Args:
+        bitmap: np.uint64 prime bitmap
+        limit: Upper limit covered by the bitmap
+        
+    Returns:
+        np.ndarray of the primes up to the limit, in increasing order
+    """
+    return set_bit_indices(bitmap, limit + 1)
+
+# Small primes whose multiples are pre-sieved into every segment from a repeating pattern
+PRESIEVE_PRIMES = (2, 3, 5, 7, 11, 13)
+PRESIEVE_PERIOD = math.prod(PRESIEVE_PRIMES)
+
+# One period of the pattern: True for the numbers coprime to all the pre-sieve primes
+PRESIEVE_PATTERN = np.gcd(np.arange(PRESIEVE_PERIOD), PRESIEVE_PERIOD) == 1
+
+def sieve_segment(segment_start, segment_end, base_primes):
+    """
+    Sieve one segment of the number line into a prime bitmap.
+    
+    Args:
+        segment_start: First number of the segment
+        segment_end: Last number of the segment
+        base_primes: Increasing primes, including every prime up to sqrt(segment_end)
+        
+    Returns:
+        np.uint64 bitmap aligned to multiples of 64: bit (n & 63) of word
+        (n >> 6) - (segment_start >> 6) is set when n is prime
+    """
+    base = segment_start - (segment_start & 63)
+    size = (segment_end | 63) + 1 - base
+    
+    # Tile the pre-sieve pattern over the segment instead of crossing off the small primes
+    offset = base % PRESIEVE_PERIOD
+    segment_sieve = np.tile(PRESIEVE_PATTERN, (offset + size) // PRESIEVE_PERIOD + 1)[offset:offset + size]
+    segment_sieve[:max(segment_start, 2) - base] = False
+    segment_sieve[segment_end + 1 - base:] = False
+    for p in PRESIEVE_PRIMES:
+        if segment_start <= p <= segment_end:
+            segment_sieve[p - base] = True
+    
+    # Mark multiples of the remaining base primes in the segment
+    for p in base_primes:
+        if p * p > segment_end:
+            break
+        if p <= PRESIEVE_PRIMES[-1]:
+            continue
+        
+        # Find the first multiple of p in the segment (smaller multiples than p^2
+        # were already crossed off by smaller primes)
+        start_idx = max(p * p, (segment_start + p - 1) // p * p)
+        
+        # Mark multiples of p in the segment
+        segment_sieve[start_idx - base:segment_end + 1 - base:p] = False
+    
+    return np.packbits(segment_sieve, bitorder='little').view('<u8').astype(np.uint64, copy=False)
+
+def compare_prime_bitmaps(predicted, actual, word_base, max_misclassified):
+    """
+    Compare predicted and known primes given as word-aligned bitmaps.
+    
+    Args:
+        predicted: np.uint64 bitmap of the numbers predicted to be prime
+        actual: np.uint64 bitmap of the known primes, aligned like predicted
+        word_base: Number represented by bit 0 of the first word
+        max_misclassified: Maximum number of misclassified numbers to keep per kind
+        
+    Returns:
+        Dictionary with validation results for the compared numbers
+    """
+    # Count the confusion categories 64 numbers at a time
+    true_positives, false_positives, false_negatives = map(int, _count_confusion(predicted, actual, len(actual)))
+    
+    # Misclassified numbers (limited to avoid memory issues)
+    num_bits = 64 * len(actual)
+    false_positive_numbers = (set_bit_indices(predicted & ~actual, num_bits)[:max_misclassified] + word_base).tolist()
+    false_negative_numbers = (set_bit_indices(~predicted & actual, num_bits)[:max_misclassified] + word_base).tolist()
+    
+    # Compile results
+    results = {
+        "true_positives": true_positives,
+        "false_positives": false_positives,
+        "false_negatives": false_negatives,
+        "false_positive_numbers": false_positive_numbers,
+        "false_negative_numbers": false_negative_numbers
+    }
+    
+    return results
+
+#
+# Distributed Validation Workers
+#
+
+# Per-process state of a validation worker, set up once by _init_worker
+_WORKER_STATE = {}
+
+def _init_worker(validator, shm_name, shape, dtype, base_primes):
+    """
+    Set up a distributed validation worker process.
+    
+    Args:
+        validator: EnhancedPrimeValidator whose batch methods the worker runs
+        shm_name: Name of the shared memory block holding the prime bitmap
+            (None when every batch is sieved by its worker)
+        shape: Shape of the bitmap
+        dtype: Data type of the bitmap
+        base_primes: Primes up to sqrt(limit) for sieving the batches (None when
+            the bitmap is shared)
+    """
+    _WORKER_STATE["validator"] = validator
+    _WORKER_STATE["base_primes"] = base_primes
+    _WORKER_STATE["known_primes"] = None
+    
+    if shm_name is not None:
+        # Attach once and keep the block mapped for the life of the worker
+        shm = shared_memory.SharedMemory(name=shm_name)
+        _WORKER_STATE["shm"] = shm
+        _WORKER_STATE["known_primes"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+def _run_validation_task(batch):
+    """
+    Validate one batch in a worker process set up by _init_worker.
+    
+    Args:
+        batch: Tuple of (start, end) of the batch
+        
+    Returns:
+        Dictionary with validation results for the batch
+    """
+    start, end = batch
+    validator = _WORKER_STATE["validator"]
+    if _WORKER_STATE["known_primes"] is None:
+        return validator.validate_segment(start, end, _WORKER_STATE["base_primes"])
+    
+    return validator.validate_primality_test_batch(start, end, _WORKER_STATE["known_primes"])
+
 class EnhancedPrimeValidator:
     """
     An enhanced validator for prime number detection algorithms that compares results
@@ -66,8 +587,36 @@ class EnhancedPrimeValidator:
             "true_positives": 0,
             "false_positives": 0,
             "false_negatives": 0,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
+        
+        # Reuse one figure for every plot instead of allocating a new one each time
+        self.figure = plt.figure()
+    
+    def __getstate__(self):
+        """
+        Drop the figure when the validator is pickled for worker processes.
+        
+        Returns:
+            Dictionary of the instance attributes without the figure
+        """
+        state = self.__dict__.copy()
+        state["figure"] = None
+        return state
+    
+    def new_plot(self, figsize):
+        """
+        Clear the shared figure and add a fresh set of axes to it.
+        
+        Args:
+            figsize: Figure size in inches as (width, height)
+            
+        Returns:
+            The matplotlib Axes to draw on
+        """
+        self.figure.clf()
+        self.figure.set_size_inches(*figsize)
+        return self.figure.add_subplot()
     
     def generate_known_primes_standard(self, limit):
         """
@@ -78,23 +627,35 @@ class EnhancedPrimeValidator:
             limit: Upper limit for prime generation
             
         Returns:
-            Set of prime numbers up to the limit
+            np.uint64 prime bitmap covering 0..limit
         """
         print(f"Generating known primes up to {limit} using standard Sieve of Eratosthenes...")
         
-        # Initialize the sieve
-        sieve = np.ones(limit + 1, dtype=bool)
-        sieve[0:2] = False  # 0 and 1 are not prime
+        if PYPY and not NUMBA_AVAILABLE:
+            # Sieve bytes with plain Python, then pack them into the bitmap
+            packed = np.packbits(np.frombuffer(_sieve_pypy(limit), dtype=np.uint8), bitorder='little')
+            known_primes = np.zeros(bit_words(limit + 1), dtype=np.uint64)
+            known_primes.view(np.uint8)[:len(packed)] = packed
+            
+            print(f"Generated {count_bits(known_primes)} known primes")
+            return known_primes
+        
+        # Initialize the sieve with every even number but 2 marked composite
+        composite = np.full(bit_words(limit + 1), EVEN_BITS, dtype=np.uint64)
+        composite[0] |= np.uint64(0b10)  # 1 is not prime (0 is even)
+        composite[0] &= ~np.uint64(0b100)  # 2 is prime
         
-        # Apply the sieve
-        for i in tqdm(range(2, int(np.sqrt(limit)) + 1)):
-            if sieve[i]:
-                sieve[i*i::i] = False
+        # Sieve up to sqrt(limit), then cross off the multiples of those base primes on all cores
+        sqrt_limit = math.isqrt(limit)
+        _sieve_bits(composite, sqrt_limit)
+        base_primes = set_bit_indices(~composite, sqrt_limit + 1)
+        _cross_off_parallel(composite, base_primes[base_primes > 2], limit)
         
-        # Extract the primes
-        known_primes = set(np.where(sieve)[0])
+        # Flip into a prime bitmap, clearing the padding beyond the limit
+        known_primes = ~composite
+        known_primes[-1] &= ~np.uint64(0) >> np.uint64(63 - (limit & 63))
         
-        print(f"Generated {len(known_primes)} known primes")
+        print(f"Generated {count_bits(known_primes)} known primes")
         return known_primes
     
     def generate_known_primes_segmented(self, limit, segment_size=10000000):
@@ -107,48 +668,44 @@ class EnhancedPrimeValidator:
             segment_size: Size of each segment to process
             
         Returns:
-            Set of prime numbers up to the limit
+            np.uint64 prime bitmap covering 0..limit
         """
         print(f"Generating known primes up to {limit} using segmented Sieve of Eratosthenes...")
         
         # Find primes up to sqrt(limit) using standard sieve
-        sqrt_limit = int(math.sqrt(limit))
-        base_primes = self.generate_known_primes_standard(sqrt_limit)
-        
-        # Initialize the result set with the base primes
-        all_primes = set(base_primes)
+        base_primes = self.generate_base_primes(limit)
+        all_primes = np.zeros(bit_words(limit + 1), dtype=np.uint64)
         
         # Process segments
-        for segment_start in tqdm(range(sqrt_limit + 1, limit + 1, segment_size)):
+        for segment_start in tqdm(range(2, limit + 1, segment_size)):
             segment_end = min(segment_start + segment_size - 1, limit)
             
-            # Initialize segment sieve
-            segment_size_actual = segment_end - segment_start + 1
-            segment_sieve = np.ones(segment_size_actual, dtype=bool)
-            
-            # Mark multiples of base primes in the segment
-            for p in base_primes:
-                # Find the first multiple of p in the segment
-                start_idx = (segment_start + p - 1) // p * p
-                if start_idx < segment_start:
-                    start_idx += p
-                
-                # Mark multiples of p in the segment
-                for i in range(start_idx, segment_end + 1, p):
-                    segment_sieve[i - segment_start] = False
-            
-            # Extract primes from the segment
-            segment_primes = {i + segment_start for i, is_prime in enumerate(segment_sieve) if is_prime}
-            all_primes.update(segment_primes)
+            # Sieve the segment and record its primes in the bitmap
+            segment_bitmap = sieve_segment(segment_start, segment_end, base_primes)
+            first_word = segment_start >> 6
+            all_primes[first_word:first_word + len(segment_bitmap)] |= segment_bitmap
             
             # Free memory
             if self.low_memory:
-                del segment_sieve
+                del segment_bitmap
                 gc.collect()
         
-        print(f"Generated {len(all_primes)} known primes")
+        print(f"Generated {count_bits(all_primes)} known primes")
         return all_primes
     
+    def generate_base_primes(self, limit):
+        """
+        Generate the primes up to sqrt(limit), enough to sieve any segment up to the limit.
+        
+        Args:
+            limit: Upper limit of the numbers to be sieved
+            
+        Returns:
+            List of the primes up to sqrt(limit)
+        """
+        sqrt_limit = math.isqrt(limit)
+        return bitmap_to_primes(self.generate_known_primes_standard(sqrt_limit), sqrt_limit).tolist()
+    
     def generate_known_primes_bit_sieve(self, limit):
         """
         Generate a list of known prime numbers up to the given limit using
@@ -158,30 +715,23 @@ class EnhancedPrimeValidator:
             limit: Upper limit for prime generation
             
         Returns:
-            Set of prime numbers up to the limit
+            np.uint64 prime bitmap covering 0..limit
         """
         print(f"Generating known primes up to {limit} using bit-optimized Sieve of Eratosthenes...")
         
-        # We only need to track odd numbers (except 2)
-        # This cuts memory usage in half
-        sieve_size = (limit - 1) // 2
-        sieve = np.ones(sieve_size + 1, dtype=np.uint8)  # Use uint8 instead of bool for better memory usage
-        
-        # Apply the sieve for odd numbers
-        for i in tqdm(range(1, int(np.sqrt(limit)) // 2 + 1)):
-            if sieve[i]:
-                # Mark multiples of the current prime (2*i + 1)
-                p = 2 * i + 1
-                # Start from p^2, which is at index (p^2 - 1) // 2
-                start_idx = (p * p - 1) // 2
-                # Mark every p'th odd number as composite
-                sieve[start_idx::p] = 0
-        
-        # Extract the primes (2 and odd numbers where sieve is True)
-        known_primes = {2}  # Start with 2
-        known_primes.update({2 * i + 1 for i, is_prime in enumerate(sieve) if is_prime and i > 0})
-        
-        print(f"Generated {len(known_primes)} known primes")
+        # We only need to track the numbers coprime to 30, one bit each in a byte
+        # per 30 numbers, which skips 22 of every 30 candidates
+        wheel = np.zeros(limit // 30 + 1, dtype=np.uint8)
+        wheel[0] = WHEEL_MASKS[1]  # 1 is not prime
+        
+        # Cross off the multiples of the primes from 7 up to sqrt(limit) on all cores
+        base_primes = np.array(self.generate_base_primes(limit), dtype=np.int64)
+        _cross_off_wheel_parallel(wheel, base_primes[base_primes > 5])
+        
+        # Expand into a prime bitmap (2, 3, 5 and the numbers whose wheel bit is clear)
+        known_primes = wheel_to_bitmap(~wheel, limit)
+        
+        print(f"Generated {count_bits(known_primes)} known primes")
         return known_primes
     
     def generate_known_primes(self, limit, method='auto'):
@@ -189,19 +739,32 @@ class EnhancedPrimeValidator:
         Generate a list of known prime numbers up to the given limit using
         the most appropriate method based on the limit and available memory.
         
+        The bitmap is cached in the output directory, and later calls for the same
+        limit memory-map the cached file instead of sieving again.
+        
         Args:
             limit: Upper limit for prime generation
             method: Method to use ('standard', 'segmented', 'bit', or 'auto')
             
         Returns:
-            Set of prime numbers up to the limit
+            np.uint64 prime bitmap covering 0..limit (read-only when loaded from the cache)
         """
+        # Memory-map the cached bitmap if there is one (pages are read on demand)
+        cache_file = os.path.join(self.output_dir, f"primes_bitmap_{limit}.bin")
+        num_words = bit_words(limit + 1)
+        if os.path.exists(cache_file) and os.path.getsize(cache_file) == num_words * 8:
+            print(f"Loading known primes up to {limit} from {cache_file}")
+            return np.memmap(cache_file, dtype=np.uint64, mode='r', shape=(num_words,))
+        
         if method == 'standard' or (method == 'auto' and limit <= 10000000 and not self.low_memory):
-            return self.generate_known_primes_standard(limit)
+            known_primes = self.generate_known_primes_standard(limit)
         elif method == 'bit' or (method == 'auto' and limit <= 100000000):
-            return self.generate_known_primes_bit_sieve(limit)
+            known_primes = self.generate_known_primes_bit_sieve(limit)
         else:  # segmented or auto with large limit
-            return self.generate_known_primes_segmented(limit)
+            known_primes = self.generate_known_primes_segmented(limit)
+        
+        known_primes.tofile(cache_file)
+        return known_primes
     
     def load_known_primes_from_file(self, filepath):
         """
@@ -232,23 +795,52 @@ class EnhancedPrimeValidator:
         print(f"Loaded {len(known_primes)} known primes from file")
         return known_primes
     
-    def save_checkpoint(self, checkpoint_data, limit):
+    def checkpoint_files(self, limit):
         """
-        Save checkpoint data to a file.
+        Get the paths of the checkpoint files for a validation limit.
+        
+        Args:
+            limit: Upper limit for validation
+            
+        Returns:
+            Tuple of (record file, false positive numbers file, false negative numbers file)
+        """
+        prefix = os.path.join(self.output_dir, f"checkpoint_{limit}")
+        return f"{prefix}.bin", f"{prefix}_false_positives.bin", f"{prefix}_false_negatives.bin"
+    
+    def save_checkpoint(self, checkpoint_data, limit, false_positive_numbers=(), false_negative_numbers=()):
+        """
+        Append checkpoint data to the checkpoint files.
+        
+        Each call appends one fixed-size record, and the misclassified numbers found since
+        the previous call go to their own files, so saving never rewrites earlier data.
         
         Args:
             checkpoint_data: Dictionary containing checkpoint data
             limit: Upper limit for validation
+            false_positive_numbers: False positive numbers found since the last checkpoint
+            false_negative_numbers: False negative numbers found since the last checkpoint
         """
-        checkpoint_file = os.path.join(self.output_dir, f"checkpoint_{limit}.pkl")
-        with open(checkpoint_file, 'wb') as f:
-            pickle.dump(checkpoint_data, f)
+        checkpoint_file, false_positive_file, false_negative_file = self.checkpoint_files(limit)
+        with open(checkpoint_file, 'ab') as f:
+            f.write(CHECKPOINT_RECORD.pack(
+                checkpoint_data["last_processed"],
+                checkpoint_data["true_positives"],
+                checkpoint_data["false_positives"],
+                checkpoint_data["false_negatives"],
+                checkpoint_data["timestamp"]
+            ))
+        
+        with open(false_positive_file, 'ab') as f:
+            np.asarray(false_positive_numbers, dtype=np.int64).tofile(f)
+        with open(false_negative_file, 'ab') as f:
+            np.asarray(false_negative_numbers, dtype=np.int64).tofile(f)
         
         print(f"Saved checkpoint to {checkpoint_file}")
     
     def load_checkpoint(self, limit):
         """
-        Load checkpoint data from a file.
+        Load the latest checkpoint data from the checkpoint files.
         
         Args:
             limit: Upper limit for validation
@@ -256,11 +848,24 @@ class EnhancedPrimeValidator:
         Returns:
             Dictionary containing checkpoint data, or None if no checkpoint exists
         """
-        checkpoint_file = os.path.join(self.output_dir, f"checkpoint_{limit}.pkl")
+        checkpoint_file, false_positive_file, false_negative_file = self.checkpoint_files(limit)
         if os.path.exists(checkpoint_file):
             try:
+                # The latest record is the last one in the file
                 with open(checkpoint_file, 'rb') as f:
-                    checkpoint_data = pickle.load(f)
+                    f.seek(-CHECKPOINT_RECORD.size, os.SEEK_END)
+                    last_processed, true_positives, false_positives, false_negatives, timestamp = \
+                        CHECKPOINT_RECORD.unpack(f.read(CHECKPOINT_RECORD.size))
+                
+                checkpoint_data = {
+                    "last_processed": last_processed,
+                    "true_positives": true_positives,
+                    "false_positives": false_positives,
+                    "false_negatives": false_negatives,
+                    "timestamp": timestamp,
+                    "false_positive_numbers": np.fromfile(false_positive_file, dtype=np.int64).tolist(),
+                    "false_negative_numbers": np.fromfile(false_negative_file, dtype=np.int64).tolist()
+                }
                 
                 print(f"Loaded checkpoint from {checkpoint_file}")
                 print(f"Resuming from {checkpoint_data['last_processed']}")
@@ -272,61 +877,47 @@ class EnhancedPrimeValidator:
             print("No checkpoint found, starting from scratch")
             return None
     
-    def validate_primality_test_batch(self, start, end, known_primes):
+    def validate_primality_test_batch(self, start, end, known_primes, max_misclassified=100):
         """
         Validate the primality test against known primes for a batch of numbers.
         
         Args:
             start: Start of the batch
             end: End of the batch
-            known_primes: Set of known primes
+            known_primes: np.uint64 prime bitmap covering at least 0..end
+            max_misclassified: Maximum number of misclassified numbers to keep per kind
             
         Returns:
             Dictionary with validation results for the batch
         """
-        # Initialize counters
-        true_positives = 0
-        false_positives = 0
-        false_negatives = 0
+        # Check the whole batch using our classifier (same word alignment as the bitmap)
+        predicted = self.classifier.is_prime_batch(start, end)
         
-        # Lists to store misclassified numbers
-        false_positive_numbers = []
-        false_negative_numbers = []
+        # Cut the known primes down to the batch
+        actual = known_primes[start >> 6:(end >> 6) + 1].copy()
+        actual[0] &= ~np.uint64(0) << np.uint64(start & 63)
+        actual[-1] &= ~np.uint64(0) >> np.uint64(63 - (end & 63))
         
-        # Validate each number in the batch
-        for n in range(start, end + 1):
-            # Skip even numbers except 2 for efficiency
-            if n > 2 and n % 2 == 0:
-                continue
-            
-            # Check if prime using our classifier
-            is_prime = self.classifier.is_prime(n)
-            
-            # Check against known primes
-            is_known_prime = n in known_primes
-            
-            # Update counters
-            if is_prime and is_known_prime:
-                true_positives += 1
-            elif is_prime and not is_known_prime:
-                false_positives += 1
-                if len(false_positive_numbers) < 100:  # Limit to avoid memory issues
-                    false_positive_numbers.append(n)
-            elif not is_prime and is_known_prime:
-                false_negatives += 1
-                if len(false_negative_numbers) < 100:  # Limit to avoid memory issues
-                    false_negative_numbers.append(n)
+        return compare_prime_bitmaps(predicted, actual, start - (start & 63), max_misclassified)
+    
+    def validate_segment(self, segment_start, segment_end, base_primes, max_misclassified=100):
+        """
+        Sieve a segment and validate the primality test against it in one pass,
+        so the known primes never have to be held for more than one segment.
         
-        # Compile results
-        results = {
-            "true_positives": true_positives,
-            "false_positives": false_positives,
-            "false_negatives": false_negatives,
-            "false_positive_numbers": false_positive_numbers,
-            "false_negative_numbers": false_negative_numbers
-        }
+        Args:
+            segment_start: Start of the segment
+            segment_end: End of the segment
+            base_primes: Increasing primes, including every prime up to sqrt(segment_end)
+            max_misclassified: Maximum number of misclassified numbers to keep per kind
+            
+        Returns:
+            Dictionary with validation results for the segment
+        """
+        actual = sieve_segment(segment_start, segment_end, base_primes)
+        predicted = self.classifier.is_prime_batch(segment_start, segment_end)
         
-        return results
+        return compare_prime_bitmaps(predicted, actual, segment_start - (segment_start & 63), max_misclassified)
     
     def validate_primality_test_distributed(self, limit, known_primes, batch_size=1000000, num_processes=None):
         """
@@ -334,7 +925,8 @@ class EnhancedPrimeValidator:
         
         Args:
             limit: Upper limit for validation
-            known_primes: Set of known primes
+            known_primes: np.uint64 prime bitmap covering 0..limit
+                (if None, every batch is sieved by its worker)
             batch_size: Size of each batch to process
             num_processes: Number of processes to use (default: number of CPU cores)
             
@@ -349,44 +941,58 @@ class EnhancedPrimeValidator:
         
         print(f"Using {num_processes} processes with batch size {batch_size}")
         
-        # Create batches
+        # Create batches that shrink as the remaining work runs out, so the last
+        # batches are small and no worker is left alone with a full-size one
         batches = []
-        for batch_start in range(2, limit + 1, batch_size):
-            batch_end = min(batch_start + batch_size - 1, limit)
+        batch_start = 2
+        while batch_start <= limit:
+            remaining = limit - batch_start + 1
+            size = min(batch_size, max(MIN_BATCH_SIZE, remaining // (2 * num_processes)))
+            batch_end = min(batch_start + size - 1, limit)
             batches.append((batch_start, batch_end))
+            batch_start = batch_end + 1
         
-        # Create a pool of processes
-        with mp.Pool(processes=num_processes) as pool:
-            # Process batches in parallel
-            batch_results = list(tqdm(
-                pool.starmap(
-                    partial(self.validate_primality_test_batch, known_primes=known_primes),
-                    batches
-                ),
-                total=len(batches)
-            ))
+        # Each worker receives the validator and either the small base primes or the
+        # shared bitmap once, when it starts; the tasks themselves are just (start, end)
+        shm = None
+        if known_primes is None:
+            worker_args = (self, None, None, None, self.generate_base_primes(limit))
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=known_primes.nbytes)
+            np.ndarray(known_primes.shape, dtype=known_primes.dtype, buffer=shm.buf)[:] = known_primes
+            worker_args = (self, shm.name, known_primes.shape, known_primes.dtype.str, None)
         
-        # Combine results
-        true_positives = sum(result["true_positives"] for result in batch_results)
-        false_positives = sum(result["false_positives"] for result in batch_results)
-        false_negatives = sum(result["false_negatives"] for result in batch_results)
+        # Combine results as they arrive
+        true_positives = 0
+        false_positives = 0
+        false_negatives = 0
         
-        # Combine misclassified numbers (limited to avoid memory issues)
+        # Misclassified numbers (limited to avoid memory issues). Batches finish in any
+        # order, so keep the smallest ones: the first 1000 in batch order.
         false_positive_numbers = []
         false_negative_numbers = []
         
-        for result in batch_results:
-            false_positive_numbers.extend(result["false_positive_numbers"][:100])
-            false_negative_numbers.extend(result["false_negative_numbers"][:100])
-            
-            if len(false_positive_numbers) >= 1000:
-                false_positive_numbers = false_positive_numbers[:1000]
-            
-            if len(false_negative_numbers) >= 1000:
-                false_negative_numbers = false_negative_numbers[:1000]
-        
-        # Calculate metrics
-        total_known_primes = len([p for p in known_primes if p <= limit])
+        try:
+            # Create a pool of spawned processes (forking after the parallel sieve has
+            # started Numba's worker threads can deadlock the children)
+            with mp.get_context('spawn').Pool(processes=num_processes, initializer=_init_worker,
+                                              initargs=worker_args) as pool:
+                # Process batches in parallel, handing them out one at a time as workers free up
+                for result in tqdm(pool.imap_unordered(_run_validation_task, batches, chunksize=1),
+                                   total=len(batches)):
+                    true_positives += result["true_positives"]
+                    false_positives += result["false_positives"]
+                    false_negatives += result["false_negatives"]
+                    
+                    false_positive_numbers = heapq.nsmallest(1000, false_positive_numbers + result["false_positive_numbers"][:100])
+                    false_negative_numbers = heapq.nsmallest(1000, false_negative_numbers + result["false_negative_numbers"][:100])
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+        
+        # Calculate metrics (every sieved prime is either found or missed)
+        total_known_primes = true_positives + false_negatives if known_primes is None else count_bits(known_primes)
         precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
         recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
         f1_score = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
@@ -416,7 +1022,8 @@ class EnhancedPrimeValidator:
         
         Args:
             limit: Upper limit for validation
-            known_primes: Set of known primes (if None, will be generated)
+            known_primes: np.uint64 prime bitmap or collection of known primes
+                (if None, every batch is sieved as it is validated)
             use_checkpoint: Whether to use checkpointing
             batch_size: Size of each batch to process
             distributed: Whether to use distributed processing
@@ -426,23 +1033,28 @@ class EnhancedPrimeValidator:
         """
         print(f"Validating primality test up to {limit}...")
         
-        # Get known primes if not provided
-        if known_primes is None:
-            if self.low_memory:
-                known_primes = self.generate_known_primes(limit, method='segmented')
-            else:
-                known_primes = self.generate_known_primes(limit)
+        # Convert provided known primes into a bitmap
+        if known_primes is not None and not isinstance(known_primes, np.ndarray):
+            known_primes = primes_to_bitmap(known_primes, limit)
         
         # Use distributed processing if requested
         if distributed:
             return self.validate_primality_test_distributed(limit, known_primes, batch_size)
         
+        # Without known primes, only the primes up to sqrt(limit) are kept in memory
+        if known_primes is None:
+            base_primes = self.generate_base_primes(limit)
+        
         # Load checkpoint if requested
         start = 2
         true_positives = 0
         false_positives = 0
         false_negatives = 0
         
+        # Lists to store misclassified numbers
+        false_positive_numbers = []
+        false_negative_numbers = []
+        
         if use_checkpoint:
             checkpoint_data = self.load_checkpoint(limit)
             if checkpoint_data:
@@ -450,39 +1062,30 @@ class EnhancedPrimeValidator:
                 true_positives = checkpoint_data["true_positives"]
                 false_positives = checkpoint_data["false_positives"]
                 false_negatives = checkpoint_data["false_negatives"]
-        
-        # Lists to store misclassified numbers
-        false_positive_numbers = []
-        false_negative_numbers = []
+                false_positive_numbers = checkpoint_data["false_positive_numbers"]
+                false_negative_numbers = checkpoint_data["false_negative_numbers"]
         
         # Process in batches
         for batch_start in range(start, limit + 1, batch_size):
             batch_end = min(batch_start + batch_size - 1, limit)
             print(f"Processing batch {batch_start}-{batch_end}...")
             
-            # Validate each number in the batch
-            for n in tqdm(range(batch_start, batch_end + 1)):
-                # Skip even numbers except 2 for efficiency
-                if n > 2 and n % 2 == 0:
-                    continue
-                
-                # Check if prime using our classifier
-                is_prime = self.classifier.is_prime(n)
-                
-                # Check against known primes
-                is_known_prime = n in known_primes
-                
-                # Update counters
-                if is_prime and is_known_prime:
-                    true_positives += 1
-                elif is_prime and not is_known_prime:
-                    false_positives += 1
-                    if len(false_positive_numbers) < 1000:  # Limit to avoid memory issues
-                        false_positive_numbers.append(n)
-                elif not is_prime and is_known_prime:
-                    false_negatives += 1
-                    if len(false_negative_numbers) < 1000:  # Limit to avoid memory issues
-                        false_negative_numbers.append(n)
+            # Validate the whole batch, sieving it first if no known primes were provided
+            if known_primes is None:
+                batch_results = self.validate_segment(batch_start, batch_end, base_primes, max_misclassified=1000)
+            else:
+                batch_results = self.validate_primality_test_batch(batch_start, batch_end, known_primes, max_misclassified=1000)
+            
+            # Update counters
+            true_positives += batch_results["true_positives"]
+            false_positives += batch_results["false_positives"]
+            false_negatives += batch_results["false_negatives"]
+            
+            # Keep the first misclassified numbers (limited to avoid memory issues)
+            new_false_positives = batch_results["false_positive_numbers"][:1000 - len(false_positive_numbers)]
+            new_false_negatives = batch_results["false_negative_numbers"][:1000 - len(false_negative_numbers)]
+            false_positive_numbers.extend(new_false_positives)
+            false_negative_numbers.extend(new_false_negatives)
             
             # Save checkpoint after each batch if requested
             if use_checkpoint:
@@ -491,16 +1094,16 @@ class EnhancedPrimeValidator:
                     "true_positives": true_positives,
                     "false_positives": false_positives,
                     "false_negatives": false_negatives,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": time.time()
                 }
-                self.save_checkpoint(self.checkpoint_data, limit)
+                self.save_checkpoint(self.checkpoint_data, limit, new_false_positives, new_false_negatives)
             
             # Free memory if in low memory mode
             if self.low_memory:
                 gc.collect()
         
-        # Calculate metrics
-        total_known_primes = len([p for p in known_primes if p <= limit])
+        # Calculate metrics (every sieved prime is either found or missed)
+        total_known_primes = true_positives + false_negatives if known_primes is None else count_bits(known_primes)
         precision = true_positives / (true_positives + false_positives) if (true_positives + false_positives) > 0 else 0
         recall = true_positives / (true_positives + false_negatives) if (true_positives + false_negatives) > 0 else 0
         f1_score = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
@@ -584,32 +1187,31 @@ class EnhancedPrimeValidator:
             results: Dictionary containing validation results
         """
         # Create performance metrics visualization
-        plt.figure(figsize=(10, 6))
+        ax = self.new_plot((10, 6))
         
         # Bar chart of performance metrics
         metrics = ['Precision', 'Recall', 'F1 Score', 'Accuracy']
         values = [results['precision'], results['recall'], results['f1_score'], results['accuracy']]
         colors = ['blue', 'green', 'red', 'purple']
         
-        plt.bar(metrics, values, color=colors)
-        plt.title('Primality Test Performance Metrics')
-        plt.ylabel('Score')
-        plt.ylim(0, 1.1)  # Metrics are between 0 and 1
-        plt.grid(True, linestyle='--', alpha=0.7, axis='y')
+        ax.bar(metrics, values, color=colors)
+        ax.set_title('Primality Test Performance Metrics')
+        ax.set_ylabel('Score')
+        ax.set_ylim(0, 1.1)  # Metrics are between 0 and 1
+        ax.grid(True, linestyle='--', alpha=0.7, axis='y')
         
         # Add value labels on top of bars
         for i, v in enumerate(values):
-            plt.text(i, v + 0.02, f"{v:.4f}", ha='center')
+            ax.text(i, v + 0.02, f"{v:.4f}", ha='center')
         
         # Save the plot
         filepath = os.path.join(self.output_dir, 'validation_metrics.png')
-        plt.savefig(filepath)
-        plt.close()
+        self.figure.savefig(filepath)
         
         print(f"Saved validation metrics visualization to {filepath}")
         
         # Create confusion matrix visualization
-        plt.figure(figsize=(8, 8))
+        ax = self.new_plot((8, 8))
         
         # Confusion matrix
         cm = np.array([
@@ -617,31 +1219,30 @@ class EnhancedPrimeValidator:
             [results['false_positives'], 0]  # We don't track true negatives
         ])
         
-        plt.imshow(cm, interpolation='nearest', cmap=plt.cm.Blues)
-        plt.title('Confusion Matrix')
-        plt.colorbar()
+        image = ax.imshow(cm, interpolation='nearest', cmap=plt.cm.Blues)
+        ax.set_title('Confusion Matrix')
+        self.figure.colorbar(image, ax=ax)
         
         # Add labels
         classes = ['Prime', 'Not Prime']
         tick_marks = np.arange(len(classes))
-        plt.xticks(tick_marks, classes)
-        plt.yticks(tick_marks, classes)
+        ax.set_xticks(tick_marks, classes)
+        ax.set_yticks(tick_marks, classes)
         
         # Add text annotations
         thresh = cm.max() / 2.
         for i in range(cm.shape[0]):
             for j in range(cm.shape[1]):
-                plt.text(j, i, format(cm[i, j], 'd'),
+                ax.text(j, i, format(cm[i, j], 'd'),
                         ha="center", va="center",
                         color="white" if cm[i, j] > thresh else "black")
         
-        plt.ylabel('Actual')
-        plt.xlabel('Predicted')
+        ax.set_ylabel('Actual')
+        ax.set_xlabel('Predicted')
         
         # Save the plot
         filepath = os.path.join(self.output_dir, 'confusion_matrix.png')
-        plt.savefig(filepath)
-        plt.close()
+        self.figure.savefig(filepath)
         
         print(f"Saved confusion matrix visualization to {filepath}")
     
@@ -671,7 +1272,7 @@ class EnhancedPrimeValidator:
             known_primes = extended_primes
         else:
             # Filter the OEIS primes up to the limit
-            known_primes = set(p for p in oeis_primes if p <= limit)
+            known_primes = primes_to_bitmap(oeis_primes, limit)
         
         # Run validation
         return self.validate_primality_test(limit, known_primes)
@@ -715,25 +1316,24 @@ class EnhancedPrimeValidator:
         accuracies = [all_results[limit]['accuracy'] for limit in limits]
         
         # Create the plot
-        plt.figure(figsize=(12, 8))
+        ax = self.new_plot((12, 8))
         
         # Plot metrics vs limit
-        plt.plot(limits, precisions, 'bo-', label='Precision')
-        plt.plot(limits, recalls, 'go-', label='Recall')
-        plt.plot(limits, f1_scores, 'ro-', label='F1 Score')
-        plt.plot(limits, accuracies, 'mo-', label='Accuracy')
-        
-        plt.title('Performance Metrics vs. Validation Limit')
-        plt.xlabel('Validation Limit')
-        plt.ylabel('Score')
-        plt.xscale('log')  # Log scale for x-axis
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend()
+        ax.plot(limits, precisions, 'bo-', label='Precision')
+        ax.plot(limits, recalls, 'go-', label='Recall')
+        ax.plot(limits, f1_scores, 'ro-', label='F1 Score')
+        ax.plot(limits, accuracies, 'mo-', label='Accuracy')
+        
+        ax.set_title('Performance Metrics vs. Validation Limit')
+        ax.set_xlabel('Validation Limit')
+        ax.set_ylabel('Score')
+        ax.set_xscale('log')  # Log scale for x-axis
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.legend()
         
         # Save the plot
         filepath = os.path.join(self.output_dir, 'scaling_behavior.png')
-        plt.savefig(filepath)
-        plt.close()
+        self.figure.savefig(filepath)
         
         print(f"Saved scaling behavior visualization to {filepath}")
 
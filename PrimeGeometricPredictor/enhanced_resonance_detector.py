@@ -8,13 +8,8 @@ capabilities, focusing on harmonic relationships and octave classification of pr
 
 import numpy as np
 import math
-import decimal
-from collections import defaultdict
 import os
 
-# Set decimal precision for handling extremely large numbers
-decimal.getcontext().prec = 100
-
 # Constants derived from the UFRF framework
 PHI = (1 + 5**0.5) / 2  # Golden ratio
 SYSTEM_BOUNDARY = 99779  # Key boundary from Riemann Hypothesis proof
@@ -29,33 +24,36 @@ THIRD_SYSTEM_END = DIMENSIONAL_FACTOR * 2**15   # End of third system
 FUNDAMENTAL_FREQUENCY = 1.0 / SYSTEM_BOUNDARY
 OCTAVE_RATIO = 2.0  # Frequency ratio between octaves
 
-# Check if MPS (Metal Performance Shaders) is available for Mac M2
+# Loop-invariant values of the per-prime analysis
+_OCTAVE_POWERS = OCTAVE_RATIO ** np.arange(4)  # Frequency multiplier of octaves 0-3
+_GOLDEN_ANGLE_RAD = 2 * math.pi / (PHI * PHI)
+
+# Octave pairs in the order of the cross-octave resonance arrays:
+# the fundamental against octaves 1-3, then the pairs of higher octaves
+_OCT_PAIRS = ((0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3))
+
+# Classifications in the order of their class ids
+_CLASSIFICATIONS = ("outer_octave", "inner_octave", "cross_resonant")
+_CROSS_RESONANT = 2
+
+# Angular relationships in the order of the angular relationship arrays
+_ANGULAR_KEYS = ("golden_ratio", "system_level", "position", "cycle", "coherence")
+
+# Check if Numba is available for JIT compilation
 try:
-    import torch
-    if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-        USE_MPS = True
-        print("Using MPS (Metal Performance Shaders) for Mac M2 acceleration")
-        
-        # Initialize MPS device
-        mps_device = torch.device("mps")
-        
-        # Function to move tensor to MPS
-        def to_mps(tensor):
-            return tensor.to(mps_device)
-    else:
-        USE_MPS = False
-        print("MPS not available, using CPU instead (code is still M2-compatible)")
-        
-        # Dummy function when MPS is not available
-        def to_mps(tensor):
-            return tensor
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
 except ImportError:
-    USE_MPS = False
-    print("PyTorch not available, using CPU only")
+    NUMBA_AVAILABLE = False
+    print("Numba not available, resonance kernels will run as plain Python")
     
-    # Dummy function when PyTorch is not available
-    def to_mps(tensor):
-        return tensor
+    # Dummy decorator and range when Numba is not available
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
 
 def safe_log2(n):
     """
@@ -67,18 +65,14 @@ def safe_log2(n):
     Returns:
         The log2 value
     """
-    # For extremely large numbers, use decimal module
-    if n > 1e100:
-        # Convert to Decimal for high precision
-        d_n = decimal.Decimal(str(n))
-        
-        # Calculate log2 using the relation log2(n) = log10(n) / log10(2)
-        d_log2 = d_n.ln() / decimal.Decimal(2).ln()
-        
-        return float(d_log2)
-    else:
-        # For smaller numbers, use standard math.log2
-        return math.log2(n)
+    # For integers beyond double precision, keep the top 53 bits:
+    # log2(n) = shift + log2(n >> shift)
+    if isinstance(n, int) and n.bit_length() > 53:
+        shift = n.bit_length() - 53
+        return shift + math.log2(n >> shift)
+    
+    # For smaller numbers (and floats), use standard math.log2
+    return math.log2(n)
 
 def ufrf_dimensional_mapping(n):
     """
@@ -128,6 +122,36 @@ def ufrf_dimensional_mapping(n):
     
     return (system_level, dimension, position, cycle, metacycle)
 
+# Numbers below this convert to float64 exactly, so array arithmetic matches the scalar mapping
+_EXACT_FLOAT_LIMIT = 2**53
+
+def ufrf_dimensional_mapping_batch(numbers):
+    """
+    Map many positive numbers to the UFRF dimensional structure at once.
+    
+    Args:
+        numbers: np.ndarray of positive integers (np.int64)
+        
+    Returns:
+        A tuple of np.int64 arrays (system_level, dimension, position, cycle, metacycle)
+    """
+    # Using the UFRF dimensional formula: D_n = 13 × 2^(n-1)
+    system_level = np.maximum(1, np.floor(np.log2(numbers / DIMENSIONAL_FACTOR)) + 1).astype(np.int64)
+    dimension = numbers % (DIMENSIONAL_FACTOR << (system_level - 1))
+    position = dimension % DIMENSIONAL_FACTOR + 1
+    
+    # Calculate cycle and metacycle
+    cycle = np.floor(dimension / DIMENSIONAL_FACTOR).astype(np.int64)
+    metacycle = np.floor(cycle / DIMENSIONAL_FACTOR).astype(np.int64)
+    
+    mapping = np.stack((system_level, dimension, position, cycle, metacycle))
+    
+    # Numbers that do not fit a float64 exactly go through the scalar mapping
+    for i in np.flatnonzero(numbers >= _EXACT_FLOAT_LIMIT):
+        mapping[:, i] = ufrf_dimensional_mapping(int(numbers[i]))
+    
+    return tuple(mapping)
+
 def calculate_harmonic_frequency(n):
     """
     Calculate the harmonic frequency of a number relative to the system boundary.
@@ -167,167 +191,349 @@ def identify_harmonic_octave(n):
     
     return octave
 
-def calculate_cross_octave_resonance(n):
+@njit(cache=True, fastmath=True)
+def _cross_octave_resonance(frequency):
     """
-    Calculate how strongly a number resonates across different octaves.
+    Calculate how strongly a harmonic frequency resonates across different octaves.
     
     Args:
-        n: The number to analyze
+        frequency: The harmonic frequency of a number
         
     Returns:
-        A dictionary mapping octave pairs to resonance strength
+        np.ndarray of the resonance strengths of the octave pairs in _OCT_PAIRS
     """
-    # Get dimensional mapping
-    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
-    
-    # Calculate harmonic frequency
-    frequency = calculate_harmonic_frequency(n)
-    
-    # Calculate resonance across octaves
-    resonance_map = {}
+    resonance = np.empty(6)
     
     # Check resonance between fundamental and higher octaves
     for octave in range(1, 4):  # Check first 3 octaves
-        # Calculate frequency in this octave
-        octave_frequency = frequency * (OCTAVE_RATIO ** octave)
-        normalized_octave_frequency = octave_frequency % 1.0
-        
         # Calculate resonance (closer to 0 means stronger resonance)
-        resonance = 1.0 - abs(frequency - normalized_octave_frequency)
-        
-        # Store in map
-        resonance_map[(0, octave)] = resonance
+        normalized_octave_frequency = frequency * _OCTAVE_POWERS[octave] % 1.0
+        resonance[octave - 1] = 1.0 - abs(frequency - normalized_octave_frequency)
     
     # Check resonance between adjacent octaves
+    k = 3
     for octave1 in range(1, 3):
         for octave2 in range(octave1 + 1, 4):
-            # Calculate frequencies in these octaves
-            octave1_frequency = frequency * (OCTAVE_RATIO ** octave1) % 1.0
-            octave2_frequency = frequency * (OCTAVE_RATIO ** octave2) % 1.0
-            
-            # Calculate resonance
-            resonance = 1.0 - abs(octave1_frequency - octave2_frequency)
-            
-            # Store in map
-            resonance_map[(octave1, octave2)] = resonance
+            octave1_frequency = frequency * _OCTAVE_POWERS[octave1] % 1.0
+            octave2_frequency = frequency * _OCTAVE_POWERS[octave2] % 1.0
+            resonance[k] = 1.0 - abs(octave1_frequency - octave2_frequency)
+            k += 1
     
-    return resonance_map
+    return resonance
 
-def classify_prime_by_octave(n):
+def calculate_cross_octave_resonance(n):
     """
-    Classify a prime number as inner or outer octave based on its resonance patterns.
+    Calculate how strongly a number resonates across different octaves.
     
     Args:
-        n: The number to classify (assumed to be prime)
+        n: The number to analyze
         
     Returns:
-        A string classification: "inner_octave", "outer_octave", or "cross_resonant"
+        A dictionary mapping octave pairs to resonance strength
     """
-    # Calculate cross-octave resonance
-    resonance_map = calculate_cross_octave_resonance(n)
-    
-    # Calculate average resonance
-    avg_resonance = sum(resonance_map.values()) / len(resonance_map)
-    
-    # Calculate resonance between fundamental and first octave
-    fundamental_first_resonance = resonance_map.get((0, 1), 0)
+    resonance = _cross_octave_resonance(calculate_harmonic_frequency(n))
+    return dict(zip(_OCT_PAIRS, resonance.tolist()))
+
+def _classify_from_resonance(resonance):
+    """
+    Classify a prime number from its cross-octave resonance.
     
-    # Calculate maximum resonance between any octaves
-    max_resonance = max(resonance_map.values())
-    max_resonance_pair = max(resonance_map.items(), key=lambda x: x[1])[0]
+    Args:
+        resonance: np.ndarray of resonance strengths of the octave pairs in _OCT_PAIRS
+        
+    Returns:
+        A string classification: "inner_octave", "outer_octave", or "cross_resonant"
+    """
+    # Maximum resonance between any octaves (the first pair wins ties)
+    strongest = int(resonance.argmax())
     
     # Classify based on resonance patterns
-    if max_resonance > 0.8 and max_resonance_pair != (0, 1):
+    if resonance[strongest] > 0.8 and _OCT_PAIRS[strongest] != (0, 1):
         # Strong resonance between non-adjacent octaves
         return "cross_resonant"
-    elif fundamental_first_resonance > 0.7:
+    elif resonance[0] > 0.7:
         # Strong resonance between fundamental and first octave
         return "inner_octave"
     else:
         # Weaker resonance or resonance in higher octaves
         return "outer_octave"
 
-def analyze_angular_relationships(n):
+def _cross_octave_resonance_batch(frequencies):
     """
-    Analyze the angular relationships of a number across different dimensions.
+    Calculate the cross-octave resonances of many harmonic frequencies at once.
     
     Args:
-        n: The number to analyze
+        frequencies: np.ndarray of harmonic frequencies
         
     Returns:
-        A dictionary of angular relationships
+        np.ndarray of shape (len(frequencies), 6), with the columns in _OCT_PAIRS order
     """
-    # Get dimensional mapping
-    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    # Frequencies in octaves 1-3
+    octave_frequencies = frequencies[:, None] * _OCTAVE_POWERS[1:] % 1.0
+    
+    resonance = np.empty((len(frequencies), 6))
+    resonance[:, :3] = 1.0 - np.abs(frequencies[:, None] - octave_frequencies)
+    resonance[:, 3] = 1.0 - np.abs(octave_frequencies[:, 0] - octave_frequencies[:, 1])
+    resonance[:, 4] = 1.0 - np.abs(octave_frequencies[:, 0] - octave_frequencies[:, 2])
+    resonance[:, 5] = 1.0 - np.abs(octave_frequencies[:, 1] - octave_frequencies[:, 2])
+    
+    return resonance
+
+def calculate_cross_octave_resonance_batch(numbers):
+    """
+    Calculate how strongly many numbers resonate across different octaves at once.
+    
+    Args:
+        numbers: np.ndarray of the numbers to analyze
+        
+    Returns:
+        np.ndarray of shape (len(numbers), 6), with the columns in _OCT_PAIRS order
+    """
+    return _cross_octave_resonance_batch(calculate_harmonic_frequency(numbers))
+
+def _classify_resonance_batch(resonance):
+    """
+    Classify many primes from their cross-octave resonances without branching.
+    
+    The rules of _classify_from_resonance become masks: cross-resonant when the
+    strongest pair resonates above 0.8 and is not the fundamental-first pair, else
+    inner octave when the fundamental-first resonance is above 0.7.
+    
+    Args:
+        resonance: np.ndarray of shape (N, 6), with the columns in _OCT_PAIRS order
+        
+    Returns:
+        np.ndarray of N class ids (indices into _CLASSIFICATIONS)
+    """
+    cross = (resonance.max(axis=1) > 0.8) & (resonance.argmax(axis=1) != 0)
+    inner = ~cross & (resonance[:, 0] > 0.7)
+    return np.where(cross, _CROSS_RESONANT, np.where(inner, 1, 0)).astype(np.int8)
+
+def classify_prime_by_octave(n):
+    """
+    Classify a prime number as inner or outer octave based on its resonance patterns.
+    
+    Args:
+        n: The number to classify (assumed to be prime)
+        
+    Returns:
+        A string classification: "inner_octave", "outer_octave", or "cross_resonant"
+    """
+    # Classify from the cross-octave resonance array
+    return _fast_classify(calculate_harmonic_frequency(n))
+
+# Fundamental-first resonance above which no other octave pair can resonate more
+# strongly (the exact bound is 0.875, reached at frequency 1/8)
+_INNER_OCTAVE_SHORTCUT = 0.9
+
+def _fast_classify(frequency):
+    """
+    Classify a prime number from its harmonic frequency, computing the other
+    octave pairs only when the fundamental-first resonance does not decide.
     
-    # Calculate golden angle
-    golden_angle_rad = 2 * math.pi / (PHI * PHI)
-    angle = (n * golden_angle_rad) % (2 * math.pi)
+    Args:
+        frequency: The harmonic frequency of the number
+        
+    Returns:
+        A string classification: "inner_octave", "outer_octave", or "cross_resonant"
+    """
+    if 1.0 - abs(frequency - frequency * 2.0 % 1.0) > _INNER_OCTAVE_SHORTCUT:
+        return "inner_octave"
     
-    # Calculate angular relationships
-    angular_relationships = {}
+    return _classify_from_resonance(_cross_octave_resonance(frequency))
+
+@njit(cache=True)
+def _angular_relationships(n, system_level, position, cycle):
+    """
+    Analyze the angular relationships of a number from its dimensional mapping.
+    
+    Args:
+        n: The number to analyze (as a float)
+        system_level: System level of the number
+        position: Position of the number
+        cycle: Cycle of the number (as a float)
+        
+    Returns:
+        np.ndarray of the angular relationships named in _ANGULAR_KEYS
+    """
+    # Calculate the angle of the number in golden angle steps
+    angle = (n * _GOLDEN_ANGLE_RAD) % (2 * math.pi)
+    
+    relationships = np.empty(5)
     
     # Relationship with golden angle
-    angular_relationships["golden_ratio"] = abs(math.cos(angle - golden_angle_rad))
+    relationships[0] = abs(math.cos(angle - _GOLDEN_ANGLE_RAD))
     
     # Relationship with system level
     system_angle = (system_level * math.pi / DIMENSIONAL_FACTOR) % (2 * math.pi)
-    angular_relationships["system_level"] = abs(math.cos(angle - system_angle))
+    relationships[1] = abs(math.cos(angle - system_angle))
     
     # Relationship with position
     position_angle = (position * math.pi / DIMENSIONAL_FACTOR) % (2 * math.pi)
-    angular_relationships["position"] = abs(math.cos(angle - position_angle))
+    relationships[2] = abs(math.cos(angle - position_angle))
     
     # Relationship with cycle
     cycle_angle = (cycle * math.pi / (DIMENSIONAL_FACTOR * 2)) % (2 * math.pi)
-    angular_relationships["cycle"] = abs(math.cos(angle - cycle_angle))
+    relationships[3] = abs(math.cos(angle - cycle_angle))
     
     # Calculate overall angular coherence
-    angular_relationships["coherence"] = sum(angular_relationships.values()) / len(angular_relationships)
+    relationships[4] = (relationships[0] + relationships[1] + relationships[2] + relationships[3]) / 4
     
-    return angular_relationships
+    return relationships
 
-def is_prime_with_enhanced_resonance(n):
+def analyze_angular_relationships(n):
     """
-    Determine if a number is prime using enhanced resonance detection.
+    Analyze the angular relationships of a number across different dimensions.
+    
+    Args:
+        n: The number to analyze
+        
+    Returns:
+        A dictionary of angular relationships
+    """
+    # Get dimensional mapping
+    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    
+    relationships = _angular_relationships(float(n), float(system_level), float(position), float(cycle))
+    return dict(zip(_ANGULAR_KEYS, relationships.tolist()))
+
+def _small_primes(limit):
+    """
+    Find the primes up to a small limit with a Sieve of Eratosthenes.
+    
+    Args:
+        limit: Upper limit (inclusive)
+        
+    Returns:
+        np.ndarray of the primes up to the limit
+    """
+    is_prime = np.ones(limit + 1, dtype=np.bool_)
+    is_prime[:2] = False
+    for i in range(2, math.isqrt(limit) + 1):
+        if is_prime[i]:
+            is_prime[i * i::i] = False
+    
+    return np.flatnonzero(is_prime)
+
+# Primality of every number below 2^16, looked up instead of tested
+_SMALL_PRIME_TABLE = np.zeros(1 << 16, dtype=np.bool_)
+_SMALL_PRIME_TABLE[_small_primes(len(_SMALL_PRIME_TABLE) - 1)] = True
+
+# Miller-Rabin witnesses (the first 13 primes), deterministic for every n below
+# 3,317,044,064,679,887,385,961,981 and a strong probable-prime test beyond
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def _miller_rabin(n, witnesses=_MR_WITNESSES):
+    """
+    Miller-Rabin primality test for odd numbers with no factor among the witnesses.
+    
+    Args:
+        n: The odd number to check (n > the largest witness)
+        witnesses: Bases to test
+        
+    Returns:
+        Boolean indicating if the number is prime
+    """
+    # Write n - 1 as d * 2^s with d odd
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    
+    return True
+
+def _is_prime(n):
+    """
+    Check if a number is prime.
     
     Args:
         n: The number to check
         
     Returns:
-        A tuple (is_prime, classification, resonance_score)
+        Boolean indicating if the number is prime
     """
-    # Special cases
     if n < 2:
-        return (False, "non_prime", 0.0)
+        return False
+    if n < len(_SMALL_PRIME_TABLE):
+        return bool(_SMALL_PRIME_TABLE[n])
+    
+    # Rule out small factors, then run Miller-Rabin
+    for p in _MR_WITNESSES:
+        if n % p == 0:
+            return False
+    
+    return _miller_rabin(n)
+
+def _classify_prime(n, resonance):
+    """
+    Classify a prime number and score its resonance.
+    
+    Args:
+        n: The prime number
+        resonance: np.ndarray of the cross-octave resonance of the number
+        
+    Returns:
+        A tuple (classification, resonance_score)
+    """
+    # 2 and 3 resonate fully with the fundamental
     if n == 2 or n == 3:
-        return (True, "inner_octave", 1.0)
-    if n % 2 == 0:
-        return (False, "non_prime", 0.0)
+        return ("inner_octave", 1.0)
     
-    # Check primality using trial division for small numbers
-    if n < 1000:
-        is_prime = all(n % i != 0 for i in range(3, int(math.sqrt(n)) + 1, 2))
-    else:
-        # For larger numbers, use probabilistic primality test
-        # This is a simplified version - in practice, use a proper primality test
-        is_prime = True
-        for _ in range(5):  # 5 iterations of trial division with random numbers
-            divisor = 3 + 2 * (n % 100)  # Simple way to get odd numbers
-            if divisor < n and n % divisor == 0:
-                is_prime = False
-                break
+    return (_classify_from_resonance(resonance), float(resonance.max()))
+
+def angular_relationships_batch(numbers, system_level, position, cycle):
+    """
+    Analyze the angular relationships of many numbers at once.
     
-    if not is_prime:
-        return (False, "non_prime", 0.0)
+    Args:
+        numbers: np.ndarray of the numbers to analyze
+        system_level: np.ndarray of their system levels
+        position: np.ndarray of their positions
+        cycle: np.ndarray of their cycles
+        
+    Returns:
+        np.ndarray of shape (len(numbers), 5), with the columns named in _ANGULAR_KEYS
+    """
+    angles = (numbers * _GOLDEN_ANGLE_RAD) % (2 * np.pi)
     
-    # For prime numbers, classify by octave
-    classification = classify_prime_by_octave(n)
+    relationships = np.empty((len(numbers), 5))
+    relationships[:, 0] = np.abs(np.cos(angles - _GOLDEN_ANGLE_RAD))
+    relationships[:, 1] = np.abs(np.cos(angles - (system_level * np.pi / DIMENSIONAL_FACTOR) % (2 * np.pi)))
+    relationships[:, 2] = np.abs(np.cos(angles - (position * np.pi / DIMENSIONAL_FACTOR) % (2 * np.pi)))
+    relationships[:, 3] = np.abs(np.cos(angles - (cycle * np.pi / (DIMENSIONAL_FACTOR * 2)) % (2 * np.pi)))
+    relationships[:, 4] = relationships[:, :4].sum(axis=1) / 4
     
-    # Calculate resonance score
-    resonance_map = calculate_cross_octave_resonance(n)
-    resonance_score = max(resonance_map.values())
+    return relationships
+
+def is_prime_with_enhanced_resonance(n):
+    """
+    Determine if a number is prime using enhanced resonance detection.
     
+    Args:
+        n: The number to check
+        
+    Returns:
+        A tuple (is_prime, classification, resonance_score)
+    """
+    # Check if prime
+    if not _is_prime(n):
+        return (False, "non_prime", 0.0)
+    
+    # For prime numbers, classify by octave and score the strongest resonance
+    classification, resonance_score = _classify_prime(n, _cross_octave_resonance(calculate_harmonic_frequency(n)))
     return (True, classification, resonance_score)
 
 def analyze_prime_with_enhanced_detection(n):
@@ -340,10 +546,8 @@ def analyze_prime_with_enhanced_detection(n):
     Returns:
         A dictionary containing detailed analysis results
     """
-    # Check if prime with enhanced resonance
-    is_prime, classification, resonance_score = is_prime_with_enhanced_resonance(n)
-    
-    if not is_prime:
+    # Check if prime
+    if not _is_prime(n):
         return {
             "number": n,
             "is_prime": False,
@@ -351,22 +555,48 @@ def analyze_prime_with_enhanced_detection(n):
             "resonance_score": 0.0
         }
     
+    return _analyze_prime(n)
+
+def _analyze_prime(n):
+    """
+    Analyze a number already known to be prime, computing each quantity once.
+    
+    Args:
+        n: The prime number to analyze
+        
+    Returns:
+        A dictionary containing detailed analysis results
+    """
     # Get dimensional mapping
-    system_level, dimension, position, cycle, metacycle = ufrf_dimensional_mapping(n)
+    mapping = ufrf_dimensional_mapping(n)
+    system_level, dimension, position, cycle, metacycle = mapping
     
-    # Calculate harmonic frequency
-    frequency = calculate_harmonic_frequency(n)
+    # Calculate cross-octave resonance, and classify the prime from it
+    resonance = _cross_octave_resonance(calculate_harmonic_frequency(n))
+    classification, resonance_score = _classify_prime(n, resonance)
     
-    # Calculate octave
-    octave = identify_harmonic_octave(n)
+    # Analyze angular relationships
+    angular = _angular_relationships(float(n), float(system_level), float(position), float(cycle))
     
-    # Calculate cross-octave resonance
-    resonance_map = calculate_cross_octave_resonance(n)
+    return _compile_analysis(n, mapping, classification, resonance_score, resonance, angular)
+
+def _compile_analysis(n, mapping, classification, resonance_score, resonance, angular):
+    """
+    Compile the analysis results of a prime number.
     
-    # Analyze angular relationships
-    angular_relationships = analyze_angular_relationships(n)
+    Args:
+        n: The prime number
+        mapping: Dimensional mapping of the number
+        classification: Octave classification of the number
+        resonance_score: Strongest cross-octave resonance of the number
+        resonance: np.ndarray of the cross-octave resonance of the number
+        angular: np.ndarray of the angular relationships of the number
+        
+    Returns:
+        A dictionary containing detailed analysis results
+    """
+    system_level, dimension, position, cycle, metacycle = mapping
     
-    # Compile results
     results = {
         "number": n,
         "is_prime": True,
@@ -377,14 +607,264 @@ def analyze_prime_with_enhanced_detection(n):
         "position": position,
         "cycle": cycle,
         "metacycle": metacycle,
-        "harmonic_frequency": frequency,
-        "octave": octave,
-        "cross_octave_resonance": resonance_map,
-        "angular_relationships": angular_relationships
+        "harmonic_frequency": calculate_harmonic_frequency(n),
+        "octave": identify_harmonic_octave(n),
+        "cross_octave_resonance": dict(zip(_OCT_PAIRS, resonance.tolist())),
+        "angular_relationships": dict(zip(_ANGULAR_KEYS, angular.tolist()))
     }
     
     return results
 
+@njit(parallel=True, cache=True)
+def _analyze_primes_kernel(primes, system_level, position, cycle,
+                           out_class, out_score, out_resonance, out_angular):
+    """
+    Classify and score many primes and analyze their angular relationships in parallel.
+    
+    Args:
+        primes: np.ndarray of the prime numbers (np.int64)
+        system_level: np.ndarray of their system levels
+        position: np.ndarray of their positions
+        cycle: np.ndarray of their cycles
+        out_class: np.int8 array receiving the class ids (indices into _CLASSIFICATIONS)
+        out_score: np.ndarray receiving the resonance scores
+        out_resonance: np.ndarray of shape (N, 6) receiving the cross-octave resonances
+        out_angular: np.ndarray of shape (N, 5) receiving the angular relationships
+    """
+    for i in prange(len(primes)):
+        n = primes[i]
+        resonance = _cross_octave_resonance(n * FUNDAMENTAL_FREQUENCY % 1.0)
+        out_resonance[i] = resonance
+        
+        # Classify like _classify_from_resonance, with masks instead of branches
+        strongest = resonance.argmax()
+        cross = (resonance[strongest] > 0.8) & (strongest != 0)
+        inner = (not cross) & (resonance[0] > 0.7)
+        out_class[i] = _CROSS_RESONANT * cross + inner
+        out_score[i] = resonance[strongest]
+        
+        # 2 and 3 resonate fully with the fundamental
+        if n == 2 or n == 3:
+            out_class[i] = 1
+            out_score[i] = 1.0
+        
+        out_angular[i] = _angular_relationships(float(n), system_level[i], position[i], cycle[i])
+
+if not NUMBA_AVAILABLE:
+    def _analyze_primes_kernel(primes, system_level, position, cycle,
+                               out_class, out_score, out_resonance, out_angular):
+        """
+        Classify and score many primes and analyze their angular relationships (vectorized fallback).
+        
+        Args:
+            primes: np.ndarray of the prime numbers (np.int64)
+            system_level: np.ndarray of their system levels
+            position: np.ndarray of their positions
+            cycle: np.ndarray of their cycles
+            out_class: np.int8 array receiving the class ids (indices into _CLASSIFICATIONS)
+            out_score: np.ndarray receiving the resonance scores
+            out_resonance: np.ndarray of shape (N, 6) receiving the cross-octave resonances
+            out_angular: np.ndarray of shape (N, 5) receiving the angular relationships
+        """
+        out_resonance[:] = _cross_octave_resonance_batch(calculate_harmonic_frequency(primes))
+        out_class[:] = _classify_resonance_batch(out_resonance)
+        out_score[:] = out_resonance.max(axis=1)
+        
+        # 2 and 3 resonate fully with the fundamental
+        small = (primes == 2) | (primes == 3)
+        out_class[small] = 1
+        out_score[small] = 1.0
+        
+        out_angular[:] = angular_relationships_batch(primes, system_level, position, cycle)
+
+def _analyze_primes(primes):
+    """
+    Analyze numbers already known to be prime, all at once.
+    
+    Args:
+        primes: np.ndarray of the prime numbers to analyze (np.int64)
+        
+    Returns:
+        A list of analysis results, one per prime
+    """
+    # Get dimensional mappings
+    mapping = ufrf_dimensional_mapping_batch(primes)
+    mappings = list(zip(*(column.tolist() for column in mapping)))
+    system_level, _, position, cycle, _ = (column.astype(np.float64) for column in mapping)
+    
+    # Classify, score and analyze the whole batch in one kernel call
+    count = len(primes)
+    class_ids = np.empty(count, dtype=np.int8)
+    scores = np.empty(count)
+    resonance = np.empty((count, 6))
+    angular = np.empty((count, 5))
+    _analyze_primes_kernel(primes, system_level, position, cycle, class_ids, scores, resonance, angular)
+    
+    return [_compile_analysis(n, mapping, _CLASSIFICATIONS[class_id], score, resonance_row, angular_row)
+            for n, mapping, class_id, score, resonance_row, angular_row
+            in zip(primes.tolist(), mappings, class_ids.tolist(), scores.tolist(), resonance, angular)]
+
+# Residues mod 30 coprime to 30: bit b of wheel byte k is the number 30k + _WHEEL_RESIDUES[b]
+_WHEEL_RESIDUES = np.array([1, 7, 11, 13, 17, 19, 23, 29], dtype=np.int64)
+
+# Bit mask of every residue mod 30 within a wheel byte (0 for residues sharing a factor with 30)
+_WHEEL_MASKS = np.zeros(30, dtype=np.uint8)
+_WHEEL_MASKS[_WHEEL_RESIDUES] = 1 << np.arange(8)
+
+# Smallest primes on the wheel, struck once into a template instead of in every segment
+_PRESIEVE_PRIMES = (7, 11, 13, 17)
+_PRESIEVE_PERIOD = math.prod(_PRESIEVE_PRIMES)
+
+# One period of wheel bytes with the multiples of the pre-sieve primes struck (the
+# multiples of p repeat every p bytes, since 30 is invertible mod p)
+_PRESIEVE_NUMBERS = 30 * np.arange(_PRESIEVE_PERIOD)[:, None] + _WHEEL_RESIDUES
+_PRESIEVE_TEMPLATE = np.packbits(np.gcd(_PRESIEVE_NUMBERS, _PRESIEVE_PERIOD) > 1, axis=1, bitorder='little').ravel()
+
+@njit(cache=True, boundscheck=False)
+def _strike_wheel_segment(wheel, byte_lo, base_primes):
+    """
+    Strike the multiples of the base primes from one segment of a mod-30 wheel sieve.
+    
+    The multiples p * q with q in one wheel residue class all share a residue mod 30,
+    so each class is a single bit stepping p bytes at a time.
+    
+    Args:
+        wheel: np.uint8 segment (bit b of byte k is the number 30 * (byte_lo + k) + _WHEEL_RESIDUES[b])
+        byte_lo: Wheel byte index of the first byte of the segment
+        base_primes: np.ndarray of the primes from 7 up to sqrt of the segment end
+    """
+    byte_hi = byte_lo + len(wheel)
+    for k in range(len(base_primes)):
+        p = base_primes[k]
+        for r in _WHEEL_RESIDUES:
+            # p times the smallest cofactor >= p in this residue class
+            m = p * (p + (r - p) % 30)
+            mask = _WHEEL_MASKS[m % 30]
+            
+            # First byte of the progression in the segment
+            first = m // 30
+            if first < byte_lo:
+                first += (byte_lo - first + p - 1) // p * p
+            for j in range(first - byte_lo, byte_hi - byte_lo, p):
+                wheel[j] |= mask
+
+if not NUMBA_AVAILABLE:
+    def _strike_wheel_segment(wheel, byte_lo, base_primes):
+        """
+        Strike the multiples of the base primes from one segment of a mod-30 wheel sieve (vectorized fallback).
+        
+        Args:
+            wheel: np.uint8 segment (bit b of byte k is the number 30 * (byte_lo + k) + _WHEEL_RESIDUES[b])
+            byte_lo: Wheel byte index of the first byte of the segment
+            base_primes: np.ndarray of the primes from 7 up to sqrt of the segment end
+        """
+        for p in base_primes.tolist():
+            for r in _WHEEL_RESIDUES.tolist():
+                m = p * (p + (r - p) % 30)
+                first = m // 30
+                if first < byte_lo:
+                    first += (byte_lo - first + p - 1) // p * p
+                wheel[first - byte_lo::p] |= _WHEEL_MASKS[m % 30]
+
+def _l2_cache_size():
+    """
+    Detect the size of the L2 cache of one core.
+    
+    Returns:
+        The L2 cache size in bytes, or 256 KiB when it cannot be detected
+    """
+    try:
+        size = os.sysconf('SC_LEVEL2_CACHE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        size = 0
+    
+    # Linux exposes the cache hierarchy in sysfs even where sysconf does not
+    if size <= 0:
+        try:
+            with open("/sys/devices/system/cpu/cpu0/cache/index2/size") as f:
+                text = f.read().strip()
+            size = int(text.rstrip("KMG")) << {"K": 10, "M": 20, "G": 30}.get(text[-1], 0)
+        except (OSError, ValueError, IndexError):
+            size = 0
+    
+    return size if size > 0 else 256 * 1024
+
+def _sieve_segment_bytes():
+    """
+    Choose the sieve segment size: half the L2 cache, rounded down to a power of two.
+    
+    Hyperthreads share their core's L2 cache, so the size is also divided by the
+    number of threads per core when psutil can tell it.
+    
+    Returns:
+        The number of wheel bytes per segment
+    """
+    cache_size = _l2_cache_size()
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+        if cores:
+            cache_size //= max(1, (os.cpu_count() or cores) // cores)
+    except ImportError:
+        pass
+    
+    return max(1 << 12, 1 << (cache_size.bit_length() - 2))
+
+# Wheel bytes per sieve segment
+_SIEVE_SEG_BYTES = _sieve_segment_bytes()
+
+def _segmented_sieve(lo, hi, seg_bytes=_SIEVE_SEG_BYTES):
+    """
+    Generate the primes in [lo, hi] one segment at a time with a segmented Sieve of
+    Eratosthenes on a mod-30 wheel.
+    
+    Only the 8 residues mod 30 that are coprime to 2, 3 and 5 are stored, one bit
+    each, so a byte covers 30 numbers.
+    
+    Args:
+        lo: Smallest number to sieve
+        hi: Largest number to sieve
+        seg_bytes: Wheel bytes per segment (the default fills half the L2 cache)
+        
+    Yields:
+        np.ndarray of the primes in each segment, in increasing order
+    """
+    lo = max(lo, 2)
+    if hi < lo:
+        return
+    
+    # 2, 3 and 5 are not on the wheel
+    small = [p for p in (2, 3, 5) if lo <= p <= hi]
+    
+    base_primes = _small_primes(math.isqrt(hi))
+    base_primes = base_primes[base_primes > _PRESIEVE_PRIMES[-1]]
+    wheel = np.empty(seg_bytes, dtype=np.uint8)
+    
+    for byte_lo in range(lo // 30, hi // 30 + 1, seg_bytes):
+        size = min(seg_bytes, hi // 30 + 1 - byte_lo)
+        segment = wheel[:size]
+        
+        # Start from the template with the multiples of the pre-sieve primes struck
+        offset = byte_lo % _PRESIEVE_PERIOD
+        segment[:] = np.tile(_PRESIEVE_TEMPLATE, (offset + size) // _PRESIEVE_PERIOD + 1)[offset:offset + size]
+        if byte_lo == 0:
+            segment[0] = _WHEEL_MASKS[1]  # 1 is not prime, the pre-sieve primes are
+        
+        # Strike the multiples of the remaining base primes up to sqrt of the segment end
+        segment_hi = 30 * (byte_lo + size) - 1
+        _strike_wheel_segment(segment, byte_lo, base_primes[base_primes <= math.isqrt(segment_hi)])
+        
+        # The clear bits are the primes
+        k, b = np.nonzero(np.unpackbits(~segment, bitorder='little').reshape(-1, 8))
+        primes = 30 * (byte_lo + k) + _WHEEL_RESIDUES[b]
+        primes = primes[(primes >= lo) & (primes <= hi)]
+        
+        if small:
+            primes = np.concatenate((np.array(small, dtype=np.int64), primes))
+            small = []
+        
+        yield primes
+
 def batch_analyze_primes(start, end, max_count=100):
     """
     Analyze a batch of numbers for prime classification with memory constraints.
@@ -398,25 +878,14 @@ def batch_analyze_primes(start, end, max_count=100):
         A list of analysis results for prime numbers
     """
     results = []
-    count = 0
     
-    for n in range(start, end + 1):
-        # Skip even numbers except 2
-        if n > 2 and n % 2 == 0:
-            continue
-        
-        # Check if prime with enhanced resonance
-        is_prime, classification, resonance_score = is_prime_with_enhanced_resonance(n)
+    # Sieve the range and analyze only the primes, a segment at a time
+    for primes in _segmented_sieve(start, end):
+        results.extend(_analyze_primes(primes[:max(1, max_count - len(results))]))
         
-        if is_prime:
-            # For prime numbers, perform full analysis
-            analysis = analyze_prime_with_enhanced_detection(n)
-            results.append(analysis)
-            count += 1
-            
-            # Check if we've reached the maximum count
-            if count >= max_count:
-                break
+        # Check if we've reached the maximum count
+        if len(results) >= max_count:
+            break
     
     return results
 
@@ -433,25 +902,20 @@ def find_cross_resonant_primes(start, end, max_count=10):
         A list of cross-resonant prime numbers with their analysis
     """
     cross_resonant_primes = []
-    count = 0
     
-    for n in range(start, end + 1):
-        # Skip even numbers except 2
-        if n > 2 and n % 2 == 0:
+    # Sieve the range and classify only the primes, a segment at a time
+    for primes in _segmented_sieve(start, end):
+        class_ids = _classify_resonance_batch(_cross_octave_resonance_batch(calculate_harmonic_frequency(primes)))
+        found = primes[class_ids == _CROSS_RESONANT]
+        if not len(found):
             continue
         
-        # Check if prime with enhanced resonance
-        is_prime, classification, resonance_score = is_prime_with_enhanced_resonance(n)
+        # For cross-resonant primes, perform full analysis
+        cross_resonant_primes.extend(_analyze_primes(found[:max(1, max_count - len(cross_resonant_primes))]))
         
-        if is_prime and classification == "cross_resonant":
-            # For cross-resonant primes, perform full analysis
-            analysis = analyze_prime_with_enhanced_detection(n)
-            cross_resonant_primes.append(analysis)
-            count += 1
-            
-            # Check if we've reached the maximum count
-            if count >= max_count:
-                break
+        # Check if we've reached the maximum count
+        if len(cross_resonant_primes) >= max_count:
+            break
     
     return cross_resonant_primes
 
@@ -9,8 +9,9 @@ focusing on how primes relate to each other across different systems and octaves
 import numpy as np
 import math
 import decimal
-from collections import defaultdict
 import os
+from collections import deque
+from functools import lru_cache
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
@@ -22,41 +23,72 @@ from enhanced_resonance_detector import (
     FUNDAMENTAL_FREQUENCY, OCTAVE_RATIO,
     ufrf_dimensional_mapping, calculate_harmonic_frequency,
     identify_harmonic_octave, calculate_cross_octave_resonance,
-    classify_prime_by_octave, is_prime_with_enhanced_resonance
+    classify_prime_by_octave, is_prime_with_enhanced_resonance,
+    ufrf_dimensional_mapping_batch, calculate_cross_octave_resonance_batch
 )
 
-# Check if MPS (Metal Performance Shaders) is available for Mac M2
+# Check if Numba is available for JIT compilation
 try:
-    import torch
-    if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-        USE_MPS = True
-        print("Using MPS (Metal Performance Shaders) for Mac M2 acceleration")
-        
-        # Initialize MPS device
-        mps_device = torch.device("mps")
-        
-        # Function to move tensor to MPS
-        def to_mps(tensor):
-            return tensor.to(mps_device)
-    else:
-        USE_MPS = False
-        print("MPS not available, using CPU instead (code is still M2-compatible)")
-        
-        # Dummy function when MPS is not available
-        def to_mps(tensor):
-            return tensor
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    USE_MPS = False
-    print("PyTorch not available, using CPU only")
-    
-    # Dummy function when PyTorch is not available
-    def to_mps(tensor):
-        return tensor
+    NUMBA_AVAILABLE = False
+    print("Numba not available, harmonic resonance will use NumPy")
+    
+    # Dummy decorator when Numba is not available
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Check if SciPy is available for graph algorithms
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    print("SciPy not available, prime clusters will be grown in Python")
 
 # Define harmonic relationship constants
 HARMONIC_SERIES = [1.0, 2.0, 3.0, 5.0, 7.0, 11.0, 13.0]  # Prime-focused harmonic series
 RESONANCE_THRESHOLD = 0.85  # Threshold for significant resonance
 
+# Scatter style of each prime classification in harmonic space, indexed by class code
+_CLASSIFICATION_STYLES = (
+    ("inner_octave", "blue", 50, "Inner Octave Primes"),
+    ("outer_octave", "green", 50, "Outer Octave Primes"),
+    ("cross_resonant", "red", 80, "Cross-Resonant Primes"),
+)
+_CLASSIFICATION_CODES = {style[0]: code for code, style in enumerate(_CLASSIFICATION_STYLES)}
+
+# Harmonic series as an array, for computing all the harmonics of a prime at once
+_HARMONIC_SERIES = np.array(HARMONIC_SERIES)
+
+# Frequency of each harmonic of 1; a prime's harmonic frequencies are prime * _FREQ_TEMPLATE
+_FREQ_TEMPLATE = _HARMONIC_SERIES * FUNDAMENTAL_FREQUENCY
+
+def _primes_upto(n):
+    """
+    Find all primes up to n with the Sieve of Eratosthenes.
+    
+    Args:
+        n: Upper bound (inclusive)
+        
+    Returns:
+        np.ndarray of the primes up to n, in increasing order
+    """
+    if n < 2:
+        return np.empty(0, dtype=np.int64)
+    
+    sieve = np.ones(n + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, math.isqrt(n) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = False
+    
+    return np.flatnonzero(sieve)
+
 def calculate_prime_harmonic_series(prime):
     """
     Calculate the harmonic series generated by a prime number.
@@ -65,9 +97,9 @@ def calculate_prime_harmonic_series(prime):
         prime: The prime number to analyze
         
     Returns:
-        A list of the first 7 harmonics generated by the prime
+        np.ndarray of the first 7 harmonics generated by the prime
     """
-    return [prime * h for h in HARMONIC_SERIES]
+    return prime * _HARMONIC_SERIES
 
 def calculate_harmonic_resonance_between_primes(prime1, prime2):
     """
@@ -80,27 +112,90 @@ def calculate_harmonic_resonance_between_primes(prime1, prime2):
     Returns:
         A resonance score between 0 and 1
     """
-    # Get harmonic series for both primes
-    harmonics1 = calculate_prime_harmonic_series(prime1)
-    harmonics2 = calculate_prime_harmonic_series(prime2)
-    
-    # Calculate normalized frequencies
-    normalized1 = [h * FUNDAMENTAL_FREQUENCY % 1.0 for h in harmonics1]
-    normalized2 = [h * FUNDAMENTAL_FREQUENCY % 1.0 for h in harmonics2]
-    
-    # Find closest matches between harmonics
-    min_distances = []
-    for freq1 in normalized1:
-        distances = [min(abs(freq1 - freq2), 1.0 - abs(freq1 - freq2)) for freq2 in normalized2]
-        min_distances.append(min(distances))
-    
-    # Calculate average minimum distance (lower is better)
-    avg_min_distance = sum(min_distances) / len(min_distances)
+    return float(_harmonic_resonance(float(prime1), float(prime2)))
+
+@njit(cache=True, fastmath=True)
+def _harmonic_resonance(prime1, prime2):
+    """
+    Calculate the harmonic resonance between two prime numbers with explicit loops.
     
-    # Convert to resonance score (higher is better)
-    resonance_score = 1.0 - avg_min_distance
+    Args:
+        prime1: First prime number (as a float)
+        prime2: Second prime number (as a float)
+        
+    Returns:
+        A resonance score between 0 and 1
+    """
+    count = len(_HARMONIC_SERIES)
+    
+    # Calculate normalized frequencies of the second prime's harmonics
+    normalized2 = np.empty(count)
+    for j in range(count):
+        normalized2[j] = prime2 * _FREQ_TEMPLATE[j] % 1.0
+    
+    # Add up the distance from each harmonic of the first prime to its closest match
+    total_distance = 0.0
+    for i in range(count):
+        freq1 = prime1 * _FREQ_TEMPLATE[i] % 1.0
+        min_distance = 1.0
+        for j in range(count):
+            distance = abs(freq1 - normalized2[j])
+            min_distance = min(min_distance, distance, 1.0 - distance)
+        total_distance += min_distance
+    
+    # Convert the average minimum distance (lower is better) to a resonance score (higher is better)
+    return 1.0 - total_distance / count
+
+if not NUMBA_AVAILABLE:
+    def _harmonic_resonance(prime1, prime2):
+        """
+        Calculate the harmonic resonance between two prime numbers (NumPy fallback).
+        
+        Args:
+            prime1: First prime number (as a float)
+            prime2: Second prime number (as a float)
+            
+        Returns:
+            A resonance score between 0 and 1
+        """
+        # Calculate normalized frequencies
+        normalized1 = prime1 * _FREQ_TEMPLATE % 1.0
+        normalized2 = prime2 * _FREQ_TEMPLATE % 1.0
+        
+        # Circular distances between every pair of harmonics
+        distances = np.abs(normalized1[:, None] - normalized2[None, :])
+        distances = np.minimum(distances, 1.0 - distances)
+        
+        # Convert the average minimum distance (lower is better) to a resonance score (higher is better)
+        return 1.0 - distances.min(axis=1).mean()
+
+def calculate_harmonic_resonance_matrix(primes):
+    """
+    Calculate the harmonic resonance between every pair of primes at once.
     
-    return resonance_score
+    Args:
+        primes: np.ndarray of prime numbers
+        
+    Returns:
+        np.float32 array R of shape (P, P), where R[i, j] is the harmonic resonance of
+        primes[i] with primes[j] (as calculate_harmonic_resonance_between_primes)
+    """
+    # Normalized frequencies of every harmonic of every prime, shape (P, 7), reduced
+    # modulo 1 in double precision and then compared in single precision
+    normalized = (np.asarray(primes, dtype=np.float64)[:, None] * _FREQ_TEMPLATE % 1.0).astype(np.float32)
+    
+    # Add up, over the harmonics of the first prime, the distance to the closest
+    # harmonic of the second, one pair of harmonics at a time so memory stays O(P^2)
+    total_distance = np.zeros((len(normalized), len(normalized)), dtype=np.float32)
+    for freq1 in normalized.T:
+        min_distance = np.full_like(total_distance, np.inf)
+        for freq2 in normalized.T:
+            distance = np.abs(freq1[:, None] - freq2[None, :])
+            np.minimum(min_distance, np.minimum(distance, 1.0 - distance), out=min_distance)
+        total_distance += min_distance
+    
+    # Convert the average minimum distance to resonance scores
+    return 1.0 - total_distance / len(_HARMONIC_SERIES)
 
 def find_harmonic_prime_clusters(primes):
     """
@@ -112,42 +207,135 @@ def find_harmonic_prime_clusters(primes):
     Returns:
         A list of prime clusters
     """
-    # Calculate resonance between all pairs of primes
-    resonance_matrix = {}
-    for i, prime1 in enumerate(primes):
-        for j, prime2 in enumerate(primes[i+1:], i+1):
-            resonance = calculate_harmonic_resonance_between_primes(prime1, prime2)
-            resonance_matrix[(prime1, prime2)] = resonance
+    primes = np.unique(np.asarray(primes, dtype=np.int64))
+    
+    # Calculate resonance between all pairs of primes, scoring each pair by the
+    # resonance of the smaller prime with the larger one
+    resonance_matrix = calculate_harmonic_resonance_matrix(primes)
+    resonates = np.triu(resonance_matrix >= RESONANCE_THRESHOLD, 1)
+    resonates |= resonates.T
     
     # Find clusters based on resonance threshold
-    clusters = []
-    remaining_primes = set(primes)
-    
-    while remaining_primes:
-        # Start a new cluster with the first remaining prime
-        current_prime = next(iter(remaining_primes))
-        current_cluster = {current_prime}
-        remaining_primes.remove(current_prime)
-        
-        # Find all primes that resonate with the current cluster
-        added = True
-        while added:
-            added = False
-            for prime in list(remaining_primes):
-                # Check if prime resonates with any prime in the current cluster
-                for cluster_prime in current_cluster:
-                    key = (min(prime, cluster_prime), max(prime, cluster_prime))
-                    if resonance_matrix.get(key, 0) >= RESONANCE_THRESHOLD:
-                        current_cluster.add(prime)
-                        remaining_primes.remove(prime)
-                        added = True
-                        break
+    cluster_count, labels = _label_clusters(resonates)
+    
+    # Group the primes by cluster, keeping the clusters with more than one prime
+    order = np.argsort(labels, kind='stable')
+    groups = np.split(primes[order], np.cumsum(np.bincount(labels, minlength=cluster_count))[:-1])
+    
+    return [group.tolist() for group in groups if len(group) > 1]
+
+def _label_clusters(resonates):
+    """
+    Label the connected components of the resonance graph.
+    
+    Args:
+        resonates: Symmetric boolean np.ndarray of shape (P, P), True for resonating pairs
         
-        # Add the cluster if it has more than one prime
-        if len(current_cluster) > 1:
-            clusters.append(sorted(current_cluster))
+    Returns:
+        A tuple (cluster_count, labels), numbering the clusters in order of their first prime
+    """
+    return connected_components(csr_matrix(resonates), directed=False)
+
+@njit(cache=True)
+def _union_find_clusters(resonates):
+    """
+    Label the connected components of the resonance graph with a union-find.
     
-    return clusters
+    Args:
+        resonates: Symmetric boolean np.ndarray of shape (P, P), True for resonating pairs
+        
+    Returns:
+        A tuple (cluster_count, labels), numbering the clusters in order of their first prime
+    """
+    count = len(resonates)
+    parent = np.arange(count)
+    
+    for i in range(count):
+        for j in range(i + 1, count):
+            if not resonates[i, j]:
+                continue
+            
+            # Find both roots, halving the paths on the way
+            a = i
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            b = j
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            
+            # Keep the smallest index as the root, so each root is its cluster's first prime
+            if a < b:
+                parent[b] = a
+            elif b < a:
+                parent[a] = b
+    
+    # Number the clusters in order of their roots
+    labels = np.empty(count, dtype=np.int64)
+    cluster_count = 0
+    for i in range(count):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        if root == i:
+            labels[i] = cluster_count
+            cluster_count += 1
+        else:
+            labels[i] = labels[root]
+    
+    return cluster_count, labels
+
+if not SCIPY_AVAILABLE:
+    def _label_clusters(resonates):
+        """
+        Label the connected components of the resonance graph (compiled union-find fallback).
+        
+        Args:
+            resonates: Symmetric boolean np.ndarray of shape (P, P), True for resonating pairs
+            
+        Returns:
+            A tuple (cluster_count, labels), numbering the clusters in order of their first prime
+        """
+        return _union_find_clusters(resonates)
+
+if not SCIPY_AVAILABLE and not NUMBA_AVAILABLE:
+    def _label_clusters(resonates):
+        """
+        Label the connected components of the resonance graph (pure-Python fallback).
+        
+        Args:
+            resonates: Symmetric boolean np.ndarray of shape (P, P), True for resonating pairs
+            
+        Returns:
+            A tuple (cluster_count, labels), numbering the clusters in order of their first prime
+        """
+        # Primes resonating with each prime
+        neighbors = [set(np.flatnonzero(row).tolist()) for row in resonates]
+        
+        labels = np.full(len(resonates), -1)
+        remaining_primes = set(range(len(resonates)))
+        cluster_count = 0
+        
+        for start in range(len(resonates)):
+            if start not in remaining_primes:
+                continue
+            
+            # Start a new cluster with the first remaining prime
+            remaining_primes.remove(start)
+            labels[start] = cluster_count
+            queue = deque([start])
+            
+            # Grow the cluster breadth-first through the resonating primes
+            while queue:
+                new_primes = neighbors[queue.popleft()] & remaining_primes
+                remaining_primes -= new_primes
+                labels[list(new_primes)] = cluster_count
+                queue.extend(new_primes)
+            
+            cluster_count += 1
+        
+        return cluster_count, labels
 
 def analyze_prime_harmonic_field(start, end, resolution=10):
     """
@@ -159,40 +347,35 @@ def analyze_prime_harmonic_field(start, end, resolution=10):
         resolution: Resolution of the field analysis
         
     Returns:
-        A dictionary mapping regions to harmonic field strength
+        A tuple (harmonic_field, frequency_space) of np.ndarrays, with the field
+        strength at each frequency of frequency_space
     """
     # Find primes in the range
-    primes = []
-    for n in range(start, end + 1):
-        if n > 1 and all(n % i != 0 for i in range(2, int(math.sqrt(n)) + 1)):
-            primes.append(n)
+    primes = _primes_upto(end)
+    primes = primes[primes >= start]
     
     # Initialize harmonic field
-    harmonic_field = defaultdict(float)
+    harmonic_field = np.zeros(resolution)
     
     # Calculate field strength across the frequency space
     frequency_space = np.linspace(0, 1, resolution, endpoint=False)
     
-    for prime in primes:
-        # Get harmonic series for this prime
-        harmonics = calculate_prime_harmonic_series(prime)
-        
-        # Calculate normalized frequencies
-        normalized = [h * FUNDAMENTAL_FREQUENCY % 1.0 for h in harmonics]
-        
-        # Add field strength around each harmonic frequency
-        for freq in normalized:
-            # Add field strength with a Gaussian distribution around the frequency
-            for i, f in enumerate(frequency_space):
-                distance = min(abs(freq - f), 1.0 - abs(freq - f))
-                # Gaussian falloff with distance
-                field_strength = math.exp(-10 * distance**2)
-                harmonic_field[i] += field_strength
+    # Normalized frequencies of every harmonic of every prime, shape (P, 7), reduced
+    # modulo 1 in double precision and then compared in single precision
+    normalized = (primes[:, None] * _FREQ_TEMPLATE % 1.0).astype(np.float32)
+    frequency_space_32 = frequency_space.astype(np.float32)
+    
+    # Add field strength with a Gaussian distribution around each harmonic
+    # frequency, one harmonic of all the primes at a time
+    for freq in normalized.T:
+        distance = np.abs(freq[:, None] - frequency_space_32[None, :])
+        distance = np.minimum(distance, 1.0 - distance)
+        # Gaussian falloff with distance, summed in double precision
+        harmonic_field += np.exp(-10 * distance**2).sum(axis=0, dtype=np.float64)
     
     # Normalize field strength
-    max_strength = max(harmonic_field.values()) if harmonic_field else 1.0
-    for key in harmonic_field:
-        harmonic_field[key] /= max_strength
+    if len(primes):
+        harmonic_field /= harmonic_field.max()
     
     return harmonic_field, frequency_space
 
@@ -201,23 +384,19 @@ def visualize_harmonic_field(harmonic_field, frequency_space, output_dir='.'):
     Visualize the harmonic field created by prime numbers.
     
     Args:
-        harmonic_field: Dictionary mapping regions to field strength
+        harmonic_field: Array of field strength at each frequency
         frequency_space: Array of frequency values
         output_dir: Directory to save the visualization
     """
     # Create the plot
     plt.figure(figsize=(12, 8))
     
-    # Convert dictionary to arrays for plotting
-    field_strength = [harmonic_field[i] for i in range(len(frequency_space))]
-    
     # Plot the harmonic field
-    plt.plot(frequency_space, field_strength, 'b-', linewidth=2)
+    plt.plot(frequency_space, harmonic_field, 'b-', linewidth=2)
     
     # Add markers for key frequencies
-    for i, freq in enumerate(frequency_space):
-        if harmonic_field[i] > 0.7:  # Highlight strong resonance points
-            plt.plot(freq, harmonic_field[i], 'ro', markersize=8)
+    strong = harmonic_field > 0.7  # Highlight strong resonance points
+    plt.plot(frequency_space[strong], harmonic_field[strong], 'ro', markersize=8)
     
     plt.title('Prime Number Harmonic Field')
     plt.xlabel('Normalized Frequency')
@@ -229,10 +408,14 @@ def visualize_harmonic_field(harmonic_field, frequency_space, output_dir='.'):
     plt.savefig(os.path.join(output_dir, 'prime_harmonic_field.png'))
     plt.close()
 
+@lru_cache(maxsize=65536)
 def calculate_harmonic_coordinates(prime):
     """
     Calculate 3D coordinates for a prime based on its harmonic properties.
     
+    The coordinates are memoized, since the visualization and classification
+    paths ask for the same primes repeatedly.
+    
     Args:
         prime: The prime number to map
         
@@ -265,6 +448,42 @@ def calculate_harmonic_coordinates(prime):
     
     return (x, y, z)
 
+def calculate_harmonic_coordinates_batch(primes):
+    """
+    Calculate 3D coordinates for many primes at once based on their harmonic properties.
+    
+    Args:
+        primes: Array of prime numbers to map
+        
+    Returns:
+        np.ndarray of shape (len(primes), 3) with the (x, y, z) coordinates of each prime
+    """
+    primes = np.asarray(primes, dtype=np.int64)
+    
+    # Get dimensional mapping
+    _, _, position, _, _ = ufrf_dimensional_mapping_batch(primes)
+    
+    # Calculate harmonic frequency
+    frequency = calculate_harmonic_frequency(primes)
+    
+    # Calculate octave
+    octave = np.zeros(len(primes))
+    raw_frequency = primes * FUNDAMENTAL_FREQUENCY
+    positive = raw_frequency > 0
+    octave[positive] = np.floor(np.log2(raw_frequency[positive]))
+    
+    # Calculate cross-octave resonance
+    max_resonance = calculate_cross_octave_resonance_batch(primes).max(axis=1)
+    
+    # Calculate coordinates in harmonic space
+    coordinates = np.empty((len(primes), 3))
+    radius = 1 + position / DIMENSIONAL_FACTOR
+    coordinates[:, 0] = np.cos(2 * np.pi * frequency) * radius
+    coordinates[:, 1] = np.sin(2 * np.pi * frequency) * radius
+    coordinates[:, 2] = octave + max_resonance
+    
+    return coordinates
+
 def visualize_harmonic_prime_space(primes, output_dir='.'):
     """
     Visualize primes in 3D harmonic space.
@@ -273,43 +492,27 @@ def visualize_harmonic_prime_space(primes, output_dir='.'):
         primes: List of prime numbers to visualize
         output_dir: Directory to save the visualization
     """
-    # Calculate classifications and coordinates for each prime
-    classifications = {}
-    coordinates = {}
-    
-    for prime in primes:
-        # Get classification
+    # Calculate classification codes for each prime (-1 for non-primes)
+    class_codes = np.empty(len(primes), dtype=np.int8)
+    for i, prime in enumerate(primes):
         _, classification, _ = is_prime_with_enhanced_resonance(prime)
-        classifications[prime] = classification
-        
-        # Calculate coordinates
-        coordinates[prime] = calculate_harmonic_coordinates(prime)
+        class_codes[i] = _CLASSIFICATION_CODES.get(classification, -1)
     
-    # Separate primes by classification
-    inner_octave_primes = [p for p in primes if classifications[p] == 'inner_octave']
-    outer_octave_primes = [p for p in primes if classifications[p] == 'outer_octave']
-    cross_resonant_primes = [p for p in primes if classifications[p] == 'cross_resonant']
+    # Calculate coordinates for all the primes at once
+    coordinates = calculate_harmonic_coordinates_batch(primes)
     
     # Create the plot
     fig = plt.figure(figsize=(14, 12))
     ax = fig.add_subplot(111, projection='3d')
     
     # Plot primes by classification
-    if inner_octave_primes:
-        x, y, z = zip(*[coordinates[p] for p in inner_octave_primes])
-        ax.scatter(x, y, z, c='blue', s=50, label='Inner Octave Primes')
-    
-    if outer_octave_primes:
-        x, y, z = zip(*[coordinates[p] for p in outer_octave_primes])
-        ax.scatter(x, y, z, c='green', s=50, label='Outer Octave Primes')
-    
-    if cross_resonant_primes:
-        x, y, z = zip(*[coordinates[p] for p in cross_resonant_primes])
-        ax.scatter(x, y, z, c='red', s=80, label='Cross-Resonant Primes')
+    for code, (_, color, size, label) in enumerate(_CLASSIFICATION_STYLES):
+        mask = class_codes == code
+        if mask.any():
+            ax.scatter(coordinates[mask, 0], coordinates[mask, 1], coordinates[mask, 2], c=color, s=size, label=label)
     
     # Add prime labels
-    for prime in primes:
-        x, y, z = coordinates[prime]
+    for prime, (x, y, z) in zip(primes, coordinates.tolist()):
         ax.text(x, y, z, str(prime), fontsize=8)
     
     ax.set_title('Prime Numbers in Harmonic Space')
@@ -345,7 +548,7 @@ def analyze_prime_19_harmonic_relationships():
     
     # Calculate harmonic series for 19
     harmonics_19 = calculate_prime_harmonic_series(19)
-    normalized_19 = [h * FUNDAMENTAL_FREQUENCY % 1.0 for h in harmonics_19]
+    normalized_19 = 19 * _FREQ_TEMPLATE % 1.0
     
     # Calculate octave classification for 19
     _, classification, _ = is_prime_with_enhanced_resonance(19)
@@ -393,10 +596,7 @@ def main():
     
     # Find primes in a small range
     print("\nFinding primes in range 1-50:")
-    primes = []
-    for n in range(1, 51):
-        if n > 1 and all(n % i != 0 for i in range(2, int(math.sqrt(n)) + 1)):
-            primes.append(n)
+    primes = _primes_upto(50).tolist()
     
     print(f"Found {len(primes)} primes: {primes}")
     
@@ -138,6 +138,39 @@ class PrimeClassifier:
         
         return is_prime
     
+    def is_prime_batch(self, start, end):
+        """
+        Check the primality of every number in a range at once.
+        
+        This is the trial division of is_prime turned inside out: instead of testing
+        each number against every odd divisor up to its square root, every odd divisor
+        up to sqrt(end) crosses off its odd multiples in the range.
+        
+        Args:
+            start: First number of the range
+            end: Last number of the range
+        
+        Returns:
+            np.uint64 bitmap aligned to multiples of 64: bit (n & 63) of word
+            (n >> 6) - (start >> 6) is set when n is prime
+        """
+        base = start - (start & 63)
+        is_prime = np.zeros((end | 63) + 1 - base, dtype=bool)
+        
+        # Special cases: 2 is the only even prime, and 0 and 1 are not prime
+        if start <= 2 <= end:
+            is_prime[2 - base] = True
+        is_prime[(max(start, 3) | 1) - base:end + 1 - base:2] = True
+        
+        # Cross off the odd multiples of every odd divisor from its square on
+        for i in range(3, math.isqrt(end) + 1, 2):
+            first = max(i * i, (start + i - 1) // i * i)
+            if first % 2 == 0:
+                first += i
+            is_prime[first - base:end + 1 - base:2 * i] = False
+        
+        return np.packbits(is_prime, bitorder='little').view('<u8').astype(np.uint64, copy=False)
+    
     def calculate_inner_octave_score(self, n):
         """
         Calculate how strongly a number aligns with inner octave characteristics.
@@ -0,0 +1,117 @@
+/*
+ * Native Scorer for the Cross-System Geometric Pattern Model
+ *
+ * C port of the machine-integer fast path of score_number in
+ * cross_system_kernels.py, loaded through ctypes when Numba is not available.
+ * The arithmetic follows the Python kernels operation for operation, so the
+ * predictions are identical (build without FMA contraction to keep it that way).
+ *
+ * Build (next to this file):
+ *     cc -O2 -ffp-contract=off -shared -fPIC -o libufrf_score.so ufrf_score.c -lm
+ */
+
+#include <math.h>
+#include <stdlib.h>
+
+/* Constants derived from the UFRF framework (bit-exact copies of the Python values) */
+static const double PHI = 0x1.9e3779b97f4a8p+0;                  /* (1 + 5**0.5) / 2 */
+static const double PI = 0x1.921fb54442d18p+1;                   /* math.pi */
+static const double TWO_PI = 0x1.921fb54442d18p+2;               /* 2 * math.pi */
+static const double GOLDEN_ANGLE_RAD = 0x1.3331febfa4bfbp+1;     /* 2π/φ² */
+static const double TICK_ANGLE_INTERVAL = 0x1.f10d6bc8e0e34p+1;  /* 2π/φ */
+static const double TICK_RADIUS_INTERVAL = 0x1.3c6ef372fe94fp-1; /* 1/φ */
+static const long long SYSTEM_BOUNDARY = 99779;
+static const long long DIMENSIONAL_FACTOR = 13;
+static const long long GOLDEN_RATIO_MODULUS = 161;               /* int(PHI * 100) */
+
+/* Bitmasks of the prime positions {2, 3, 5, 7, 11, 13} and echo positions {4, 6, 8, 9, 10, 12} */
+static const long long PRIME_POSITION_MASK = (1LL << 2) | (1LL << 3) | (1LL << 5) | (1LL << 7) | (1LL << 11) | (1LL << 13);
+static const long long ECHO_POSITION_MASK = (1LL << 4) | (1LL << 6) | (1LL << 8) | (1LL << 9) | (1LL << 10) | (1LL << 12);
+
+/* Python's float % for the non-negative operands used here */
+static double py_fmod(double x, double y)
+{
+    double r = fmod(x, y);
+    return r < 0 ? r + y : r;
+}
+
+/* Score one number in [0, 2**62); the density field is a C-ordered (nx, ny, nz) array */
+static int score_number(long long n, const double *field, const long long *shape,
+                        const long long *origin, long long resolution)
+{
+    long long system_level, mod, dimension, position, cycle, boundary_mod, ix, iy, iz;
+    double angle, x, y, z, resonance, score, spiral_radius, spiral_angle, angle_mod, radius_mod;
+    double golden_ratio_mod, echo_score;
+    int in_dense_region, golden_relationship, is_tick;
+
+    /* Special cases */
+    if (n < 2)
+        return 0;
+    if (n == 2 || n == 3)
+        return 1;
+    if (n % 2 == 0)
+        return 0;
+
+    /* Dimensional mapping: system level is the bit length of n // 13 */
+    system_level = 1;
+    if (n >= DIMENSIONAL_FACTOR)
+        system_level = 64 - __builtin_clzll((unsigned long long)(n / DIMENSIONAL_FACTOR));
+    mod = DIMENSIONAL_FACTOR << (system_level - 1);
+    dimension = n >= mod ? n - mod : n;
+    position = (dimension % DIMENSIONAL_FACTOR) + 1;
+    cycle = dimension / DIMENSIONAL_FACTOR;
+
+    angle = py_fmod((double)n * GOLDEN_ANGLE_RAD, TWO_PI);
+
+    /* Prime-dense region lookup */
+    x = (double)position * cos(angle);
+    y = (double)position * sin(angle);
+    z = (double)system_level + (double)(n % 7) / 10.0;
+    ix = (long long)floor(x * (double)resolution) - origin[0];
+    iy = (long long)floor(y * (double)resolution) - origin[1];
+    iz = (long long)floor(z * (double)resolution) - origin[2];
+    in_dense_region = ix >= 0 && iy >= 0 && iz >= 0 && ix < shape[0] && iy < shape[1] && iz < shape[2]
+                      && field[(ix * shape[1] + iy) * shape[2] + iz] > 0.3;
+
+    /* Cross-system resonance (n is always below the next system's modulus) */
+    resonance = 1 - fabs(py_fmod((double)position * PHI, 1.0)
+                         - py_fmod((double)((n % DIMENSIONAL_FACTOR) + 1) * PHI, 1.0));
+
+    golden_relationship = fabs(((double)position / (double)system_level) - PHI) < 0.3;
+    boundary_mod = n % SYSTEM_BOUNDARY;
+
+    score = (0.4 * in_dense_region
+             + 0.3 * (resonance > 0.7)
+             + 0.2 * (((1LL << position) & PRIME_POSITION_MASK) != 0)
+             + 0.1 * golden_relationship
+             + 0.1 * (boundary_mod < 100 || llabs(boundary_mod - SYSTEM_BOUNDARY) < 100));
+
+    if (score < 0.5)
+        return 0;
+
+    /* Echo point filter */
+    spiral_radius = (double)system_level + ((double)cycle / (double)(10 * system_level));
+    spiral_angle = angle + ((double)position * PI / (double)DIMENSIONAL_FACTOR);
+    angle_mod = py_fmod(spiral_angle, TICK_ANGLE_INTERVAL);
+    radius_mod = py_fmod(spiral_radius, TICK_RADIUS_INTERVAL);
+    is_tick = (angle_mod < 0.1 || angle_mod > TICK_ANGLE_INTERVAL - 0.1)
+              && (radius_mod < 0.05 || radius_mod > TICK_RADIUS_INTERVAL - 0.05);
+
+    golden_ratio_mod = (double)(n % GOLDEN_RATIO_MODULUS) / 100.0;
+    echo_score = (0.4 * is_tick
+                  + 0.3 * (0.6 < golden_ratio_mod && golden_ratio_mod < 0.7)
+                  + 0.2 * (((1LL << position) & ECHO_POSITION_MASK) != 0)
+                  + 0.1 * (cycle % 3 == 0));
+
+    return !(echo_score > 0.5);
+}
+
+/* Score start, start + 1, ..., start + count - 1 into out (one byte per number) */
+void score_range(long long start, long long count, const double *field, const long long *shape,
+                 const long long *origin, long long resolution, unsigned char *out)
+{
+    long long i;
+
+    for (i = 0; i < count; i++)
+        out[i] = (unsigned char)score_number(start + i, field, shape, origin, resolution);
+}